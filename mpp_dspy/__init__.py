@@ -1,55 +1,74 @@
-from .metrics import AllPassMetric, LongitudinalMetric, TraceCostMetric
-from .models import DerivativeProtocolSpecification, MPPBundle
-from .mpp_adapter import (
-    BundleResult,
-    ExecutionResult,
-    MPPAdapterPipeline,
-    MPPVerticalRefiner,
-    VerticalResult,
-    VerticalStep,
-)
-from .mpp_optimizer import (
-    LongitudinalResult,
-    LongitudinalScore,
-    LongitudinalStep,
-    LongitudinalTrace,
-    MPPLongitudinalRefiner,
-)
-from .mutations import DefaultLongitudinalMutator
-from .template_tokens import (
-    extract_mutable_blocks,
-    list_mutable_blocks,
-    render_mutable_template,
-)
-from .validations import validate_derivative_spec, validate_mpp_bundle, validate_payload
+from __future__ import annotations
 
-try:
-    from .dspy_adapters import MPPArchitectAdapter, MPPExecutorAdapter, MPPQAAdapter
-    from .mpp_auto_adapter import (
-        FullPipelineResult,
-        MPPAutoAdapter,
-        MPPAutoAdapterOptimizer,
-    )
-    from .mpp_signatures import ProtocolArchitect, ProtocolExecutor, QualityAssurance
-except Exception as exc:
-    _DSPY_IMPORT_ERROR = exc
+from importlib import import_module
+from typing import Any
 
+_EXPORTS = {
+    "AllPassMetric": ".metrics",
+    "LongitudinalMetric": ".metrics",
+    "TraceCostMetric": ".metrics",
+    "DerivativeProtocolSpecification": ".models",
+    "MPPBundle": ".models",
+    "BundleResult": ".mpp_adapter",
+    "ExecutionResult": ".mpp_adapter",
+    "MPPAdapterPipeline": ".mpp_adapter",
+    "MPPVerticalRefiner": ".mpp_adapter",
+    "VerticalResult": ".mpp_adapter",
+    "VerticalStep": ".mpp_adapter",
+    "LongitudinalResult": ".mpp_optimizer",
+    "LongitudinalScore": ".mpp_optimizer",
+    "LongitudinalStep": ".mpp_optimizer",
+    "LongitudinalTrace": ".mpp_optimizer",
+    "MPPLongitudinalRefiner": ".mpp_optimizer",
+    "DefaultLongitudinalMutator": ".mutations",
+    "extract_mutable_blocks": ".template_tokens",
+    "list_mutable_blocks": ".template_tokens",
+    "render_mutable_template": ".template_tokens",
+    "validate_derivative_spec": ".validations",
+    "validate_mpp_bundle": ".validations",
+    "validate_payload": ".validations",
+}
+_DSPY_EXPORTS = {
+    "MPPArchitectAdapter": ".dspy_adapters",
+    "MPPExecutorAdapter": ".dspy_adapters",
+    "MPPQAAdapter": ".dspy_adapters",
+    "FullPipelineResult": ".mpp_auto_adapter",
+    "MPPAutoAdapter": ".mpp_auto_adapter",
+    "MPPAutoAdapterOptimizer": ".mpp_auto_adapter",
+    "ProtocolArchitect": ".mpp_signatures",
+    "ProtocolExecutor": ".mpp_signatures",
+    "QualityAssurance": ".mpp_signatures",
+}
+
+
+def _dspy_missing(error: Exception) -> type:
     class _DSPyMissing:
         def __init__(self, *_args, **_kwargs) -> None:
             raise ImportError(
                 "DSPy is required for "
                 "ProtocolArchitect/ProtocolExecutor/QualityAssurance and MPP adapters."
-            ) from _DSPY_IMPORT_ERROR
+            ) from error
+
+    return _DSPyMissing
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+    elif name in _DSPY_EXPORTS:
+        try:
+            value = getattr(import_module(_DSPY_EXPORTS[name], __name__), name)
+        except Exception as exc:
+            value = _dspy_missing(exc)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-    ProtocolArchitect = _DSPyMissing
-    ProtocolExecutor = _DSPyMissing
-    QualityAssurance = _DSPyMissing
-    MPPArchitectAdapter = _DSPyMissing
-    MPPExecutorAdapter = _DSPyMissing
-    MPPQAAdapter = _DSPyMissing
-    MPPAutoAdapter = _DSPyMissing
-    MPPAutoAdapterOptimizer = _DSPyMissing
-    FullPipelineResult = _DSPyMissing
 
 __all__ = [
     "DerivativeProtocolSpecification",
@@ -1,19 +1,120 @@
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
 import json
 import os
+import random
+import re
+import threading
 import time
 import urllib.error
 import urllib.request
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from dspy.clients.base_lm import BaseLM
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    httpx = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    diskcache = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    orjson = None
+
 LANGDOCK_BASE_URL = "https://api.langdock.com/assistant/v1"
 MAX_ASSISTANT_INSTRUCTIONS = 16384
 RETRYABLE_STATUS_CODES = {408, 409, 429}
+_SYSTEM_ROLES = frozenset({"system", "developer"})
+_NORMAL_ROLES = frozenset({"user", "assistant", "tool"})
+_PLAIN_ROLES = frozenset({"user", "assistant"})
+MAX_RETRY_DELAY = 30.0
+PREWARM_TIMEOUT = 2.0
+MAX_CONCURRENCY = int(os.environ.get("LANGDOCK_MAX_CONCURRENCY", "8"))
+REQUESTS_PER_MINUTE = int(os.environ.get("LANGDOCK_RPM", "200"))
+CACHE_EXPIRE = 7 * 86400
+DEFAULT_CACHE_DIR = ".cache/langdock"
+CONNECT_TIMEOUT = 5.0
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+if httpx is not None:
+    CLIENT_LIMITS = httpx.Limits(
+        max_keepalive_connections=20, max_connections=100, keepalive_expiry=30
+    )
+    CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=CONNECT_TIMEOUT)
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+
+_CLIENT: httpx.Client | None = None
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_CLIENT_LOCK = threading.Lock()
+_OPENER = urllib.request.build_opener()
+_WARMED = False
+_ASYNC_WARMED: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+_CACHE: diskcache.Cache | None = None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:  # pragma: no cover - exercised in minimal envs
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    _loads = json.loads
+
+
+class _RateLimiter:
+    def __init__(self, max_rate: int, time_period: float = 60.0) -> None:
+        self._capacity = float(max_rate)
+        self._rate = max_rate / time_period
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            tokens = self._tokens
+        return 0.0 if tokens >= 0 else -tokens / self._rate
+
+
+_CONCURRENCY_LIMITER = threading.Semaphore(MAX_CONCURRENCY)
+_RATE_LIMITER = _RateLimiter(REQUESTS_PER_MINUTE)
 
 
 class LangdockAPIError(RuntimeError):
@@ -26,6 +127,7 @@ class LangdockForbiddenError(LangdockAPIError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def _langdock_api_key() -> str:
     api_key = os.environ.get("LANGDOCK_API_KEY", "").strip()
     if not api_key:
@@ -39,22 +141,40 @@ def _langdock_api_key() -> str:
 def _load_dotenv(path: Path) -> None:
     if not path.exists():
         return
+    values = _read_dotenv(path.resolve())
+    os.environ.update(
+        {key: value for key, value in values.items() if key not in os.environ}
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_dotenv(path: Path) -> dict[str, str]:
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        text = path.read_text(encoding="utf-8")
     except OSError:
-        return
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or "=" not in stripped:
-            continue
-        key, value = stripped.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if not key or key in os.environ:
-            continue
+        return {}
+    values: dict[str, str] = {}
+    for match in _ENV_LINE_RE.finditer(text):
+        key, value = match.groups()
         if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
             value = value[1:-1]
-        os.environ[key] = value
+        values.setdefault(key, value)
+    return values
+
+
+def _new_client() -> httpx.Client:
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE, timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS
+    )
+
+
+def _client() -> httpx.Client:
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = _new_client()
+    return _CLIENT
 
 
 def _post(
@@ -64,54 +184,333 @@ def _post(
     retries: int = 3,
     base_delay: float = 1.0,
     timeout: float = 60.0,
+    max_delay: float = MAX_RETRY_DELAY,
+    pooled: bool = True,
 ) -> dict[str, Any]:
+    return _make_poster(path, retries, base_delay, timeout, max_delay, pooled)(payload)
+
+
+@functools.lru_cache(maxsize=32)
+def _make_poster(
+    path: str,
+    retries: int,
+    base_delay: float,
+    timeout: float,
+    max_delay: float,
+    pooled: bool,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
     url = f"{LANGDOCK_BASE_URL}{path}"
-    data = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(url, data=data, method="POST")
-    request.add_header("Authorization", f"Bearer {_langdock_api_key()}")
-    request.add_header("Content-Type", "application/json")
+    settings = {"retries": retries, "base_delay": base_delay, "max_delay": max_delay}
+    if httpx is None:
+
+        def post(payload: dict[str, Any]) -> dict[str, Any]:
+            _RATE_LIMITER.acquire()
+            with _CONCURRENCY_LIMITER:
+                return _post_with_opener(url, payload, timeout=timeout, **settings)
+
+        return post
+
+    request_timeout = _request_timeout(timeout)
+
+    def post(payload: dict[str, Any]) -> dict[str, Any]:
+        _RATE_LIMITER.acquire()
+        with _CONCURRENCY_LIMITER:
+            if pooled:
+                return _post_with_client(
+                    _client(), url, payload, request_timeout=request_timeout, **settings
+                )
+            with _new_client() as client:
+                return _post_with_client(
+                    client, url, payload, request_timeout=request_timeout, **settings
+                )
+
+    return post
+
+
+def _post_with_client(
+    client: httpx.Client,
+    url: str,
+    payload: dict[str, Any],
+    *,
+    request_timeout: httpx.Timeout,
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+) -> dict[str, Any]:
+    data = _dumps(payload)
+    headers = _request_headers()
 
     for attempt in range(retries + 1):
         try:
-            with urllib.request.urlopen(request, timeout=timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
+            response = client.post(
+                url, content=data, headers=headers, timeout=request_timeout
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.HTTPStatusError as exc:
+            time.sleep(
+                _status_retry_delay(
+                    exc.response.status_code,
+                    exc.response.text,
+                    exc.response.headers.get("Retry-After"),
+                    attempt,
+                    retries,
+                    base_delay,
+                    max_delay,
+                )
+            )
+        except httpx.TransportError as exc:
+            time.sleep(
+                _network_retry_delay(exc, attempt, retries, base_delay, max_delay)
+            )
+
+    raise LangdockAPIError(f"No request attempts made (retries={retries}).")
+
+
+def _post_with_opener(
+    url: str,
+    payload: dict[str, Any],
+    *,
+    timeout: float,
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+) -> dict[str, Any]:
+    request = urllib.request.Request(
+        url,
+        data=_dumps(payload),
+        headers=_request_headers(),
+        method="POST",
+    )
+
+    for attempt in range(retries + 1):
+        try:
+            with _OPENER.open(request, timeout=timeout) as response:
+                return _loads(response.read())
         except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            if exc.code == 403:
-                raise LangdockForbiddenError(
-                    f"HTTP {exc.code}: {detail}", status_code=exc.code
-                ) from exc
-            retry_after = exc.headers.get("Retry-After") if exc.headers else None
-            if attempt < retries and (
-                exc.code in RETRYABLE_STATUS_CODES or exc.code >= 500
-            ):
-                delay = base_delay * (2**attempt)
-                if retry_after:
-                    try:
-                        delay = max(delay, float(retry_after))
-                    except ValueError:
-                        pass
-                time.sleep(delay)
-                continue
-            raise RuntimeError(f"HTTP {exc.code}: {detail}") from exc
-        except urllib.error.URLError as exc:
-            if attempt < retries:
-                time.sleep(base_delay * (2**attempt))
-                continue
-            raise RuntimeError(f"Network error: {exc}") from exc
+            time.sleep(
+                _status_retry_delay(
+                    exc.code,
+                    exc.read().decode("utf-8", errors="replace"),
+                    exc.headers.get("Retry-After"),
+                    attempt,
+                    retries,
+                    base_delay,
+                    max_delay,
+                )
+            )
+        except OSError as exc:
+            time.sleep(
+                _network_retry_delay(exc, attempt, retries, base_delay, max_delay)
+            )
 
+    raise LangdockAPIError(f"No request attempts made (retries={retries}).")
 
-def create_chat_completion(
+
+def _prewarm_client() -> None:
+    global _WARMED
+    if _WARMED or httpx is None:
+        return
+    _WARMED = True
+    threading.Thread(target=_warm, args=(_client(),), daemon=True).start()
+
+
+def _warm(client: httpx.Client) -> None:
+    try:
+        client.head(LANGDOCK_BASE_URL, timeout=PREWARM_TIMEOUT)
+    except Exception:  # pragma: no cover - warming is best effort
+        pass
+
+
+async def _aprewarm_client() -> None:
+    if httpx is None:
+        return
+    loop = asyncio.get_running_loop()
+    if loop in _ASYNC_WARMED:
+        return
+    _ASYNC_WARMED.add(loop)
+    task = asyncio.create_task(_awarm(await _async_client()))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def _awarm(client: httpx.AsyncClient) -> None:
+    try:
+        await client.head(LANGDOCK_BASE_URL, timeout=PREWARM_TIMEOUT)
+    except Exception:  # pragma: no cover - warming is best effort
+        pass
+
+
+def _new_async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE, timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS
+    )
+
+
+async def _async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = _new_async_client()
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's async client; call on shutdown to release the pool."""
+    loop = asyncio.get_running_loop()
+    _ASYNC_WARMED.discard(loop)
+    client = _ASYNC_CLIENTS.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _apost(
+    path: str,
+    payload: dict[str, Any],
+    *,
+    retries: int = 3,
+    base_delay: float = 1.0,
+    timeout: float = 60.0,
+    max_delay: float = MAX_RETRY_DELAY,
+) -> dict[str, Any]:
+    await _RATE_LIMITER.aacquire()
+    url = f"{LANGDOCK_BASE_URL}{path}"
+    if httpx is None:
+        return await asyncio.to_thread(
+            _post_with_opener,
+            url,
+            payload,
+            timeout=timeout,
+            retries=retries,
+            base_delay=base_delay,
+            max_delay=max_delay,
+        )
+    client = await _async_client()
+    data = _dumps(payload)
+    headers = _request_headers()
+    request_timeout = _request_timeout(timeout)
+
+    for attempt in range(retries + 1):
+        try:
+            response = await client.post(
+                url, content=data, headers=headers, timeout=request_timeout
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.HTTPStatusError as exc:
+            await asyncio.sleep(
+                _status_retry_delay(
+                    exc.response.status_code,
+                    exc.response.text,
+                    exc.response.headers.get("Retry-After"),
+                    attempt,
+                    retries,
+                    base_delay,
+                    max_delay,
+                )
+            )
+        except httpx.TransportError as exc:
+            await asyncio.sleep(
+                _network_retry_delay(exc, attempt, retries, base_delay, max_delay)
+            )
+
+    raise LangdockAPIError(f"No request attempts made (retries={retries}).")
+
+
+@functools.lru_cache(maxsize=1)
+def _request_headers() -> dict[str, str]:
+    return {
+        "Authorization": f"Bearer {_langdock_api_key()}",
+        "Content-Type": "application/json",
+    }
+
+
+def _request_timeout(timeout: float) -> httpx.Timeout:
+    return httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+
+
+def _backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    return min(max_delay, random.uniform(0, base_delay * (2**attempt)))
+
+
+def _status_retry_delay(
+    status_code: int,
+    detail: str,
+    retry_after: str | None,
+    attempt: int,
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+) -> float:
+    if status_code == 403:
+        raise LangdockForbiddenError(
+            f"HTTP {status_code}: {detail}", status_code=status_code
+        )
+    if attempt < retries and (
+        status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    ):
+        delay = _backoff_delay(attempt, base_delay, max_delay)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+    raise RuntimeError(f"HTTP {status_code}: {detail}")
+
+
+def _network_retry_delay(
+    exc: Exception,
+    attempt: int,
+    retries: int,
+    base_delay: float,
+    max_delay: float,
+) -> float:
+    if attempt < retries:
+        return _backoff_delay(attempt, base_delay, max_delay)
+    raise RuntimeError(f"Network error: {exc}") from exc
+
+
+def _result_cache() -> diskcache.Cache | None:
+    global _CACHE
+    if diskcache is None:
+        return None
+    if _CACHE is None:
+        _CACHE = diskcache.Cache(
+            os.environ.get("LANGDOCK_CACHE_DIR", DEFAULT_CACHE_DIR)
+        )
+    return _CACHE
+
+
+def _cache_key(payload: dict[str, Any]) -> str:
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cache_lookup(
+    payload: dict[str, Any], temperature: float | None, use_cache: bool
+) -> tuple[diskcache.Cache | None, str | None, dict[str, Any] | None]:
+    if not use_cache or temperature != 0:
+        return None, None, None
+    cache = _result_cache()
+    if cache is None:
+        return None, None, None
+    key = _cache_key(payload)
+    return cache, key, cache.get(key)
+
+
+def _chat_payload(
     messages: list[dict[str, Any]],
     *,
     model: str,
     assistant_name: str,
     assistant_instructions: str,
-    temperature: float | None = None,
-    timeout: float | None = None,
-    retries: int | None = None,
-    base_delay: float | None = None,
-    fallback_models: list[str] | None = None,
+    temperature: float | None,
 ) -> dict[str, Any]:
     payload = {
         "assistant": {
@@ -123,26 +522,246 @@ def create_chat_completion(
     }
     if temperature is not None:
         payload["assistant"]["temperature"] = temperature
-    models_to_try = _unique_models(model, fallback_models)
+    return payload
+
+
+def create_chat_completion(
+    messages: list[dict[str, Any]],
+    *,
+    model: str,
+    assistant_name: str,
+    assistant_instructions: str,
+    temperature: float | None = None,
+    timeout: float | None = None,
+    retries: int | None = None,
+    base_delay: float | None = None,
+    max_delay: float | None = None,
+    fallback_models: list[str] | None = None,
+    models_to_try: list[str] | None = None,
+    pooled: bool = True,
+    use_cache: bool = False,
+    race_fallbacks: bool = False,
+) -> dict[str, Any]:
+    payload = _chat_payload(
+        messages,
+        model=model,
+        assistant_name=assistant_name,
+        assistant_instructions=assistant_instructions,
+        temperature=temperature,
+    )
+    cache, key, hit = _cache_lookup(payload, temperature, use_cache)
+    if hit is not None:
+        return hit
+    if models_to_try is None:
+        models_to_try = _unique_models(model, fallback_models)
+    send = _race_models if race_fallbacks else _try_models
+    result = send(
+        models_to_try,
+        payload,
+        retries=retries if retries is not None else 3,
+        base_delay=base_delay if base_delay is not None else 1.0,
+        timeout=timeout if timeout is not None else 60.0,
+        max_delay=max_delay if max_delay is not None else MAX_RETRY_DELAY,
+        pooled=pooled,
+    )
+    if cache is not None:
+        cache.set(key, result, expire=CACHE_EXPIRE)
+    return result
+
+
+def _try_models(
+    models_to_try: list[str],
+    payload: dict[str, Any],
+    *,
+    retries: int,
+    base_delay: float,
+    timeout: float,
+    max_delay: float,
+    pooled: bool,
+) -> dict[str, Any]:
+    post = _make_poster(
+        "/chat/completions", retries, base_delay, timeout, max_delay, pooled
+    )
+    last_error: LangdockForbiddenError | None = None
+    for candidate in models_to_try:
+        payload["assistant"]["model"] = candidate
+        try:
+            return post(payload)
+        except LangdockForbiddenError as exc:
+            last_error = exc
+    if last_error is not None:
+        raise last_error
+    raise LangdockAPIError("No models configured for request.")
+
+
+def _race_models(
+    models_to_try: list[str],
+    payload: dict[str, Any],
+    *,
+    retries: int,
+    base_delay: float,
+    timeout: float,
+    max_delay: float,
+    pooled: bool,
+) -> dict[str, Any]:
+    if len(models_to_try) < 2:
+        return _try_models(
+            models_to_try,
+            payload,
+            retries=retries,
+            base_delay=base_delay,
+            timeout=timeout,
+            max_delay=max_delay,
+            pooled=pooled,
+        )
+    if pooled and httpx is not None:
+        _client()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(models_to_try))
+    post = _make_poster(
+        "/chat/completions", retries, base_delay, timeout, max_delay, pooled
+    )
+    pending = {
+        executor.submit(post, _with_model(payload, candidate))
+        for candidate in models_to_try
+    }
+    last_error: LangdockForbiddenError | None = None
+    try:
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                try:
+                    return future.result()
+                except LangdockForbiddenError as exc:
+                    last_error = exc
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    raise last_error
+
+
+def _with_model(payload: dict[str, Any], model: str) -> dict[str, Any]:
+    return {**payload, "assistant": {**payload["assistant"], "model": model}}
+
+
+async def create_chat_completion_async(
+    messages: list[dict[str, Any]],
+    *,
+    model: str,
+    assistant_name: str,
+    assistant_instructions: str,
+    temperature: float | None = None,
+    timeout: float | None = None,
+    retries: int | None = None,
+    base_delay: float | None = None,
+    max_delay: float | None = None,
+    fallback_models: list[str] | None = None,
+    models_to_try: list[str] | None = None,
+    use_cache: bool = False,
+    race_fallbacks: bool = False,
+) -> dict[str, Any]:
+    payload = _chat_payload(
+        messages,
+        model=model,
+        assistant_name=assistant_name,
+        assistant_instructions=assistant_instructions,
+        temperature=temperature,
+    )
+    cache, key, hit = _cache_lookup(payload, temperature, use_cache)
+    if hit is not None:
+        return hit
+    if models_to_try is None:
+        models_to_try = _unique_models(model, fallback_models)
+    send = _arace_models if race_fallbacks else _atry_models
+    result = await send(
+        models_to_try,
+        payload,
+        retries=retries if retries is not None else 3,
+        base_delay=base_delay if base_delay is not None else 1.0,
+        timeout=timeout if timeout is not None else 60.0,
+        max_delay=max_delay if max_delay is not None else MAX_RETRY_DELAY,
+    )
+    if cache is not None:
+        cache.set(key, result, expire=CACHE_EXPIRE)
+    return result
+
+
+async def _atry_models(
+    models_to_try: list[str],
+    payload: dict[str, Any],
+    *,
+    retries: int,
+    base_delay: float,
+    timeout: float,
+    max_delay: float,
+) -> dict[str, Any]:
     last_error: LangdockForbiddenError | None = None
     for candidate in models_to_try:
         payload["assistant"]["model"] = candidate
         try:
-            return _post(
+            return await _apost(
                 "/chat/completions",
                 payload,
-                retries=retries if retries is not None else 3,
-                base_delay=base_delay if base_delay is not None else 1.0,
-                timeout=timeout if timeout is not None else 60.0,
+                retries=retries,
+                base_delay=base_delay,
+                timeout=timeout,
+                max_delay=max_delay,
             )
         except LangdockForbiddenError as exc:
             last_error = exc
-            continue
     if last_error is not None:
         raise last_error
     raise LangdockAPIError("No models configured for request.")
 
 
+async def _arace_models(
+    models_to_try: list[str],
+    payload: dict[str, Any],
+    *,
+    retries: int,
+    base_delay: float,
+    timeout: float,
+    max_delay: float,
+) -> dict[str, Any]:
+    if len(models_to_try) < 2:
+        return await _atry_models(
+            models_to_try,
+            payload,
+            retries=retries,
+            base_delay=base_delay,
+            timeout=timeout,
+            max_delay=max_delay,
+        )
+    pending = {
+        asyncio.create_task(
+            _apost(
+                "/chat/completions",
+                _with_model(payload, candidate),
+                retries=retries,
+                base_delay=base_delay,
+                timeout=timeout,
+                max_delay=max_delay,
+            )
+        )
+        for candidate in models_to_try
+    }
+    last_error: LangdockForbiddenError | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    return task.result()
+                except LangdockForbiddenError as exc:
+                    last_error = exc
+    finally:
+        for task in pending:
+            task.cancel()
+    raise last_error
+
+
 @dataclass
 class _LangdockMessage:
     content: str
@@ -172,7 +791,12 @@ class LangdockLM(BaseLM):
         timeout: float | None = None,
         retries: int | None = None,
         base_delay: float | None = None,
+        max_delay: float | None = None,
         fallback_models: list[str] | None = None,
+        enable_pooling: bool = True,
+        use_cache: bool = False,
+        race_fallbacks: bool = False,
+        prewarm: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(model=model, model_type="chat", **kwargs)
@@ -181,7 +805,13 @@ class LangdockLM(BaseLM):
         self.request_timeout = timeout
         self.request_retries = retries
         self.request_base_delay = base_delay
+        self.request_max_delay = max_delay
         self.fallback_models = [str(item) for item in (fallback_models or []) if item]
+        self.enable_pooling = enable_pooling
+        self.use_cache = use_cache
+        self.race_fallbacks = race_fallbacks
+        self.prewarm = prewarm
+        self._model_candidates = _unique_models(model, self.fallback_models)
 
     def forward(
         self,
@@ -189,28 +819,46 @@ class LangdockLM(BaseLM):
         messages: list[dict[str, Any]] | None = None,
         **kwargs: Any,
     ) -> _LangdockResponse:
+        if self.prewarm and self.enable_pooling:
+            _prewarm_client()
+        response = create_chat_completion(
+            **self._request_kwargs(prompt, messages, kwargs),
+            pooled=self.enable_pooling,
+        )
+        return self._build_response(response)
+
+    def _request_kwargs(
+        self,
+        prompt: str | None,
+        messages: list[dict[str, Any]] | None,
+        kwargs: dict[str, Any],
+    ) -> dict[str, Any]:
         instructions = self.assistant_instructions
         if messages is None:
             prompt_text = prompt or ""
             messages = [{"role": "user", "content": prompt_text}]
-        else:
+        elif _needs_normalization(messages):
             messages, instructions = _normalize_messages(messages, instructions)
 
-        temperature = kwargs.get("temperature", getattr(self, "temperature", None))
-        timeout = kwargs.get("timeout", self.request_timeout)
-        retries = kwargs.get("retries", self.request_retries)
-        base_delay = kwargs.get("base_delay", self.request_base_delay)
-        response = create_chat_completion(
-            messages,
-            model=self.model,
-            assistant_name=self.assistant_name,
-            assistant_instructions=instructions,
-            temperature=temperature,
-            timeout=timeout,
-            retries=retries,
-            base_delay=base_delay,
-            fallback_models=self.fallback_models,
-        )
+        return {
+            "messages": messages,
+            "model": self.model,
+            "assistant_name": self.assistant_name,
+            "assistant_instructions": instructions,
+            "temperature": kwargs.get(
+                "temperature", getattr(self, "temperature", None)
+            ),
+            "timeout": kwargs.get("timeout", self.request_timeout),
+            "retries": kwargs.get("retries", self.request_retries),
+            "base_delay": kwargs.get("base_delay", self.request_base_delay),
+            "max_delay": kwargs.get("max_delay", self.request_max_delay),
+            "fallback_models": self.fallback_models,
+            "models_to_try": self._model_candidates,
+            "use_cache": kwargs.get("use_cache", self.use_cache),
+            "race_fallbacks": self.race_fallbacks,
+        }
+
+    def _build_response(self, response: Any) -> _LangdockResponse:
         content = _assistant_text(response)
         usage = response.get("usage", {}) if isinstance(response, dict) else {}
         if not isinstance(usage, dict):
@@ -223,8 +871,9 @@ class LangdockLM(BaseLM):
             if isinstance(response, dict)
             else self.model
         )
-        if isinstance(model, str) and model:
+        if isinstance(model, str) and model and model != self.model:
             self.model = model
+            self._model_candidates = _unique_models(model, self.fallback_models)
         return _LangdockResponse(
             choices=[_LangdockChoice(message=_LangdockMessage(content=content))],
             model=model,
@@ -232,7 +881,53 @@ class LangdockLM(BaseLM):
         )
 
 
+class AsyncLangdockLM(LangdockLM):
+    """LangdockLM with a non-blocking aforward over a shared httpx.AsyncClient.
+
+    Each event loop gets its own pooled client and concurrency limit, so the LM
+    can be reused across asyncio.run calls. Concurrent aforward calls on a loop
+    are capped by max_concurrency. With prewarm, the first aforward on a loop
+    opens a background connection to seed the pool. Await aclose_async_client()
+    before the loop shuts down to release pooled connections.
+    """
+
+    def __init__(self, *, max_concurrency: int = 8, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.max_concurrency = max_concurrency
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def aforward(
+        self,
+        prompt: str | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> _LangdockResponse:
+        if self.prewarm:
+            await _aprewarm_client()
+        async with self._semaphore():
+            response = await create_chat_completion_async(
+                **self._request_kwargs(prompt, messages, kwargs)
+            )
+        return self._build_response(response)
+
+
 def _assistant_text(response: Any) -> str:
+    try:
+        return _message_content_to_text(response["choices"][0]["message"]["content"])
+    except (KeyError, TypeError, IndexError):
+        return _assistant_text_slow(response)
+
+
+def _assistant_text_slow(response: Any) -> str:
     if isinstance(response, dict):
         if "choices" in response:
             choices = response.get("choices")
@@ -249,22 +944,32 @@ def _assistant_text(response: Any) -> str:
                     if message is not None and hasattr(message, "content"):
                         return _message_content_to_text(message.content)
         if "data" in response:
-            return _assistant_text(response.get("data"))
+            return _assistant_text_slow(response.get("data"))
         if "result" in response:
-            return _assistant_text(response.get("result"))
+            return _assistant_text_slow(response.get("result"))
         message = response.get("message")
         if isinstance(message, dict) and "content" in message:
             return _message_content_to_text(message["content"])
         if "content" in response:
             return _message_content_to_text(response["content"])
     if isinstance(response, list) and response:
-        return _assistant_text(response[0])
+        return _assistant_text_slow(response[0])
     raise ValueError(
         "Unexpected Langdock response shape; keys="
         f"{list(response.keys()) if isinstance(response, dict) else type(response)}"
     )
 
 
+def _needs_normalization(messages: list[dict[str, Any]]) -> bool:
+    return any(
+        not isinstance(message, dict)
+        or len(message) != 2
+        or message.get("role") not in _PLAIN_ROLES
+        or not isinstance(message.get("content"), str)
+        for message in messages
+    )
+
+
 def _normalize_messages(
     messages: list[dict[str, Any]],
     assistant_instructions: str,
@@ -275,10 +980,14 @@ def _normalize_messages(
     for message in messages:
         if not isinstance(message, dict):
             continue
-        role = str(message.get("role", "")).strip()
+        role = message.get("role")
+        if role not in _NORMAL_ROLES:
+            role = str(role or "").strip()
         content = message.get("content")
-        if role in {"system", "developer"} or role not in {"user", "assistant", "tool"}:
-            system_parts.append(_message_content_to_text(content))
+        if role in _SYSTEM_ROLES or role not in _NORMAL_ROLES:
+            text = _message_content_to_text(content)
+            if text:
+                system_parts.append(text)
             continue
         if role == "tool":
             if isinstance(content, list):
@@ -293,28 +1002,27 @@ def _normalize_messages(
                 {"role": role, "content": _message_content_to_text(content)}
             )
 
-    if system_parts:
-        system_text = "\n".join(part for part in system_parts if part)
-        if system_text:
-            merged = (
-                f"{assistant_instructions}\n\n{system_text}"
-                if assistant_instructions
-                else system_text
+    system_text = "\n".join(system_parts)
+    if system_text:
+        separator = "\n\n" if assistant_instructions else ""
+        budget = MAX_ASSISTANT_INSTRUCTIONS - len(assistant_instructions)
+        budget -= len(separator)
+        if budget > 0:
+            assistant_instructions = "".join(
+                (assistant_instructions, separator, system_text[:budget])
+            )
+            overflow = system_text[budget:]
+        else:
+            assistant_instructions = assistant_instructions[:MAX_ASSISTANT_INSTRUCTIONS]
+            overflow = system_text
+        if overflow:
+            normalized.insert(
+                0,
+                {
+                    "role": "user",
+                    "content": "".join(("System context:\n", overflow)),
+                },
             )
-            if len(merged) <= MAX_ASSISTANT_INSTRUCTIONS:
-                assistant_instructions = merged
-            else:
-                if len(assistant_instructions) > MAX_ASSISTANT_INSTRUCTIONS:
-                    assistant_instructions = assistant_instructions[
-                        :MAX_ASSISTANT_INSTRUCTIONS
-                    ]
-                normalized.insert(
-                    0,
-                    {
-                        "role": "user",
-                        "content": f"System context:\n{system_text}",
-                    },
-                )
 
     return normalized, assistant_instructions
 
@@ -339,15 +1047,14 @@ def _message_content_to_text(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
+        if len(content) == 1:
+            item = content[0]
+            if isinstance(item, dict) and "text" in item:
+                return str(item["text"])
         parts = []
         for item in content:
-            if isinstance(item, dict):
-                if item.get("type") == "text" and "text" in item:
-                    parts.append(str(item["text"]))
-                elif "text" in item:
-                    parts.append(str(item["text"]))
-                else:
-                    parts.append(json.dumps(item, ensure_ascii=True))
+            if isinstance(item, dict) and "text" in item:
+                parts.append(str(item["text"]))
             else:
                 parts.append(str(item))
         return "\n".join(part for part in parts if part)
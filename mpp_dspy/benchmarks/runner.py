@@ -1,26 +1,43 @@
 from __future__ import annotations
 
 import argparse
-import ast
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import math
 import random
 import re
 import sys
+import threading
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from fractions import Fraction
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping
 
 import dspy
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    orjson = None
+
 from mpp_dspy import DefaultLongitudinalMutator, MPPAutoAdapter, MPPAutoAdapterOptimizer
 from mpp_dspy.metrics import AllPassMetric
 from mpp_dspy.template_tokens import extract_mutable_blocks
 
-from .langdock import LangdockLM, create_chat_completion
+from .langdock import (
+    LangdockLM,
+    aclose_async_client,
+    create_chat_completion,
+    create_chat_completion_async,
+)
 
 DEFAULT_TEMPLATE = """\
 [ENTRY_PROMPT]
@@ -42,17 +59,31 @@ Execute the bundle precisely and follow the payload order.
 {{/MPP_MUTABLE}}
 """
 
-DATASET_NAMES = {"math", "gsm8k", "game24"}
-METHOD_NAMES = {
-    "raw",
-    "zero_shot",
-    "few_shot",
-    "cot",
-    "react",
-    "self_consistency",
-    "mpp",
-    "mpp_optimized",
-}
+DATASET_NAMES = frozenset({"math", "gsm8k", "game24"})
+METHOD_NAMES = frozenset(
+    {
+        "raw",
+        "zero_shot",
+        "few_shot",
+        "cot",
+        "react",
+        "self_consistency",
+        "mpp",
+        "mpp_optimized",
+    }
+)
+
+_INT_RE = re.compile(r"-?\d+")
+_DECIMAL_RE = re.compile(r"-?\d+\.?\d*")
+_DIGITS_RE = re.compile(r"\d+")
+_BOXED_RE = re.compile(r"\\boxed\{([^}]*)\}")
+_ANSWER_RE = re.compile(r"Answer\s*[:=]\s*(.+)", re.IGNORECASE)
+_GSM8K_RE = re.compile(r"####\s*(-?[\d,]+\.?\d*)")
+_GAME24_EXPR_RE = re.compile(r"[0-9+*/().-]+")
+_GAME24_TOKEN_RE = re.compile(r"\d+(?:\.\d+)?|[()+\-*/]")
+_JSON_ANSWER_KEYS = ("final", "answer", "result", "output", "decoded_bundle")
+_ADDITIVE_OPS = frozenset("+-")
+_MULTIPLICATIVE_OPS = frozenset("*/")
 
 FORMAT_HINTS = {
     "math": "Return the final answer in \\boxed{...}.",
@@ -97,23 +128,23 @@ FEW_SHOT = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkCase:
     case_id: str
     dataset: str
     question: str
     answer: str
-    meta: dict[str, Any]
+    meta: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatasetConfig:
     name: str
     path: Path
     limit: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelGroup:
     name: str
     baseline_model: str
@@ -139,7 +170,13 @@ def run_benchmarks(
     optimizer_config = _load_optimizer_config(config)
     optimizer_template = _load_optimizer_template(config)
     sc_samples = int(config.get("self_consistency_samples", 5))
+    sc_concurrency = config.get("self_consistency_concurrency")
+    sc_concurrency = int(sc_concurrency) if sc_concurrency else None
+    concurrency = int(config.get("concurrency", 1))
+    score_processes = int(config.get("score_processes", 0))
     record_samples = bool(config.get("record_samples", True))
+    samples_dir = config.get("samples_dir")
+    template_cache = bool(config.get("template_cache", False))
     mpp_blocks = _load_blocks_config(config, "mpp_blocks", "mpp_template")
     optimized_blocks = _load_blocks_config(
         config, "mpp_optimized_blocks", "mpp_optimized_template"
@@ -170,7 +207,11 @@ def run_benchmarks(
                 group.qa_model,
             )
             runner = _ModelRunner(
-                group, temperatures, langdock_settings, model_fallbacks
+                group,
+                temperatures,
+                langdock_settings,
+                model_fallbacks,
+                template_cache=template_cache,
             )
             mpp_runner = _MPPRunner(
                 group, mpp_blocks, optimized_blocks, langdock_settings, model_fallbacks
@@ -203,23 +244,38 @@ def run_benchmarks(
                     method,
                     len(cases),
                 )
-                result = _run_method(
-                    method,
-                    cases,
-                    runner,
-                    mpp_runner,
-                    sc_samples,
-                    record_samples,
-                    dataset_name=dataset_config.name,
-                    group_name=group.name,
-                    log_every=log_every,
-                    logger=logger,
-                    continue_on_error=continue_on_error,
-                    max_errors=max_errors,
-                    optimized_blocks=(
-                        optimized_blocks_override if method == "mpp_optimized" else None
-                    ),
+                samples_path = (
+                    Path(samples_dir)
+                    / f"{dataset_config.name}__{group.name}__{method}.jsonl"
+                    if samples_dir and record_samples
+                    else None
                 )
+                with _open_samples_sink(samples_path) as samples_sink:
+                    result = _run_method(
+                        method,
+                        cases,
+                        runner,
+                        mpp_runner,
+                        sc_samples,
+                        record_samples,
+                        concurrency=concurrency,
+                        sc_concurrency=sc_concurrency,
+                        score_processes=score_processes,
+                        dataset_name=dataset_config.name,
+                        group_name=group.name,
+                        log_every=log_every,
+                        logger=logger,
+                        continue_on_error=continue_on_error,
+                        max_errors=max_errors,
+                        optimized_blocks=(
+                            optimized_blocks_override
+                            if method == "mpp_optimized"
+                            else None
+                        ),
+                        samples_sink=samples_sink,
+                    )
+                if samples_path is not None:
+                    result["samples_path"] = str(samples_path)
                 _log_info(
                     logger,
                     (
@@ -321,18 +377,21 @@ def _normalize_methods(config: Mapping[str, Any]) -> list[str]:
 
 def _load_langdock_settings(config: Mapping[str, Any]) -> dict[str, Any]:
     settings = dict(config.get("langdock", {}))
-    for key in ("timeout", "retries", "base_delay"):
+    for key in ("timeout", "retries", "base_delay", "max_delay", "use_cache"):
         if key in config and key not in settings:
             settings[key] = config[key]
 
     timeout = settings.get("timeout")
     retries = settings.get("retries")
     base_delay = settings.get("base_delay")
+    max_delay = settings.get("max_delay")
 
     return {
         "timeout": float(timeout) if timeout is not None else None,
         "retries": int(retries) if retries is not None else None,
         "base_delay": float(base_delay) if base_delay is not None else None,
+        "max_delay": float(max_delay) if max_delay is not None else None,
+        "use_cache": bool(settings.get("use_cache", False)),
     }
 
 
@@ -394,7 +453,8 @@ def _load_optimizer_config(config: Mapping[str, Any]) -> dict[str, Any]:
 def _load_optimizer_template(config: Mapping[str, Any]) -> str:
     template_path = config.get("optimizer_template") or config.get("mpp_template")
     if template_path:
-        return Path(template_path).read_text(encoding="utf-8")
+        path = Path(template_path)
+        return _read_text_cached(str(path), path.stat().st_mtime_ns)
     return DEFAULT_TEMPLATE
 
 
@@ -487,11 +547,14 @@ def _apply_methods_config(
     skip_methods: list[str] | None,
 ) -> dict[str, Any]:
     updated = dict(config)
-    methods = _normalize_methods(updated)
     if methods_override:
         methods = _parse_methods_arg(methods_override)
+    else:
+        methods = _normalize_methods(updated)
     if skip_methods:
-        skip_set = {method.strip() for method in skip_methods if method.strip()}
+        skip_set = frozenset(
+            method.strip() for method in skip_methods if method.strip()
+        )
         methods = [method for method in methods if method not in skip_set]
     if not methods:
         raise ValueError("No methods configured after overrides.")
@@ -518,10 +581,10 @@ def _apply_model_groups_config(
         raise ValueError("model_groups must be a list.")
 
     if groups_override:
-        selected = set(_parse_model_groups_arg(groups_override))
+        selected = frozenset(_parse_model_groups_arg(groups_override))
         groups = [group for group in groups if group.get("name") in selected]
     if skip_groups:
-        skip_set = {group.strip() for group in skip_groups if group.strip()}
+        skip_set = frozenset(group.strip() for group in skip_groups if group.strip())
         groups = [group for group in groups if group.get("name") not in skip_set]
 
     if not groups:
@@ -545,38 +608,55 @@ def _load_blocks_config(
 
 
 def _read_template_blocks(path: Path) -> dict[str, str]:
-    template = path.read_text(encoding="utf-8")
-    return extract_mutable_blocks(template)
+    return dict(_read_template_blocks_cached(str(path), path.stat().st_mtime_ns))
 
 
 def _read_blocks(path: Path) -> dict[str, str]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    return dict(_read_blocks_cached(str(path), path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _read_template_blocks_cached(
+    path: str, mtime_ns: int
+) -> tuple[tuple[str, str], ...]:
+    template = _read_text_cached(path, mtime_ns)
+    return tuple(extract_mutable_blocks(template).items())
+
+
+@functools.lru_cache(maxsize=32)
+def _read_blocks_cached(path: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    payload = _loads(Path(path).read_bytes())
     if not isinstance(payload, dict):
         raise ValueError(f"Blocks file must be a JSON object: {path}")
-    return {str(k): str(v) for k, v in payload.items()}
+    return tuple((str(k), str(v)) for k, v in payload.items())
 
 
 def _load_cases(dataset_config: DatasetConfig) -> list[BenchmarkCase]:
-    records = _read_records(dataset_config.path)
-    cases = []
-    for idx, record in enumerate(records):
-        cases.append(_build_case(dataset_config.name, record, idx))
-    if dataset_config.limit:
-        cases = cases[: dataset_config.limit]
-    return cases
+    records = _read_records(dataset_config.path, limit=dataset_config.limit or None)
+    return [
+        _build_case(dataset_config.name, record, idx)
+        for idx, record in enumerate(records)
+    ]
 
 
-def _read_records(path: Path) -> list[dict[str, Any]]:
+def _read_records(path: Path, limit: int | None = None) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(path)
-    text = path.read_text(encoding="utf-8").strip()
-    if not text:
-        return []
     if path.suffix == ".jsonl":
-        return [json.loads(line) for line in text.splitlines() if line.strip()]
-    payload = json.loads(text)
+        with path.open("rb") as handle:
+            records = (_loads(line) for line in handle if line.strip())
+            return list(itertools.islice(records, limit))
+    data = path.read_bytes()
+    if not data.strip():
+        return []
+    payload = _loads(data)
     if isinstance(payload, list):
-        return payload
+        return payload[:limit]
     raise ValueError(f"Unsupported dataset format: {path}")
 
 
@@ -592,7 +672,6 @@ def _build_case(dataset: str, record: Mapping[str, Any], index: int) -> Benchmar
                 dataset=dataset,
                 question=str(question).strip(),
                 answer=str(answer),
-                meta={},
             )
         case "gsm8k":
             question = record.get("question")
@@ -604,7 +683,6 @@ def _build_case(dataset: str, record: Mapping[str, Any], index: int) -> Benchmar
                 dataset=dataset,
                 question=str(question).strip(),
                 answer=str(answer),
-                meta={},
             )
         case "game24":
             numbers = record.get("numbers")
@@ -629,7 +707,7 @@ def _build_case(dataset: str, record: Mapping[str, Any], index: int) -> Benchmar
 def _parse_numbers(text: Any) -> list[int]:
     if not isinstance(text, str):
         return []
-    return [int(value) for value in re.findall(r"-?\d+", text)]
+    return list(map(int, _INT_RE.findall(text)))
 
 
 class _ModelRunner:
@@ -639,6 +717,8 @@ class _ModelRunner:
         temperatures: Mapping[str, Any],
         langdock_settings: Mapping[str, Any] | None = None,
         model_fallbacks: Mapping[str, list[str]] | None = None,
+        *,
+        template_cache: bool = False,
     ) -> None:
         self.group = group
         self.temperatures = temperatures
@@ -646,28 +726,75 @@ class _ModelRunner:
         self.request_timeout = settings.get("timeout")
         self.request_retries = settings.get("retries")
         self.request_base_delay = settings.get("base_delay")
+        self.request_max_delay = settings.get("max_delay")
+        self.use_cache = settings.get("use_cache", False)
         self.model_fallbacks = dict(model_fallbacks or {})
         self.active_model = group.baseline_model
+        self._responses: dict[bytes, str] = {}
+        self.templates: dict[tuple[str, str, str], str] | None = (
+            {} if template_cache else None
+        )
 
     def generate(self, prompt: str, method: str) -> str:
-        temperature = self._temperature_for(method)
-        fallbacks = self.model_fallbacks.get(self.group.baseline_model, [])
+        key, cached, kwargs = self._prepare(prompt, method)
+        if cached is not None:
+            return cached
         response = create_chat_completion(
-            [{"role": "user", "content": prompt}],
-            model=self.active_model,
-            assistant_name="mpp-benchmark",
-            assistant_instructions="You are a helpful assistant.",
-            temperature=temperature,
-            timeout=self.request_timeout,
-            retries=self.request_retries,
-            base_delay=self.request_base_delay,
-            fallback_models=fallbacks,
+            [{"role": "user", "content": prompt}], **kwargs
+        )
+        return self._finish(key, response)
+
+    async def agenerate(self, prompt: str, method: str) -> str:
+        key, cached, kwargs = self._prepare(prompt, method)
+        if cached is not None:
+            return cached
+        response = await create_chat_completion_async(
+            [{"role": "user", "content": prompt}], **kwargs
+        )
+        return self._finish(key, response)
+
+    def is_deterministic(self, method: str) -> bool:
+        return self._temperature_for(method) == 0
+
+    def _prepare(
+        self, prompt: str, method: str
+    ) -> tuple[bytes | None, str | None, dict[str, Any]]:
+        temperature = self._temperature_for(method)
+        cacheable = self.is_deterministic(method)
+        key = None
+        if cacheable:
+            key = _response_key(self.active_model, temperature, prompt)
+            cached = self._responses.get(key)
+            if cached is not None:
+                return key, cached, {}
+        return (
+            key,
+            None,
+            {
+                "model": self.active_model,
+                "assistant_name": "mpp-benchmark",
+                "assistant_instructions": "You are a helpful assistant.",
+                "temperature": temperature,
+                "timeout": self.request_timeout,
+                "retries": self.request_retries,
+                "base_delay": self.request_base_delay,
+                "max_delay": self.request_max_delay,
+                "fallback_models": self.model_fallbacks.get(
+                    self.group.baseline_model, []
+                ),
+                "use_cache": bool(self.use_cache and cacheable),
+            },
         )
+
+    def _finish(self, key: bytes | None, response: Any) -> str:
         if isinstance(response, dict):
             resolved = response.get("model")
             if isinstance(resolved, str) and resolved:
                 self.active_model = resolved
-        return _normalize_text(_assistant_text(response))
+        text = _normalize_text(_assistant_text(response))
+        if key is not None:
+            self._responses[key] = text
+        return text
 
     def _temperature_for(self, method: str) -> float | None:
         raw = self.temperatures.get(method)
@@ -677,6 +804,14 @@ class _ModelRunner:
         return float(default) if default is not None else None
 
 
+def _response_key(model: str, temperature: float | None, prompt: str) -> bytes:
+    digest = hashlib.blake2b(
+        f"{model}\0{temperature}\0".encode("utf-8"), digest_size=16
+    )
+    digest.update(prompt.encode("utf-8"))
+    return digest.digest()
+
+
 class _MPPRunner:
     def __init__(
         self,
@@ -689,7 +824,14 @@ class _MPPRunner:
         self.group = group
         self.blocks = dict(blocks or {})
         self.optimized_blocks = dict(optimized_blocks or {})
-        settings = langdock_settings or {}
+        self._prefixes = {
+            False: _blocks_prefix(self.blocks),
+            True: _blocks_prefix(self.optimized_blocks),
+        }
+        self._override_prefix: tuple[dict[str, str], str] | None = None
+        self._adapter_cache: dict[bytes, MPPAutoAdapter] = {}
+        self._adapter_lock = threading.Lock()
+        settings = {**(langdock_settings or {}), "use_cache": False}
         fallbacks = dict(model_fallbacks or {})
         self.architect_lm = LangdockLM(
             model=group.architect_model,
@@ -716,34 +858,58 @@ class _MPPRunner:
     ) -> str:
         if blocks_override is not None:
             blocks = dict(blocks_override)
+            prefix = self._prefix_for_override(blocks)
         else:
             blocks = self.optimized_blocks if optimized else self.blocks
-        goal = _apply_prompt_blocks(blocks, case.question)
-        adapter = MPPAutoAdapter(
-            architect_lm=self.architect_lm,
-            executor_lm=self.executor_lm,
-            qa_lm=self.qa_lm,
-            architect_role_instructions=blocks.get("architect_primer"),
-            executor_role_instructions=blocks.get("executor_primer"),
-            qa_role_instructions=blocks.get("qa_primer"),
-        )
+            prefix = self._prefixes[optimized]
+        goal = f"{prefix}User goal:\n{case.question}"
+        adapter = self._adapter_for(blocks)
         result = adapter(user_goal=goal, open_world=False)
         decoded_bundle = result.decoded_bundle
         if not isinstance(decoded_bundle, str):
-            decoded_bundle = json.dumps(decoded_bundle, ensure_ascii=True)
+            decoded_bundle = _dumps_text(decoded_bundle)
         return _normalize_text(decoded_bundle)
 
+    def _adapter_for(self, blocks: Mapping[str, str]) -> MPPAutoAdapter:
+        key = hashlib.blake2b(_block_signature(blocks), digest_size=16).digest()
+        adapter = self._adapter_cache.get(key)
+        if adapter is None:
+            with self._adapter_lock:
+                adapter = self._adapter_cache.get(key)
+                if adapter is None:
+                    adapter = self._adapter_cache[key] = MPPAutoAdapter(
+                        architect_lm=self.architect_lm,
+                        executor_lm=self.executor_lm,
+                        qa_lm=self.qa_lm,
+                        architect_role_instructions=blocks.get("architect_primer"),
+                        executor_role_instructions=blocks.get("executor_primer"),
+                        qa_role_instructions=blocks.get("qa_primer"),
+                    )
+        return adapter
 
-def _apply_prompt_blocks(blocks: Mapping[str, str], goal: str) -> str:
-    entry_prompt = (blocks.get("entry_prompt") or "").strip()
-    strategy_payload = (blocks.get("strategy_payload") or "").strip()
+    def _prefix_for_override(self, blocks: dict[str, str]) -> str:
+        cached = self._override_prefix
+        if cached is None or cached[0] != blocks:
+            cached = self._override_prefix = (blocks, _blocks_prefix(blocks))
+        return cached[1]
+
+
+def _blocks_prefix(blocks: Mapping[str, str]) -> str:
+    entry_prompt = _canonical_text(blocks.get("entry_prompt") or "")
+    strategy_payload = _canonical_text(blocks.get("strategy_payload") or "")
     parts = []
     if entry_prompt:
         parts.append(entry_prompt)
     if strategy_payload:
         parts.append(f"Strategy guidance:\n{strategy_payload}")
-    parts.append(f"User goal:\n{goal}")
-    return "\n\n".join(parts)
+    return "".join(f"{part}\n\n" for part in parts)
+
+
+def _canonical_text(text: str) -> str:
+    return "\n".join(line.rstrip() for line in text.strip().splitlines())
+
+
+_CaseOutcome = tuple[str | None, bool, Exception | None]
 
 
 def _run_method(
@@ -754,6 +920,9 @@ def _run_method(
     sc_samples: int,
     record_samples: bool,
     *,
+    concurrency: int = 1,
+    sc_concurrency: int | None = None,
+    score_processes: int = 0,
     dataset_name: str,
     group_name: str,
     log_every: int | None,
@@ -761,65 +930,96 @@ def _run_method(
     continue_on_error: bool,
     max_errors: int | None,
     optimized_blocks: Mapping[str, str] | None,
+    samples_sink: BinaryIO | None = None,
 ) -> dict[str, Any]:
     correct = 0
     total = 0
     samples: list[dict[str, Any]] = []
+    record = (
+        samples.append
+        if samples_sink is None
+        else lambda sample: samples_sink.write(_dumps_line(sample))
+    )
     errors: list[dict[str, Any]] = []
     aborted = False
     total_cases = len(cases)
-    for idx, case in enumerate(cases, start=1):
-        prediction = None
-        error_message = None
-        try:
-            if method in {"mpp", "mpp_optimized"}:
-                prediction = mpp_runner.run(
-                    case,
-                    optimized=method == "mpp_optimized",
-                    blocks_override=(
-                        optimized_blocks if method == "mpp_optimized" else None
-                    ),
-                )
-            else:
-                prediction = _run_prompt_method(
-                    method, case, runner, sc_samples=sc_samples
-                )
-            is_correct = _score_case(case, prediction)
-        except Exception as exc:
+    outcomes: dict[int, _CaseOutcome] = {}
+    failures = 0
+
+    def on_outcome(index: int, outcome: _CaseOutcome) -> bool:
+        nonlocal aborted, failures
+        failure = outcome[2]
+        if failure is not None:
             if not continue_on_error:
-                raise
-            error_message = f"{type(exc).__name__}: {exc}"
+                raise failure
+            failures += 1
             _log_error(
                 logger,
                 "Error dataset=%s group=%s method=%s case=%s error=%s",
                 dataset_name,
                 group_name,
                 method,
-                case.case_id,
-                error_message,
+                cases[index].case_id,
+                f"{type(failure).__name__}: {failure}",
+            )
+        outcomes[index] = outcome
+        done = len(outcomes)
+        if log_every and (done % log_every == 0 or done == total_cases):
+            _log_info(
+                logger,
+                "Progress dataset=%s group=%s method=%s %d/%d (%.1f%%)",
+                dataset_name,
+                group_name,
+                method,
+                done,
+                total_cases,
+                (done / total_cases) * 100 if total_cases else 100.0,
             )
+        if max_errors is not None and failures >= max_errors:
+            aborted = True
+            _log_info(
+                logger,
+                "Abort dataset=%s group=%s method=%s errors=%d",
+                dataset_name,
+                group_name,
+                method,
+                failures,
+            )
+            return False
+        return True
+
+    failure_limit = max_errors if continue_on_error else 1
+    score_pool = (
+        concurrent.futures.ProcessPoolExecutor(max_workers=score_processes)
+        if score_processes > 0
+        else None
+    )
+    try:
+        _run_coroutine(
+            _evaluate_cases(
+                method,
+                cases,
+                runner,
+                mpp_runner,
+                on_outcome=on_outcome,
+                failure_limit=failure_limit,
+                sc_samples=sc_samples,
+                sc_concurrency=sc_concurrency,
+                concurrency=concurrency,
+                optimized_blocks=optimized_blocks,
+                score_pool=score_pool,
+            )
+        )
+    finally:
+        if score_pool is not None:
+            score_pool.shutdown()
+    for index in sorted(outcomes):
+        case = cases[index]
+        prediction, is_correct, failure = outcomes[index]
+        error_message = None
+        if failure is not None:
+            error_message = f"{type(failure).__name__}: {failure}"
             errors.append({"case_id": case.case_id, "error": error_message})
-            is_correct = False
-            if max_errors is not None and len(errors) >= max_errors:
-                aborted = True
-                _log_info(
-                    logger,
-                    "Abort dataset=%s group=%s method=%s errors=%d",
-                    dataset_name,
-                    group_name,
-                    method,
-                    len(errors),
-                )
-                total += 1
-                if record_samples:
-                    sample = {
-                        "case_id": case.case_id,
-                        "prediction": prediction,
-                        "correct": is_correct,
-                        "error": error_message,
-                    }
-                    samples.append(sample)
-                break
         total += 1
         if is_correct:
             correct += 1
@@ -831,21 +1031,10 @@ def _run_method(
             }
             if error_message:
                 sample["error"] = error_message
-            samples.append(sample)
-        if log_every and (idx % log_every == 0 or idx == total_cases):
-            _log_info(
-                logger,
-                ("Progress dataset=%s group=%s method=%s" " %d/%d (%.1f%%)"),
-                dataset_name,
-                group_name,
-                method,
-                idx,
-                total_cases,
-                (idx / total_cases) * 100 if total_cases else 100.0,
-            )
+            record(sample)
     accuracy = correct / total if total else 0.0
     result = {"total": total, "correct": correct, "accuracy": accuracy}
-    if record_samples:
+    if record_samples and samples_sink is None:
         result["samples"] = samples
     if errors:
         result["error_count"] = len(errors)
@@ -855,106 +1044,265 @@ def _run_method(
     return result
 
 
-def _run_prompt_method(
+def _run_coroutine(coroutine: Any) -> Any:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+async def _evaluate_cases(
+    method: str,
+    cases: list[BenchmarkCase],
+    runner: _ModelRunner,
+    mpp_runner: _MPPRunner,
+    *,
+    on_outcome: Callable[[int, _CaseOutcome], bool],
+    failure_limit: int | None = None,
+    sc_samples: int,
+    sc_concurrency: int | None = None,
+    concurrency: int,
+    optimized_blocks: Mapping[str, str] | None,
+    score_pool: concurrent.futures.Executor | None = None,
+) -> None:
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
+    failures = 0
+
+    async def evaluate(
+        index: int, case: BenchmarkCase
+    ) -> tuple[int, _CaseOutcome | None]:
+        nonlocal failures
+        prediction = None
+        async with semaphore:
+            if failure_limit is not None and failures >= failure_limit:
+                return index, None
+            try:
+                if method in {"mpp", "mpp_optimized"}:
+                    prediction = await asyncio.to_thread(
+                        mpp_runner.run,
+                        case,
+                        optimized=method == "mpp_optimized",
+                        blocks_override=(
+                            optimized_blocks if method == "mpp_optimized" else None
+                        ),
+                    )
+                else:
+                    prediction = await _run_prompt_method(
+                        method,
+                        case,
+                        runner,
+                        sc_samples=sc_samples,
+                        sc_concurrency=sc_concurrency,
+                    )
+            except Exception as exc:
+                failures += 1
+                return index, (None, False, exc)
+        try:
+            if score_pool is None:
+                is_correct = _score_case(case, prediction)
+            else:
+                is_correct = await loop.run_in_executor(
+                    score_pool, _score_case, case, prediction
+                )
+        except Exception as exc:
+            failures += 1
+            return index, (prediction, False, exc)
+        return index, (prediction, is_correct, None)
+
+    tasks = [
+        asyncio.ensure_future(evaluate(index, case)) for index, case in enumerate(cases)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, outcome = await next_done
+            if outcome is not None and not on_outcome(index, outcome):
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await aclose_async_client()
+
+
+async def _run_prompt_method(
     method: str,
     case: BenchmarkCase,
     runner: _ModelRunner,
     *,
     sc_samples: int,
+    sc_concurrency: int | None = None,
+) -> str:
+    if runner.templates is None:
+        return await _dispatch_prompt_method(
+            method, case, runner, sc_samples=sc_samples, sc_concurrency=sc_concurrency
+        )
+    key = (
+        case.dataset,
+        method,
+        " ".join(case.question.lower().split()),
+    )
+    cached = runner.templates.get(key)
+    if cached is not None:
+        return cached
+    prediction = await _dispatch_prompt_method(
+        method, case, runner, sc_samples=sc_samples, sc_concurrency=sc_concurrency
+    )
+    runner.templates[key] = prediction
+    return prediction
+
+
+async def _dispatch_prompt_method(
+    method: str,
+    case: BenchmarkCase,
+    runner: _ModelRunner,
+    *,
+    sc_samples: int,
+    sc_concurrency: int | None,
 ) -> str:
     match method:
         case "raw":
-            return runner.generate(case.question, method)
+            return await runner.agenerate(case.question, method)
         case "zero_shot":
             prompt = _build_prompt(case, include_instruction=True)
-            return runner.generate(prompt, method)
+            return await runner.agenerate(prompt, method)
         case "few_shot":
             prompt = _build_few_shot_prompt(case)
-            return runner.generate(prompt, method)
+            return await runner.agenerate(prompt, method)
         case "cot":
             prompt = _build_cot_prompt(case)
-            return runner.generate(prompt, method)
+            return await runner.agenerate(prompt, method)
         case "react":
             prompt = _build_react_prompt(case)
-            return runner.generate(prompt, method)
+            return await runner.agenerate(prompt, method)
         case "self_consistency":
-            return _run_self_consistency(case, runner, sc_samples)
+            return await _run_self_consistency(
+                case, runner, sc_samples, concurrency=sc_concurrency
+            )
     raise ValueError(f"Unsupported method: {method}")
 
 
 def _build_prompt(case: BenchmarkCase, *, include_instruction: bool) -> str:
-    parts = [case.question]
-    if include_instruction:
-        parts.append(FORMAT_HINTS.get(case.dataset, ""))
-    return "\n\n".join(part for part in parts if part)
+    if not include_instruction:
+        return case.question
+    return f"{_hint_prefix(case.dataset)}{case.question}"
 
 
 def _build_few_shot_prompt(case: BenchmarkCase) -> str:
-    examples = FEW_SHOT.get(case.dataset, [])
-    parts = []
-    for example in examples:
-        parts.append(f"Q: {example['question']}")
-        parts.append(f"A: {example['answer']}")
-    parts.append(f"Q: {case.question}")
-    parts.append("A:")
-    parts.append(FORMAT_HINTS.get(case.dataset, ""))
-    return "\n\n".join(part for part in parts if part)
+    return f"{_few_shot_prefix(case.dataset)}Q: {case.question}\n\nA:"
 
 
 def _build_cot_prompt(case: BenchmarkCase) -> str:
-    return "\n\n".join(
-        [
-            case.question,
-            "Let's think step by step.",
-            FORMAT_HINTS.get(case.dataset, ""),
-        ]
-    )
+    return f"{_hint_prefix(case.dataset)}{case.question}\n\nLet's think step by step."
 
 
 def _build_react_prompt(case: BenchmarkCase) -> str:
-    return "\n\n".join(
-        [
-            case.question,
-            "Use the format: Thought, Action, Observation, Answer.",
-            FORMAT_HINTS.get(case.dataset, ""),
-        ]
+    return (
+        f"{_hint_prefix(case.dataset)}{case.question}\n\n"
+        "Use the format: Thought, Action, Observation, Answer."
     )
 
 
-def _run_self_consistency(
+@functools.lru_cache(maxsize=None)
+def _few_shot_prefix(dataset: str) -> str:
+    parts = []
+    for example in FEW_SHOT.get(dataset, []):
+        parts.append(f"Q: {example['question']}")
+        parts.append(f"A: {example['answer']}")
+    parts.append(FORMAT_HINTS.get(dataset, ""))
+    return "".join(f"{part}\n\n" for part in parts if part)
+
+
+@functools.lru_cache(maxsize=None)
+def _hint_prefix(dataset: str) -> str:
+    hint = FORMAT_HINTS.get(dataset, "")
+    return f"{hint}\n\n" if hint else ""
+
+
+async def _run_self_consistency(
     case: BenchmarkCase,
     runner: _ModelRunner,
     samples: int,
+    *,
+    concurrency: int | None = None,
 ) -> str:
     prompt = _build_cot_prompt(case)
-    outputs = [runner.generate(prompt, "self_consistency") for _ in range(samples)]
-    normalized = [_extract_answer(case, text) for text in outputs]
-    counts = Counter(item for item in normalized if item is not None)
+    if runner.is_deterministic("self_consistency"):
+        samples = 1
+    outputs: list[str] = []
+    counts: Counter[str] = Counter()
+    first_output: dict[str, str] = {}
+    while len(outputs) < samples:
+        remaining = samples - len(outputs)
+        margin = _majority_margin(counts)
+        if margin > remaining:
+            break
+        wave = min(remaining, (remaining - margin) // 2 + 1, concurrency or remaining)
+        batch = await asyncio.gather(
+            *(runner.agenerate(prompt, "self_consistency") for _ in range(wave))
+        )
+        for text in batch:
+            outputs.append(text)
+            answer = _extract_answer(case, text)
+            if answer is None:
+                continue
+            counts[answer] += 1
+            first_output.setdefault(answer, text)
     if not counts:
         return outputs[0]
-    best = counts.most_common(1)[0][0]
-    idx = normalized.index(best)
-    return outputs[idx]
+    best, _ = counts.most_common(1)[0]
+    return first_output[best]
+
+
+def _majority_margin(counts: Counter[str]) -> int:
+    ranked = counts.most_common(2)
+    if not ranked:
+        return 0
+    return ranked[0][1] - (ranked[1][1] if len(ranked) > 1 else 0)
 
 
 def _score_case(case: BenchmarkCase, prediction: str) -> bool:
-    predicted = _extract_answer(case, prediction)
-    if predicted is None:
+    scorer = _SCORERS.get(case.dataset)
+    if scorer is None:
         return False
-    match case.dataset:
+    predicted = _extract_answer(case, prediction)
+    return predicted is not None and scorer(case, predicted)
+
+
+def _score_math(case: BenchmarkCase, predicted: str) -> bool:
+    gold = _gold_answer(case.dataset, case.answer)
+    return gold is not None and gold == _normalize_math(predicted)
+
+
+def _score_gsm8k(case: BenchmarkCase, predicted: str) -> bool:
+    return _numeric_equal(predicted, _gold_answer(case.dataset, case.answer))
+
+
+def _score_game24(case: BenchmarkCase, predicted: str) -> bool:
+    meta = case.meta or {}
+    numbers = meta.get("numbers", [])
+    target = meta.get("target", 24)
+    return _valid_game24(predicted, numbers, target)
+
+
+_SCORERS: dict[str, Callable[[BenchmarkCase, str], bool]] = {
+    "math": _score_math,
+    "gsm8k": _score_gsm8k,
+    "game24": _score_game24,
+}
+
+
+@functools.lru_cache(maxsize=16384)
+def _gold_answer(dataset: str, answer: str) -> str | None:
+    match dataset:
         case "math":
-            gold = _extract_math_answer(case.answer)
-            return gold is not None and _normalize_math(gold) == _normalize_math(
-                predicted
-            )
+            gold = _extract_math_answer(answer)
+            return None if gold is None else _normalize_math(gold)
         case "gsm8k":
-            gold = _extract_gsm8k_answer(case.answer)
-            return _numeric_equal(predicted, gold)
-        case "game24":
-            numbers = case.meta.get("numbers", [])
-            target = case.meta.get("target", 24)
-            return _valid_game24(predicted, numbers, target)
-    return False
+            return _extract_gsm8k_answer(answer)
+    return None
 
 
 def _extract_answer(case: BenchmarkCase, text: str) -> str | None:
@@ -962,46 +1310,44 @@ def _extract_answer(case: BenchmarkCase, text: str) -> str | None:
     json_value = _extract_json_value(text)
     if json_value is not None:
         return json_value
-    match case.dataset:
-        case "math":
-            return _extract_math_answer(text)
-        case "gsm8k":
-            return _extract_gsm8k_answer(text)
-        case "game24":
-            return _extract_game24_expression(text)
-    return None
+    extractor = _EXTRACTORS.get(case.dataset)
+    return extractor(text) if extractor is not None else None
 
 
 def _extract_json_value(text: str) -> str | None:
+    stripped = text.lstrip()
+    if not stripped.startswith("{"):
+        return None
     try:
-        parsed = json.loads(text)
+        parsed = _loads(stripped)
     except json.JSONDecodeError:
         return None
     if isinstance(parsed, dict):
-        for key in ("final", "answer", "result", "output", "decoded_bundle"):
-            if key in parsed:
-                return str(parsed[key])
+        for key in _JSON_ANSWER_KEYS:
+            value = parsed.get(key)
+            if value is not None:
+                return str(value)
     return None
 
 
 def _extract_math_answer(text: str) -> str | None:
-    boxed = re.findall(r"\\boxed\{([^}]*)\}", text)
+    boxed = _BOXED_RE.findall(text)
     if boxed:
         return boxed[-1].strip()
-    match = re.search(r"Answer\s*[:=]\s*(.+)", text, flags=re.IGNORECASE)
+    match = _ANSWER_RE.search(text)
     if match:
         return match.group(1).strip()
-    tokens = re.findall(r"-?\d+\.?\d*", text)
+    tokens = _DECIMAL_RE.findall(text)
     if tokens:
         return tokens[-1]
     return None
 
 
 def _extract_gsm8k_answer(text: str) -> str | None:
-    match = re.search(r"####\s*(-?[\d,]+\.?\d*)", text)
+    match = _GSM8K_RE.search(text)
     if match:
         return match.group(1)
-    tokens = re.findall(r"-?\d+\.?\d*", text)
+    tokens = _DECIMAL_RE.findall(text)
     if tokens:
         return tokens[-1]
     return None
@@ -1014,10 +1360,15 @@ def _extract_game24_expression(text: str) -> str | None:
     return lines[-1]
 
 
+_EXTRACTORS: dict[str, Callable[[str], str | None]] = {
+    "math": _extract_math_answer,
+    "gsm8k": _extract_gsm8k_answer,
+    "game24": _extract_game24_expression,
+}
+
+
 def _normalize_math(text: str) -> str:
-    cleaned = text.replace("\n", " ").strip()
-    cleaned = re.sub(r"\\s+", "", cleaned)
-    return cleaned.strip("$")
+    return "".join(text.split()).strip("$")
 
 
 def _numeric_equal(predicted: str | None, gold: str | None) -> bool:
@@ -1034,59 +1385,84 @@ def _numeric_equal(predicted: str | None, gold: str | None) -> bool:
 def _valid_game24(expression: str, numbers: Iterable[int], target: int) -> bool:
     if not expression:
         return False
-    expr = expression.replace(" ", "")
-    if not re.fullmatch(r"[0-9+*/().-]+", expr):
+    return _valid_game24_cached(
+        expression.replace(" ", ""), tuple(sorted(numbers)), target
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _valid_game24_cached(expr: str, numbers: tuple[int, ...], target: int) -> bool:
+    if not _GAME24_EXPR_RE.fullmatch(expr):
         return False
-    expected = Counter(str(n) for n in numbers)
-    used = Counter(re.findall(r"\d+", expr))
-    if used != expected:
+    used = sorted(_DIGITS_RE.findall(expr))
+    if used != sorted(map(str, numbers)):
         return False
     result = _safe_eval(expr)
     if result is None:
         return False
-    return math.isclose(result, float(target), rel_tol=1e-6, abs_tol=1e-6)
+    return result == Fraction(str(target))
 
 
-def _safe_eval(expr: str) -> float | None:
-    try:
-        tree = ast.parse(expr, mode="eval")
-    except SyntaxError:
+@functools.lru_cache(maxsize=4096)
+def _safe_eval(expr: str) -> Fraction | None:
+    tokens = _GAME24_TOKEN_RE.findall(expr)
+    if "".join(tokens) != expr.replace(" ", ""):
         return None
-    for node in ast.walk(tree):
-        if not isinstance(
-            node,
-            (
-                ast.Expression,
-                ast.BinOp,
-                ast.UnaryOp,
-                ast.Add,
-                ast.Sub,
-                ast.Mult,
-                ast.Div,
-                ast.Pow,
-                ast.USub,
-                ast.UAdd,
-                ast.Load,
-                ast.Constant,
-                ast.Mod,
-                ast.FloorDiv,
-            ),
-        ):
-            return None
     try:
-        return float(eval(compile(tree, "<expr>", "eval"), {"__builtins__": {}}))
-    except Exception:
+        value, pos = _parse_sum(tokens, 0)
+    except (IndexError, ValueError, ZeroDivisionError, RecursionError):
         return None
+    return value if pos == len(tokens) else None
+
+
+def _parse_sum(tokens: list[str], pos: int) -> tuple[Fraction, int]:
+    value, pos = _parse_product(tokens, pos)
+    while pos < len(tokens) and tokens[pos] in _ADDITIVE_OPS:
+        op = tokens[pos]
+        rhs, pos = _parse_product(tokens, pos + 1)
+        value = value + rhs if op == "+" else value - rhs
+    return value, pos
+
+
+def _parse_product(tokens: list[str], pos: int) -> tuple[Fraction, int]:
+    value, pos = _parse_unary(tokens, pos)
+    while pos < len(tokens) and tokens[pos] in _MULTIPLICATIVE_OPS:
+        op = tokens[pos]
+        rhs, pos = _parse_unary(tokens, pos + 1)
+        value = value * rhs if op == "*" else value / rhs
+    return value, pos
+
+
+def _parse_unary(tokens: list[str], pos: int) -> tuple[Fraction, int]:
+    token = tokens[pos]
+    if token in _ADDITIVE_OPS:
+        value, pos = _parse_unary(tokens, pos + 1)
+        return (-value if token == "-" else value), pos
+    if token == "(":
+        value, pos = _parse_sum(tokens, pos + 1)
+        if tokens[pos] != ")":
+            raise ValueError("Unbalanced parentheses.")
+        return value, pos + 1
+    return Fraction(token), pos + 1
 
 
 def _normalize_text(text: str) -> str:
     stripped = text.strip()
     if stripped.startswith("```") and stripped.endswith("```"):
-        stripped = "\n".join(stripped.splitlines()[1:-1]).strip()
+        first = stripped.find("\n")
+        last = stripped.rfind("\n")
+        return stripped[first + 1 : last].strip() if first < last else ""
     return stripped
 
 
 def _assistant_text(response: Any) -> str:
+    try:
+        return str(response["choices"][0]["message"]["content"])
+    except (KeyError, TypeError, IndexError):
+        return _assistant_text_slow(response)
+
+
+def _assistant_text_slow(response: Any) -> str:
     if isinstance(response, dict):
         if "choices" in response:
             choices = response.get("choices")
@@ -1119,7 +1495,7 @@ def _assistant_text(response: Any) -> str:
 def _parse_config(path: Path) -> dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(path)
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = _loads(path.read_bytes())
     if not isinstance(payload, dict):
         raise ValueError("Config must be a JSON object.")
     return payload
@@ -1127,7 +1503,51 @@ def _parse_config(path: Path) -> dict[str, Any]:
 
 def _write_report(report: dict[str, Any], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(report, indent=2, ensure_ascii=True), encoding="utf-8")
+    path.write_bytes(_dumps_report(report))
+
+
+def _loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_report(report: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dumps_text(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _block_signature(blocks: Mapping[str, str]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(blocks, option=orjson.OPT_SORT_KEYS)
+    return repr(sorted(blocks.items())).encode("utf-8")
+
+
+def _dumps_line(record: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+@contextlib.contextmanager
+def _open_samples_sink(path: Path | None) -> Iterator[BinaryIO | None]:
+    if path is None:
+        yield None
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as handle:
+        yield handle
 
 
 def _configure_logger(
@@ -1157,15 +1577,13 @@ def _configure_logger(
 
 
 def _log_info(logger: logging.Logger | None, message: str, *args: Any) -> None:
-    if logger is None:
-        return
-    logger.info(message, *args)
+    if logger is not None and logger.isEnabledFor(logging.INFO):
+        logger.info(message, *args)
 
 
 def _log_error(logger: logging.Logger | None, message: str, *args: Any) -> None:
-    if logger is None:
-        return
-    logger.error(message, *args)
+    if logger is not None and logger.isEnabledFor(logging.ERROR):
+        logger.error(message, *args)
 
 
 def _apply_smoke_config(config: Mapping[str, Any]) -> dict[str, Any]:
@@ -1188,6 +1606,14 @@ def _apply_smoke_config(config: Mapping[str, Any]) -> dict[str, Any]:
     return updated
 
 
+def _apply_no_cache_config(config: Mapping[str, Any]) -> dict[str, Any]:
+    updated = dict(config)
+    updated["use_cache"] = False
+    if isinstance(config.get("langdock"), dict):
+        updated["langdock"] = {**config["langdock"], "use_cache": False}
+    return updated
+
+
 def _apply_seed(seed: int | None) -> None:
     if seed is None:
         return
@@ -1242,6 +1668,16 @@ def main(argv: list[str] | None = None) -> None:
         default=[],
         help="Model group name to skip (repeatable).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the persistent Langdock response cache.",
+    )
+    parser.add_argument(
+        "--enable-response-cache",
+        action="store_true",
+        help="Reuse predictions for repeated questions within a dataset and method.",
+    )
     parser.add_argument(
         "--smoke",
         action="store_true",
@@ -1252,6 +1688,10 @@ def main(argv: list[str] | None = None) -> None:
     config = _parse_config(Path(args.config))
     if args.smoke:
         config = _apply_smoke_config(config)
+    if args.no_cache:
+        config = _apply_no_cache_config(config)
+    if args.enable_response_cache:
+        config = {**config, "template_cache": True}
     if args.methods or args.skip_method:
         config = _apply_methods_config(
             config,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -51,6 +52,7 @@ _QA_PRIMER = (
 )
 
 
+@lru_cache(maxsize=None)
 def _default_spec_path() -> Path:
     return (
         Path(__file__).resolve().parents[1] / "docs" / "meta_prompting_protocol_spec.md"
@@ -61,12 +63,22 @@ def _load_spec_text(spec_text: str | None, spec_path: str | Path | None) -> str:
     if spec_text is not None:
         return spec_text.strip()
     path = Path(spec_path) if spec_path else _default_spec_path()
+    return _read_spec_file(path)
+
+
+def _read_spec_file(path: Path) -> str:
     try:
-        return path.read_text(encoding="utf-8").strip()
+        resolved = path.resolve()
+        return _read_spec_file_cached(str(resolved), resolved.stat().st_mtime_ns)
     except OSError:
         return ""
 
 
+@lru_cache(maxsize=8)
+def _read_spec_file_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
 class MPPBaseAdapter(JSONAdapter):
     """Base adapter that injects the MPP specification and role instructions."""
 
@@ -82,18 +94,30 @@ class MPPBaseAdapter(JSONAdapter):
         self.spec_text = _load_spec_text(spec_text, spec_path)
         self.base_role_instructions = (base_role_instructions or "").strip()
         self.role_instructions = (role_instructions or "").strip()
+        self._task_descriptions: dict[tuple[Any, ...], str] = {}
 
     def format_task_description(self, signature: type[Signature]) -> str:
-        parts = []
-        if self.spec_text:
-            parts.append(f"MPP specification:\n{self.spec_text}")
-        if self.base_role_instructions:
-            parts.append(self.base_role_instructions)
-        if self.role_instructions:
-            parts.append(self.role_instructions)
-        if signature.instructions:
-            parts.append(signature.instructions.strip())
-        return "\n\n".join(parts).strip()
+        key = (
+            signature,
+            signature.instructions,
+            self.spec_text,
+            self.base_role_instructions,
+            self.role_instructions,
+        )
+        description = self._task_descriptions.get(key)
+        if description is None:
+            parts = []
+            if self.spec_text:
+                parts.append(f"MPP specification:\n{self.spec_text}")
+            if self.base_role_instructions:
+                parts.append(self.base_role_instructions)
+            if self.role_instructions:
+                parts.append(self.role_instructions)
+            if signature.instructions:
+                parts.append(signature.instructions.strip())
+            description = "\n\n".join(parts).strip()
+            self._task_descriptions[key] = description
+        return description
 
 
 class MPPArchitectAdapter(MPPBaseAdapter):
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Literal, Mapping, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class FeedbackEvent(BaseModel):
@@ -64,14 +64,16 @@ class FeedbackEvent(BaseModel):
                 "Executor failed to stabilize within the configured iteration cap."
             )
 
-        return FeedbackEvent(
+        return FeedbackEvent.model_construct(
             kind=kind,
             summary=summary,
             qa_verdict=qa_verdict,
             qa_issues=qa_issues,
             qa_repair_examples=qa_repair_examples,
             last_response=decoded_bundle,
-            executor_iterations=iterations if isinstance(iterations, int) else None,
+            executor_iterations=(
+                int(iterations) if isinstance(iterations, int) else None
+            ),
             executor_stable=stable if isinstance(stable, bool) else None,
             executor_refinements=refinements,
         )
@@ -83,14 +85,32 @@ class FeedbackTrace(BaseModel):
     version: str = "1"
     events: list[FeedbackEvent] = Field(default_factory=list)
 
+    _rendered: Optional[tuple[tuple[FeedbackEvent, ...], str]] = PrivateAttr(
+        default=None
+    )
+
     def append(self, event: FeedbackEvent) -> "FeedbackTrace":
-        return FeedbackTrace(version=self.version, events=[*self.events, event])
+        return FeedbackTrace.model_construct(
+            version=self.version, events=[*self.events, event]
+        )
 
     def to_prompt_text(self) -> str:
         """Stable JSON rendering for embedding into refinement prompts."""
-        return json.dumps(
+        events = tuple(self.events)
+        cached = self._rendered
+        if cached is not None and _same_events(cached[0], events):
+            return cached[1]
+        rendered = json.dumps(
             self.model_dump(),
             ensure_ascii=True,
             sort_keys=True,
             separators=(",", ":"),
         )
+        self._rendered = (events, rendered)
+        return rendered
+
+
+def _same_events(
+    cached: tuple[FeedbackEvent, ...], current: tuple[FeedbackEvent, ...]
+) -> bool:
+    return len(cached) == len(current) and all(a is b for a, b in zip(cached, current))
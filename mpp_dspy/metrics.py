@@ -51,19 +51,21 @@ class TraceCostMetric:
     def score(self, traces: Sequence[LongitudinalTrace]) -> float:
         if not traces:
             return 0.0
-        total = 0.0
-        for trace in traces:
-            stable = (
-                trace.bundle_stable is True
-                and trace.executor_stable is True
-                and trace.qa_passed is True
+        final_weight = self.final_weight
+        architect_weight = self.architect_weight
+        executor_weight = self.executor_weight
+        total = sum(
+            final_weight
+            / (
+                final_weight
+                + (
+                    (architect_weight * (trace.bundle_refinements or 0))
+                    + (executor_weight * (trace.executor_refinements or 0))
+                )
             )
-            if not stable:
-                total += 0.0
-                continue
-            refinements = (self.architect_weight * (trace.bundle_refinements or 0)) + (
-                self.executor_weight * (trace.executor_refinements or 0)
-            )
-            case_score = self.final_weight / (self.final_weight + refinements)
-            total += case_score
+            for trace in traces
+            if trace.bundle_stable is True
+            and trace.executor_stable is True
+            and trace.qa_passed is True
+        )
         return total / len(traces)
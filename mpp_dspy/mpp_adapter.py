@@ -1,14 +1,30 @@
 from __future__ import annotations
 
+import contextvars
 import json
-from typing import Any, Callable, Mapping, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
-from .validations import normalize_mpp_bundle, validate_mpp_bundle
+from .validations import (
+    REQUIRED_BUNDLE_FIELDS,
+    normalize_mpp_bundle,
+    validate_mpp_bundle,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    orjson = None
 
 Predictor = Callable[..., Any]
 Bundle = dict[str, Any]
+T = TypeVar("T")
+R = TypeVar("R")
+
+_QA_FIELDS = ("verdict", "issues", "repair_examples")
 
 
 class VerticalStep(BaseModel):
@@ -29,6 +45,10 @@ class BundleResult(BaseModel):
     stable: bool
     steps: Optional[list[VerticalStep]] = None
 
+    @property
+    def refinements(self) -> int:
+        return max(self.iterations - 1, 0)
+
 
 class ExecutionResult(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -41,6 +61,10 @@ class ExecutionResult(BaseModel):
     qa_passed: Optional[bool]
     steps: Optional[list[VerticalStep]] = None
 
+    @property
+    def refinements(self) -> int:
+        return max(self.iterations - 1, 0)
+
 
 class VerticalResult(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -54,9 +78,30 @@ def _get_field(prediction: Any, name: str) -> Any:
         if name not in prediction:
             raise KeyError(f"Prediction missing field: {name}")
         return prediction[name]
-    if hasattr(prediction, name):
+    try:
         return getattr(prediction, name)
-    raise AttributeError(f"Prediction missing attribute: {name}")
+    except AttributeError:
+        raise AttributeError(f"Prediction missing attribute: {name}") from None
+
+
+def _get_fields(prediction: Any, names: Sequence[str]) -> dict[str, Any]:
+    fields: dict[str, Any] = {}
+    if isinstance(prediction, Mapping):
+        for name in names:
+            if name not in prediction:
+                raise KeyError(f"Prediction missing field: {name}")
+            fields[name] = prediction[name]
+        return fields
+    for name in names:
+        try:
+            fields[name] = getattr(prediction, name)
+        except AttributeError:
+            raise AttributeError(f"Prediction missing attribute: {name}") from None
+    return fields
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
 
 
 def _refined_goal(user_goal: str, previous_bundle: Optional[Mapping[str, Any]]) -> str:
@@ -65,7 +110,7 @@ def _refined_goal(user_goal: str, previous_bundle: Optional[Mapping[str, Any]])
         return raw_goal
     return (
         f"{raw_goal}\n\nPrevious bundle:\n"
-        f"{json.dumps(previous_bundle, indent=2, ensure_ascii=True)}\n"
+        f"{_compact_json(previous_bundle)}\n"
         "Refine for stability and correctness. If the previous bundle is valid, "
         "return it verbatim."
     )
@@ -73,6 +118,8 @@ def _refined_goal(user_goal: str, previous_bundle: Optional[Mapping[str, Any]])
 
 def _qa_passed(qa_result: Mapping[str, Any]) -> bool:
     verdict = qa_result.get("verdict")
+    if verdict == "pass":
+        return True
     return isinstance(verdict, str) and verdict.strip().lower() == "pass"
 
 
@@ -99,43 +146,42 @@ def _strip_code_fences(text: str) -> str:
     stripped = text.strip()
     if not stripped.startswith("```"):
         return stripped
-    lines = stripped.splitlines()
-    if lines and lines[0].startswith("```"):
-        lines = lines[1:]
-    if lines and lines[-1].strip() == "```":
-        lines = lines[:-1]
-    return "\n".join(lines).strip()
-
-
-def _drop_reasoning_fields(value: Any) -> Any:
-    if not isinstance(value, Mapping):
-        return value
-    data = dict(value)
-    data.pop("reasoning", None)
-    data.pop("rationale", None)
-    return data
+    first = stripped.find("\n")
+    if first == -1:
+        return ""
+    last = stripped.rfind("\n")
+    if stripped[last + 1 :].strip() == "```":
+        return stripped[first + 1 : last].strip()
+    return stripped[first + 1 :].strip()
 
 
+@lru_cache(maxsize=32)
 def _normalize_response_for_stability(response: str) -> str:
     text = response.strip()
     if not text:
         return text
     stripped = _strip_code_fences(text)
-    for candidate in (stripped, text):
+    for candidate in (stripped,) if stripped == text else (stripped, text):
         try:
             parsed = json.loads(candidate)
         except json.JSONDecodeError:
             continue
-        parsed = _drop_reasoning_fields(parsed)
-        return json.dumps(
-            parsed,
-            sort_keys=True,
-            ensure_ascii=True,
-            separators=(",", ":"),
-        )
+        if isinstance(parsed, dict):
+            parsed.pop("reasoning", None)
+            parsed.pop("rationale", None)
+        return _canonical_json(parsed)
     return " ".join(stripped.split())
 
 
+def _canonical_json(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
 def _response_to_text(response: Any) -> str:
     if isinstance(response, str):
         return response
@@ -144,6 +190,19 @@ def _response_to_text(response: Any) -> str:
     return str(response)
 
 
+def _map_in_threads(
+    function: Callable[[T], R], items: Sequence[T], max_workers: int
+) -> list[R]:
+    if max_workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, function, item)
+            for item in items
+        ]
+        return [future.result() for future in futures]
+
+
 class MPPAdapterPipeline:
     """Two-stage adapter pipeline: architect -> bundle -> executor."""
 
@@ -164,34 +223,30 @@ class MPPAdapterPipeline:
         self.executor_max_iters = executor_max_iters
 
     def build_bundle(
-        self, user_goal: str, max_iters: int | None = None
+        self,
+        user_goal: str,
+        max_iters: int | None = None,
+        collect_steps: bool = True,
     ) -> BundleResult:
         max_iters = self.architect_max_iters if max_iters is None else max_iters
         last_bundle: Optional[Bundle] = None
-        steps: list[VerticalStep] = []
+        steps: Optional[list[VerticalStep]] = [] if collect_steps else None
         for i in range(max_iters):
             prompt = _refined_goal(user_goal, last_bundle)
             prediction = self.architect(user_goal=prompt)
-            bundle = {
-                "meta_protocol_version": _get_field(
-                    prediction, "meta_protocol_version"
-                ),
-                "derivative_protocol_specification": _get_field(
-                    prediction, "derivative_protocol_specification"
-                ),
-                "derivative_protocol_payload": _get_field(
-                    prediction, "derivative_protocol_payload"
-                ),
-            }
+            bundle = _get_fields(prediction, REQUIRED_BUNDLE_FIELDS)
             bundle = normalize_mpp_bundle(bundle)
             self.validate_bundle(bundle)
-            steps.append(VerticalStep(iteration=i + 1, output=bundle))
+            if steps is not None:
+                steps.append(
+                    VerticalStep.model_construct(iteration=i + 1, output=bundle)
+                )
             if last_bundle == bundle:
-                return BundleResult(
+                return BundleResult.model_construct(
                     bundle=bundle, iterations=i + 1, stable=True, steps=steps
                 )
             last_bundle = bundle
-        return BundleResult(
+        return BundleResult.model_construct(
             bundle=last_bundle or {},
             iterations=max_iters,
             stable=False,
@@ -205,10 +260,13 @@ class MPPAdapterPipeline:
         open_world: bool = False,
         final_qa: bool = False,
         expect_reasoning: bool = False,
+        already_normalized: bool = False,
+        collect_steps: bool = True,
     ) -> ExecutionResult:
         max_iters = self.executor_max_iters if max_iters is None else max_iters
-        bundle = normalize_mpp_bundle(bundle)
-        self.validate_bundle(bundle)
+        if not already_normalized:
+            bundle = normalize_mpp_bundle(bundle)
+            self.validate_bundle(bundle)
         last_response: Optional[str] = None
         last_comparable: Optional[str] = None
         qa_result: Optional[Mapping[str, Any]] = None
@@ -217,37 +275,39 @@ class MPPAdapterPipeline:
         stable = False
         iterations = max_iters
         decoded_bundle = ""
-        steps: list[VerticalStep] = []
+        steps: Optional[list[VerticalStep]] = [] if collect_steps else None
 
         if open_world and self.qa is None:
             raise ValueError("open_world execution requires a QA predictor.")
 
+        executor = self.executor
+        prediction: Any = None
+        bundle_text = json.dumps(bundle, indent=2, ensure_ascii=True)
         for i in range(max_iters):
-            bundle_text = json.dumps(bundle, indent=2, ensure_ascii=True)
-            prediction = self.executor(
+            prediction = executor(
                 bundle_text=bundle_text,
             )
             response = _response_to_text(_get_field(prediction, "decoded_bundle"))
-            reasoning = _extract_reasoning(prediction)
-            if expect_reasoning and reasoning is None:
-                raise ValueError(
-                    "Executor is configured for ChainOfThought but no reasoning "
-                    "was returned."
-                )
-
-            comparable = _normalize_response_for_stability(response)
+            if expect_reasoning:
+                reasoning = _extract_reasoning(prediction)
+                if reasoning is None:
+                    raise ValueError(
+                        "Executor is configured for ChainOfThought but no "
+                        "reasoning was returned."
+                    )
 
-            if open_world and self.qa is not None:
+            if open_world:
                 qa_result = self._run_qa(bundle, response)
                 qa_passed = _qa_passed(qa_result)
-                steps.append(
-                    VerticalStep(
-                        iteration=i + 1,
-                        output=response,
-                        qa_result=qa_result,
-                        qa_passed=qa_passed,
+                if steps is not None:
+                    steps.append(
+                        VerticalStep.model_construct(
+                            iteration=i + 1,
+                            output=response,
+                            qa_result=qa_result,
+                            qa_passed=qa_passed,
+                        )
                     )
-                )
                 iterations = i + 1
                 if qa_passed:
                     stable = True
@@ -256,15 +316,17 @@ class MPPAdapterPipeline:
                     last_response = response
                 break
 
-            steps.append(
-                VerticalStep(
-                    iteration=i + 1,
-                    output=response,
-                    qa_result=qa_result,
-                    qa_passed=qa_passed,
+            if steps is not None:
+                steps.append(
+                    VerticalStep.model_construct(
+                        iteration=i + 1,
+                        output=response,
+                        qa_result=qa_result,
+                        qa_passed=qa_passed,
+                    )
                 )
-            )
 
+            comparable = _normalize_response_for_stability(response)
             if last_comparable == comparable:
                 stable = True
                 iterations = i + 1
@@ -275,6 +337,8 @@ class MPPAdapterPipeline:
 
         if not stable:
             decoded_bundle = last_response or ""
+        if not expect_reasoning and prediction is not None:
+            reasoning = _extract_reasoning(prediction)
 
         if not open_world and final_qa:
             if self.qa is None:
@@ -282,7 +346,7 @@ class MPPAdapterPipeline:
             qa_result = self._run_qa(bundle, decoded_bundle)
             qa_passed = _qa_passed(qa_result)
 
-        return ExecutionResult(
+        return ExecutionResult.model_construct(
             decoded_bundle=decoded_bundle,
             reasoning=reasoning,
             iterations=iterations,
@@ -305,11 +369,8 @@ class MPPAdapterPipeline:
             derivative_protocol_payload=bundle["derivative_protocol_payload"],
             decoded_bundle=decoded_bundle,
         )
-        result: dict[str, Any] = {
-            "verdict": _get_field(prediction, "verdict"),
-            "issues": _get_field(prediction, "issues"),
-        }
-        repair_examples = _get_field(prediction, "repair_examples")
+        result = _get_fields(prediction, _QA_FIELDS)
+        repair_examples = result["repair_examples"]
         if not isinstance(repair_examples, list):
             raise TypeError("QA repair_examples must be a list.")
         result["repair_examples"] = [
@@ -340,9 +401,14 @@ class MPPVerticalRefiner:
         )
 
     def build_bundle(
-        self, user_goal: str, max_iters: int | None = None
+        self,
+        user_goal: str,
+        max_iters: int | None = None,
+        collect_steps: bool = True,
     ) -> BundleResult:
-        return self.pipeline.build_bundle(user_goal, max_iters=max_iters)
+        return self.pipeline.build_bundle(
+            user_goal, max_iters=max_iters, collect_steps=collect_steps
+        )
 
     def execute(
         self,
@@ -351,6 +417,7 @@ class MPPVerticalRefiner:
         open_world: bool = False,
         final_qa: bool = False,
         expect_reasoning: bool = False,
+        collect_steps: bool = True,
     ) -> ExecutionResult:
         return self.pipeline.execute(
             bundle,
@@ -358,6 +425,7 @@ class MPPVerticalRefiner:
             open_world=open_world,
             final_qa=final_qa,
             expect_reasoning=expect_reasoning,
+            collect_steps=collect_steps,
         )
 
     def run(
@@ -376,7 +444,28 @@ class MPPVerticalRefiner:
             open_world=open_world,
             expect_reasoning=expect_reasoning,
         )
-        return VerticalResult(
+        return VerticalResult.model_construct(
             bundle_result=bundle_result,
             execution_result=execution_result,
         )
+
+    def run_many(
+        self,
+        user_goals: Sequence[str],
+        *,
+        open_world: bool,
+        architect_max_iters: int | None = None,
+        executor_max_iters: int | None = None,
+        expect_reasoning: bool = False,
+        max_workers: int = 8,
+    ) -> list[VerticalResult]:
+        def _run(user_goal: str) -> VerticalResult:
+            return self.run(
+                user_goal,
+                open_world=open_world,
+                architect_max_iters=architect_max_iters,
+                executor_max_iters=executor_max_iters,
+                expect_reasoning=expect_reasoning,
+            )
+
+        return _map_in_threads(_run, list(user_goals), max_workers)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable, Mapping, Sequence
 
 import dspy
@@ -11,7 +17,7 @@ from dspy.teleprompt.teleprompt import Teleprompter
 from .dspy_adapters import MPPArchitectAdapter, MPPExecutorAdapter, MPPQAAdapter
 from .feedback import FeedbackEvent, FeedbackTrace
 from .metrics import AllPassMetric, LongitudinalMetric
-from .mpp_adapter import ExecutionResult, MPPAdapterPipeline
+from .mpp_adapter import ExecutionResult, MPPAdapterPipeline, _map_in_threads
 from .mpp_optimizer import (
     LongitudinalResult,
     LongitudinalScore,
@@ -22,12 +28,70 @@ from .mpp_optimizer import (
 )
 from .mpp_signatures import ProtocolArchitect, ProtocolExecutor, QualityAssurance
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised in minimal envs
+    orjson = None
+
+_RESPONSE_CACHE_SIZE = 4096
+_RESPONSE_CACHE: OrderedDict[bytes, object] = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_STATS = {"hits": 0, "misses": 0}
+_ADAPTER_CACHE_FIELDS = (
+    "spec_text",
+    "base_role_instructions",
+    "role_instructions",
+    "expect_reasoning",
+    "bundle",
+)
+
+
+def _adapter_fingerprint(adapter: dspy.Adapter) -> str:
+    payload = json.dumps(
+        [
+            type(adapter).__qualname__,
+            [getattr(adapter, name, None) for name in _ADAPTER_CACHE_FIELDS],
+        ],
+        default=str,
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _response_cache_key(
+    predictor: Callable[..., object],
+    adapter_fingerprint: str,
+    lm: dspy.BaseLM | None,
+    kwargs: Mapping[str, object],
+) -> bytes:
+    lm = lm if lm is not None else dspy.settings.lm
+    demos = (
+        [predict.demos for _, predict in predictor.named_predictors()]
+        if isinstance(predictor, dspy.Module)
+        else None
+    )
+    payload = json.dumps(
+        [
+            repr(predictor),
+            demos,
+            adapter_fingerprint,
+            type(lm).__name__,
+            getattr(lm, "model", None),
+            getattr(lm, "kwargs", None),
+            sorted(kwargs.items()),
+        ],
+        default=repr,
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
 
 def _wrap_with_adapter(
     predictor: Callable[..., object],
     adapter: dspy.Adapter,
     *,
     lm: dspy.BaseLM | None = None,
+    cache: bool = False,
 ):
     def _call(**kwargs):
         context_kwargs = {"adapter": adapter}
@@ -36,7 +100,31 @@ def _wrap_with_adapter(
         with dspy.settings.context(**context_kwargs):
             return predictor(**kwargs)
 
-    return _call
+    if not cache:
+        return _call
+
+    adapter_fingerprint = _adapter_fingerprint(adapter)
+
+    def _cached_call(**kwargs):
+        key = _response_cache_key(predictor, adapter_fingerprint, lm, kwargs)
+        with _RESPONSE_CACHE_LOCK:
+            if key in _RESPONSE_CACHE:
+                _RESPONSE_CACHE.move_to_end(key)
+                _RESPONSE_CACHE_STATS["hits"] += 1
+                cached = _RESPONSE_CACHE[key]
+            else:
+                cached = None
+                _RESPONSE_CACHE_STATS["misses"] += 1
+        if cached is not None:
+            return copy.deepcopy(cached)
+        result = _call(**kwargs)
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = copy.deepcopy(result)
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+        return result
+
+    return _cached_call
 
 
 def _predictor_uses_cot(predictor: object) -> bool:
@@ -47,32 +135,51 @@ def _strip_code_fences(text: str) -> str:
     stripped = text.strip()
     if not stripped.startswith("```"):
         return stripped
-    lines = stripped.splitlines()
-    if lines and lines[0].startswith("```"):
-        lines = lines[1:]
-    if lines and lines[-1].strip() == "```":
-        lines = lines[:-1]
-    return "\n".join(lines).strip()
+    first = stripped.find("\n")
+    if first == -1:
+        return ""
+    last = stripped.rfind("\n")
+    if stripped[last + 1 :].strip() == "```":
+        return stripped[first + 1 : last].strip()
+    return stripped[first + 1 :].strip()
 
 
+@lru_cache(maxsize=256)
 def _strip_reasoning_for_feedback(response: str) -> str:
     text = response.strip()
     if not text:
         return text
     stripped = _strip_code_fences(text)
-    for candidate in (stripped, text):
+    for candidate in (stripped,) if stripped == text else (stripped, text):
         try:
-            parsed = json.loads(candidate)
+            return _reencode_without_reasoning(candidate)
         except json.JSONDecodeError:
             continue
-        if isinstance(parsed, Mapping):
-            parsed = dict(parsed)
-            parsed.pop("reasoning", None)
-            parsed.pop("rationale", None)
-        return json.dumps(parsed, indent=2, ensure_ascii=True)
     return response
 
 
+def _drop_reasoning(parsed: Any) -> Any:
+    if isinstance(parsed, dict):
+        parsed.pop("reasoning", None)
+        parsed.pop("rationale", None)
+    return parsed
+
+
+def _reencode_without_reasoning(candidate: str) -> str:
+    if orjson is not None:
+        try:
+            parsed = _drop_reasoning(orjson.loads(candidate))
+        except orjson.JSONDecodeError:
+            pass
+        else:
+            rendered = orjson.dumps(parsed, option=orjson.OPT_INDENT_2)
+            if rendered.isascii():
+                return rendered.decode("ascii")
+            return json.dumps(parsed, indent=2, ensure_ascii=True)
+    parsed = _drop_reasoning(json.loads(candidate))
+    return json.dumps(parsed, indent=2, ensure_ascii=True)
+
+
 def _append_executor_feedback(
     trace: FeedbackTrace, exec_result: ExecutionResult
 ) -> FeedbackTrace:
@@ -103,6 +210,8 @@ class MPPAutoAdapter(dspy.Module):
         architect_role_instructions: str | None = None,
         executor_role_instructions: str | None = None,
         qa_role_instructions: str | None = None,
+        collect_steps: bool = True,
+        enable_response_cache: bool = False,
     ) -> None:
         super().__init__()
         self.spec_text = spec_text
@@ -124,6 +233,8 @@ class MPPAutoAdapter(dspy.Module):
         self.qa_lm = qa_lm
         self.executor_role_instructions = executor_role_instructions
         self.qa_role_instructions = qa_role_instructions
+        self.collect_steps = collect_steps
+        self.enable_response_cache = enable_response_cache
 
         architect_kwargs = {"spec_text": spec_text}
         if architect_role_instructions is not None:
@@ -161,7 +272,38 @@ class MPPAutoAdapter(dspy.Module):
             )
 
         architect_call = _wrap_with_adapter(
-            self.architect, self.architect_adapter, lm=self.architect_lm
+            self.architect,
+            self.architect_adapter,
+            lm=self.architect_lm,
+            cache=self.enable_response_cache,
+        )
+        executor_kwargs = {
+            "spec_text": self.spec_text,
+            "expect_reasoning": self.executor_expect_reasoning,
+        }
+        if self.executor_role_instructions is not None:
+            executor_kwargs["role_instructions"] = self.executor_role_instructions
+        executor_adapter = MPPExecutorAdapter(**executor_kwargs)
+        executor_call = _wrap_with_adapter(
+            self.executor,
+            executor_adapter,
+            lm=self.executor_lm,
+            cache=self.enable_response_cache,
+        )
+        qa_kwargs = {"spec_text": self.spec_text}
+        if self.qa_role_instructions is not None:
+            qa_kwargs["role_instructions"] = self.qa_role_instructions
+        qa_adapter = MPPQAAdapter(**qa_kwargs)
+        qa_call = _wrap_with_adapter(
+            self.qa,
+            qa_adapter,
+            lm=self.qa_lm,
+            cache=self.enable_response_cache,
+        )
+        exec_pipeline = MPPAdapterPipeline(
+            architect=architect_call,
+            executor=executor_call,
+            qa=qa_call,
         )
         previous_bundle = None
         feedback_trace = FeedbackTrace()
@@ -182,46 +324,25 @@ class MPPAutoAdapter(dspy.Module):
                 max_iters=bundle_iters,
                 previous_bundle=previous_bundle,
                 error_message=feedback,
+                collect_steps=self.collect_steps,
             )
-            bundle_refinements_total += max(bundle_result.iterations - 1, 0)
-
-            executor_kwargs = {
-                "spec_text": self.spec_text,
-                "expect_reasoning": self.executor_expect_reasoning,
-            }
-            if self.executor_role_instructions is not None:
-                executor_kwargs["role_instructions"] = self.executor_role_instructions
-            executor_adapter = MPPExecutorAdapter(**executor_kwargs)
-            executor_call = _wrap_with_adapter(
-                self.executor, executor_adapter, lm=self.executor_lm
-            )
+            bundle_refinements_total += bundle_result.refinements
 
             if self.qa is None:
                 raise ValueError("QA predictor is required for QA gating.")
-            qa_kwargs = {
-                "spec_text": self.spec_text,
-                "bundle": bundle_result.bundle,
-            }
-            if self.qa_role_instructions is not None:
-                qa_kwargs["role_instructions"] = self.qa_role_instructions
-            qa_adapter = MPPQAAdapter(**qa_kwargs)
-            qa_call = _wrap_with_adapter(self.qa, qa_adapter, lm=self.qa_lm)
-
-            exec_pipeline = MPPAdapterPipeline(
-                architect=architect_call,
-                executor=executor_call,
-                qa=qa_call,
-            )
+            qa_adapter.bundle = bundle_result.bundle
             exec_result = exec_pipeline.execute(
                 bundle_result.bundle,
                 max_iters=executor_iters,
                 open_world=open_world,
                 final_qa=not open_world,
                 expect_reasoning=self.executor_expect_reasoning,
+                already_normalized=True,
+                collect_steps=self.collect_steps,
             )
             qa_result = exec_result.qa_result
             qa_passed = exec_result.qa_passed
-            executor_refinements_total += max(exec_result.iterations - 1, 0)
+            executor_refinements_total += exec_result.refinements
             if open_world:
                 success = bool(qa_passed)
             else:
@@ -242,12 +363,12 @@ class MPPAutoAdapter(dspy.Module):
             qa_result=qa_result,
             qa_passed=qa_passed,
             bundle_iterations=bundle_result.iterations,
-            bundle_refinements=max(bundle_result.iterations - 1, 0),
+            bundle_refinements=bundle_result.refinements,
             bundle_refinements_total=bundle_refinements_total,
             bundle_stable=bundle_result.stable,
             bundle_steps=bundle_result.steps,
             executor_iterations=exec_result.iterations,
-            executor_refinements=max(exec_result.iterations - 1, 0),
+            executor_refinements=exec_result.refinements,
             executor_refinements_total=executor_refinements_total,
             executor_stable=exec_result.stable,
             executor_steps=exec_result.steps,
@@ -255,6 +376,24 @@ class MPPAutoAdapter(dspy.Module):
             open_world=open_world,
         )
 
+    async def aforward(
+        self,
+        *,
+        user_goal: str,
+        open_world: bool,
+        max_iters: int | None = None,
+        architect_max_iters: int | None = None,
+        executor_max_iters: int | None = None,
+    ) -> Prediction:
+        return await asyncio.to_thread(
+            self.forward,
+            user_goal=user_goal,
+            open_world=open_world,
+            max_iters=max_iters,
+            architect_max_iters=architect_max_iters,
+            executor_max_iters=executor_max_iters,
+        )
+
 
 @dataclass(frozen=True)
 class FullPipelineResult:
@@ -272,6 +411,7 @@ class _OptimizedMPPAutoAdapter(dspy.Module):
         super().__init__()
         self.base_adapter = base_adapter
         self.blocks = dict(blocks)
+        self._goal_prefix = MPPAutoAdapterOptimizer._goal_prefix(self.blocks)
         self.template = longitudinal_result.template
         self.longitudinal_result = longitudinal_result
 
@@ -283,7 +423,7 @@ class _OptimizedMPPAutoAdapter(dspy.Module):
         architect_max_iters: int | None = None,
         executor_max_iters: int | None = None,
     ) -> Prediction:
-        goal = MPPAutoAdapterOptimizer._apply_blocks(self.blocks, user_goal)
+        goal = self._goal_prefix + user_goal
         return self.base_adapter(
             user_goal=goal,
             open_world=open_world,
@@ -291,6 +431,22 @@ class _OptimizedMPPAutoAdapter(dspy.Module):
             executor_max_iters=executor_max_iters,
         )
 
+    async def aforward(
+        self,
+        *,
+        user_goal: str,
+        open_world: bool,
+        architect_max_iters: int | None = None,
+        executor_max_iters: int | None = None,
+    ) -> Prediction:
+        goal = self._goal_prefix + user_goal
+        return await self.base_adapter.acall(
+            user_goal=goal,
+            open_world=open_world,
+            architect_max_iters=architect_max_iters,
+            executor_max_iters=executor_max_iters,
+        )
+
 
 class MPPAutoAdapterOptimizer(Teleprompter):
     """DSPy teleprompter that optimizes MPPAutoAdapter prompt blocks."""
@@ -305,6 +461,7 @@ class MPPAutoAdapterOptimizer(Teleprompter):
         longitudinal_min_delta: float = 0.0,
         metric: LongitudinalMetric | None = None,
         adapter_kwargs: Mapping[str, object] | None = None,
+        max_workers: int = 4,
     ) -> None:
         super().__init__()
         self.template = template
@@ -314,6 +471,7 @@ class MPPAutoAdapterOptimizer(Teleprompter):
         self.longitudinal_min_delta = longitudinal_min_delta
         self.metric = metric or AllPassMetric()
         self.adapter_kwargs = dict(adapter_kwargs or {})
+        self.max_workers = max_workers
 
     def compile(
         self,
@@ -395,26 +553,38 @@ class MPPAutoAdapterOptimizer(Teleprompter):
         architect_max_iters: int | None,
         executor_max_iters: int | None,
     ) -> LongitudinalResult:
+        programs: dict[
+            tuple[str | None, str | None, str | None, bool], MPPAutoAdapter
+        ] = {}
+
         def score_function(
             _template: str, dataset: Sequence[Any], blocks
         ) -> LongitudinalScore:
-            program_default = self._build_program(
-                blocks,
-                use_cot=False,
-                adapter_kwargs=adapter_kwargs,
+            goal_prefix = self._goal_prefix(blocks)
+            primers = (
+                blocks.get("architect_primer"),
+                blocks.get("executor_primer"),
+                blocks.get("qa_primer"),
             )
-            program_cot = self._build_program(
-                blocks,
-                use_cot=True,
-                adapter_kwargs=adapter_kwargs,
-            )
-            traces: list[LongitudinalTrace] = []
+            calls = []
             for case in dataset:
-                user_goal = self._case_user_goal(case)
+                goal = goal_prefix + self._case_user_goal(case)
                 open_world = self._case_open_world(case)
                 use_cot = self._case_use_cot(case)
-                program = program_cot if use_cot else program_default
-                goal = self._apply_blocks(blocks, user_goal)
+                key = (*primers, use_cot)
+                program = programs.get(key)
+                if program is None:
+                    program = programs[key] = self._build_program(
+                        blocks,
+                        use_cot=use_cot,
+                        adapter_kwargs=adapter_kwargs,
+                    )
+                calls.append((case, program, goal, open_world))
+
+            def _trace(
+                call: tuple[Any, MPPAutoAdapter, str, bool],
+            ) -> LongitudinalTrace:
+                case, program, goal, open_world = call
                 try:
                     result = program(
                         user_goal=goal,
@@ -423,39 +593,28 @@ class MPPAutoAdapterOptimizer(Teleprompter):
                         executor_max_iters=executor_max_iters,
                     )
                 except Exception as exc:  # noqa: BLE001
-                    traces.append(
-                        LongitudinalTrace(
-                            case=case,
-                            errors=[f"{type(exc).__name__}: {exc}"],
-                        )
-                    )
-                    continue
-                bundle_refinements = getattr(
-                    result,
-                    "bundle_refinements_total",
-                    result.bundle_refinements,
-                )
-                executor_refinements = getattr(
-                    result,
-                    "executor_refinements_total",
-                    result.executor_refinements,
-                )
-                issues = []
-                if result.qa_passed is False and result.qa_result:
-                    issues = list(result.qa_result.get("issues") or [])
-                traces.append(
-                    LongitudinalTrace(
+                    return LongitudinalTrace(
                         case=case,
-                        bundle_refinements=bundle_refinements,
-                        executor_refinements=executor_refinements,
-                        bundle_steps=getattr(result, "bundle_steps", None),
-                        execution_steps=getattr(result, "executor_steps", None),
-                        bundle_stable=getattr(result, "bundle_stable", None),
-                        qa_passed=result.qa_passed,
-                        executor_stable=result.executor_stable,
-                        errors=issues,
+                        errors=[f"{type(exc).__name__}: {exc}"],
                     )
+                qa_passed = result.qa_passed
+                qa_result = result.qa_result
+                issues = []
+                if qa_passed is False and qa_result:
+                    issues = list(qa_result.get("issues") or [])
+                return LongitudinalTrace(
+                    case=case,
+                    bundle_refinements=result.bundle_refinements_total,
+                    executor_refinements=result.executor_refinements_total,
+                    bundle_steps=result.bundle_steps,
+                    execution_steps=result.executor_steps,
+                    bundle_stable=result.bundle_stable,
+                    qa_passed=qa_passed,
+                    executor_stable=result.executor_stable,
+                    errors=issues,
                 )
+
+            traces = _map_in_threads(_trace, calls, self.max_workers)
             return LongitudinalScore(score=self.metric.score(traces), traces=traces)
 
         refiner = MPPLongitudinalRefiner(
@@ -494,6 +653,8 @@ class MPPAutoAdapterOptimizer(Teleprompter):
             "architect_lm": student.architect_lm,
             "executor_lm": student.executor_lm,
             "qa_lm": student.qa_lm,
+            "collect_steps": student.collect_steps,
+            "enable_response_cache": student.enable_response_cache,
         }
         if student.executor_role_instructions is not None:
             kwargs["executor_role_instructions"] = student.executor_role_instructions
@@ -542,6 +703,10 @@ class MPPAutoAdapterOptimizer(Teleprompter):
 
     @staticmethod
     def _apply_blocks(blocks: Mapping[str, str], goal: str) -> str:
+        return MPPAutoAdapterOptimizer._goal_prefix(blocks) + goal
+
+    @staticmethod
+    def _goal_prefix(blocks: Mapping[str, str]) -> str:
         entry_prompt = (blocks.get("entry_prompt") or "").strip()
         strategy_payload = (blocks.get("strategy_payload") or "").strip()
         parts = []
@@ -549,5 +714,5 @@ class MPPAutoAdapterOptimizer(Teleprompter):
             parts.append(entry_prompt)
         if strategy_payload:
             parts.append(f"Strategy guidance:\n{strategy_payload}")
-        parts.append(f"User goal:\n{goal}")
+        parts.append("User goal:\n")
         return "\n\n".join(parts)
@@ -21,36 +21,37 @@ except Exception as exc:  # pragma: no cover - exercised in minimal envs
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from .mpp_adapter import BundleResult, ExecutionResult, VerticalStep
+from .mpp_adapter import (
+    BundleResult,
+    ExecutionResult,
+    VerticalStep,
+    _get_fields,
+    _map_in_threads,
+)
 from .template_tokens import extract_mutable_blocks, render_mutable_template
-from .validations import normalize_mpp_bundle, validate_mpp_bundle
+from .validations import (
+    REQUIRED_BUNDLE_FIELDS,
+    normalize_mpp_bundle,
+    validate_mpp_bundle,
+)
 
 Predictor = Callable[..., Any]
 Bundle = dict[str, Any]
 
 
-def _get_field(prediction: Any, name: str) -> Any:
-    if isinstance(prediction, Mapping):
-        if name not in prediction:
-            raise KeyError(f"Prediction missing field: {name}")
-        return prediction[name]
-    if hasattr(prediction, name):
-        return getattr(prediction, name)
-    raise AttributeError(f"Prediction missing attribute: {name}")
+def _bundle_text(bundle: Mapping[str, Any]) -> str:
+    return json.dumps(bundle, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
 
 
 def _refined_goal(
     user_goal: str,
-    previous_bundle: Optional[Mapping[str, Any]],
+    previous_bundle_text: Optional[str],
     error_message: Optional[str] = None,
 ) -> str:
     raw_goal = f"<RAW_USER_GOAL>\n{user_goal}\n</RAW_USER_GOAL>"
     parts = [raw_goal]
-    if previous_bundle is not None:
-        parts.append(
-            "Previous bundle:\n"
-            f"{json.dumps(previous_bundle, indent=2, ensure_ascii=True)}"
-        )
+    if previous_bundle_text is not None:
+        parts.append(f"Previous bundle:\n{previous_bundle_text}")
     if error_message:
         parts.append(
             "Refinement feedback:\n"
@@ -90,11 +91,15 @@ class MPPBundleOptimizer(Teleprompter):
         *,
         previous_bundle: Optional[Mapping[str, Any]] = None,
         error_message: Optional[str] = None,
+        collect_steps: bool = True,
     ) -> BundleResult:
         max_iters = self.max_iters if max_iters is None else max_iters
         last_bundle: Optional[Bundle] = (
             dict(previous_bundle) if previous_bundle is not None else None
         )
+        last_bundle_text = (
+            _bundle_text(last_bundle) if last_bundle is not None else None
+        )
         last_valid_bundle: Optional[Bundle] = None
         last_error: Optional[str] = error_message
         if previous_bundle is not None:
@@ -104,53 +109,49 @@ class MPPBundleOptimizer(Teleprompter):
                 last_error = error_message
             else:
                 last_valid_bundle = dict(previous_bundle)
-        steps: list[VerticalStep] = []
+        steps: Optional[list[VerticalStep]] = [] if collect_steps else None
         for i in range(max_iters):
-            prompt = _refined_goal(user_goal, last_bundle, last_error)
+            prompt = _refined_goal(user_goal, last_bundle_text, last_error)
             try:
                 prediction = architect(user_goal=prompt)
             except Exception as exc:  # noqa: BLE001
                 last_error = f"{type(exc).__name__}: {exc}"
-                steps.append(
-                    VerticalStep(
-                        iteration=i + 1,
-                        output=None,
-                        error=last_error,
+                if steps is not None:
+                    steps.append(
+                        VerticalStep.model_construct(
+                            iteration=i + 1,
+                            output=None,
+                            error=last_error,
+                        )
                     )
-                )
                 continue
-            bundle = {
-                "meta_protocol_version": _get_field(
-                    prediction, "meta_protocol_version"
-                ),
-                "derivative_protocol_specification": _get_field(
-                    prediction, "derivative_protocol_specification"
-                ),
-                "derivative_protocol_payload": _get_field(
-                    prediction, "derivative_protocol_payload"
-                ),
-            }
+            bundle = _get_fields(prediction, REQUIRED_BUNDLE_FIELDS)
             bundle = normalize_mpp_bundle(bundle)
+            if bundle != last_bundle:
+                last_bundle = bundle
+                last_bundle_text = _bundle_text(bundle)
             try:
                 self.validate_bundle(bundle)
             except Exception as exc:  # noqa: BLE001
-                last_bundle = bundle
                 last_error = f"{type(exc).__name__}: {exc}"
-                steps.append(
-                    VerticalStep(
-                        iteration=i + 1,
-                        output=bundle,
-                        error=last_error,
+                if steps is not None:
+                    steps.append(
+                        VerticalStep.model_construct(
+                            iteration=i + 1,
+                            output=bundle,
+                            error=last_error,
+                        )
                     )
-                )
                 continue
             last_error = None
-            steps.append(VerticalStep(iteration=i + 1, output=bundle))
+            if steps is not None:
+                steps.append(
+                    VerticalStep.model_construct(iteration=i + 1, output=bundle)
+                )
             if last_valid_bundle == bundle:
-                return BundleResult(
+                return BundleResult.model_construct(
                     bundle=bundle, iterations=i + 1, stable=True, steps=steps
                 )
-            last_bundle = bundle
             last_valid_bundle = bundle
         if last_valid_bundle is None:
             detail = last_error or "Unknown error."
@@ -158,13 +159,32 @@ class MPPBundleOptimizer(Teleprompter):
                 "Failed to produce a valid MPP bundle after "
                 f"{max_iters} iterations. Last error: {detail}"
             )
-        return BundleResult(
+        return BundleResult.model_construct(
             bundle=last_valid_bundle,
             iterations=max_iters,
             stable=False,
             steps=steps,
         )
 
+    def refine_many(
+        self,
+        architect: Predictor,
+        user_goals: Sequence[str],
+        max_iters: int | None = None,
+        *,
+        max_workers: int = 8,
+        collect_steps: bool = True,
+    ) -> list[BundleResult]:
+        def _refine(user_goal: str) -> BundleResult:
+            return self.refine(
+                architect,
+                user_goal,
+                max_iters=max_iters,
+                collect_steps=collect_steps,
+            )
+
+        return _map_in_threads(_refine, list(user_goals), max_workers)
+
     def compile(
         self,
         student,
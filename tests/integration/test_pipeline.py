@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import pytest
 
-from mpp_dspy.mpp_adapter import MPPAdapterPipeline
+from mpp_dspy import mpp_adapter
+from mpp_dspy.mpp_adapter import MPPAdapterPipeline, MPPVerticalRefiner
 
 
 def test_execute_stabilizes_with_equivalent_json(mpp_bundle_minimal) -> None:
@@ -67,6 +69,7 @@ def test_execute_open_world_short_circuits_on_qa_fail(mpp_bundle_minimal) -> Non
     # Assert: QA failure returns after the first attempt.
     assert result.qa_passed is False
     assert result.iterations == 1
+    assert result.decoded_bundle == "bad-output"
     assert executor_calls["count"] == 1
     assert qa_calls["count"] == 1
 
@@ -91,3 +94,313 @@ def test_execute_requires_reasoning_when_expected(mpp_bundle_minimal) -> None:
             open_world=False,
             expect_reasoning=True,
         )
+
+
+def test_build_bundle_stabilizes_regardless_of_key_order(mpp_bundle_minimal) -> None:
+    """Bundle fixed points compare content, not serialized key order."""
+    # Arrange: the architect repeats its bundle with keys in reverse order.
+    reordered = dict(reversed(list(mpp_bundle_minimal.items())))
+    bundles = iter([mpp_bundle_minimal, reordered])
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: next(bundles),
+        executor=lambda **_kwargs: {"decoded_bundle": "unused"},
+        architect_max_iters=3,
+    )
+
+    # Act: refine the bundle.
+    result = pipeline.build_bundle("Run a small test.")
+
+    # Assert: the reordered repeat is recognized as the fixed point.
+    assert result.stable is True
+    assert result.iterations == 2
+
+
+def test_execute_normalizes_repeated_responses_once(mpp_bundle_minimal) -> None:
+    """Identical executor outputs reuse the cached stability normalization."""
+    # Arrange: the executor repeats a unique JSON response.
+    response = '{"final": {"value": "cached-normalization"}, "reasoning": "x"}'
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": response},
+        executor_max_iters=3,
+    )
+    before = mpp_adapter._normalize_response_for_stability.cache_info()
+
+    # Act: run the executor loop to convergence.
+    result = pipeline.execute(mpp_bundle_minimal, open_world=False)
+
+    # Assert: the second identical response is served from the cache.
+    after = mpp_adapter._normalize_response_for_stability.cache_info()
+    assert result.stable is True
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 1
+
+
+def test_execute_trusts_already_normalized_bundles(mpp_bundle_minimal) -> None:
+    """Callers that validated the bundle can skip re-normalization."""
+    # Arrange: a validator that records every call.
+    validated = []
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": "done"},
+        validate_bundle=validated.append,
+        executor_max_iters=2,
+    )
+
+    # Act: execute once untrusted and once trusted.
+    pipeline.execute(mpp_bundle_minimal)
+    result = pipeline.execute(mpp_bundle_minimal, already_normalized=True)
+
+    # Assert: only the untrusted call validated the bundle.
+    assert result.stable is True
+    assert len(validated) == 1
+
+
+def test_run_many_runs_goals_concurrently_in_input_order(mpp_bundle_minimal) -> None:
+    """Batched runs overlap their model calls but keep the caller's ordering."""
+    # Arrange: an architect that only proceeds once both goals are in flight.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def architect(user_goal: str) -> dict[str, Any]:
+        barrier.wait()
+        version = "alpha" if "alpha" in user_goal else "beta"
+        return {**mpp_bundle_minimal, "meta_protocol_version": version}
+
+    refiner = MPPVerticalRefiner(
+        architect=architect,
+        executor=lambda **_kwargs: {"decoded_bundle": "done"},
+        validate_bundle=lambda _bundle: None,
+    )
+
+    # Act: run both goals through the batched API.
+    results = refiner.run_many(["goal alpha", "goal beta"], open_world=False)
+
+    # Assert: each result lines up with its goal.
+    versions = [r.bundle_result.bundle["meta_protocol_version"] for r in results]
+    assert versions == ["alpha", "beta"]
+    assert all(r.execution_result.stable for r in results)
+
+
+def test_execute_open_world_skips_stability_normalization(
+    mpp_bundle_minimal,
+) -> None:
+    """Open-world runs gate on QA, so responses are never normalized."""
+    # Arrange: a passing QA predictor and a cleared normalization cache.
+    mpp_adapter._normalize_response_for_stability.cache_clear()
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": '{"final": 1}'},
+        qa=lambda **_kwargs: {
+            "verdict": "pass",
+            "issues": [],
+            "repair_examples": [],
+        },
+    )
+
+    # Act: run open-world execution.
+    result = pipeline.execute(mpp_bundle_minimal, open_world=True)
+
+    # Assert: QA accepted the response without a stability comparison.
+    assert result.qa_passed is True
+    assert mpp_adapter._normalize_response_for_stability.cache_info().misses == 0
+
+
+def test_strip_code_fences_handles_partial_and_empty_fences() -> None:
+    """Fence stripping slices the body without splitting it into lines."""
+    # Arrange: fenced, unterminated, empty and unfenced responses.
+    cases = {
+        '```json\n{"a": 1}\n```\n': '{"a": 1}',
+        "```\nline 1\nline 2": "line 1\nline 2",
+        "```\n```": "",
+        "```inline```": "",
+        "  plain  ": "plain",
+    }
+
+    # Act: strip each response.
+    stripped = {text: mpp_adapter._strip_code_fences(text) for text in cases}
+
+    # Assert: only the fence lines are removed.
+    assert stripped == cases
+
+
+def test_stability_normalization_drops_only_top_level_reasoning() -> None:
+    """Reasoning keys are ignored at the top level but kept when nested."""
+    # Arrange: two responses that differ only in top-level reasoning.
+    first = '{"reasoning": "a", "final": {"reasoning": "kept"}}'
+    second = '```json\n{"final": {"reasoning": "kept"}, "rationale": "b"}\n```'
+
+    # Act: normalize both responses.
+    normalized = {
+        mpp_adapter._normalize_response_for_stability(first),
+        mpp_adapter._normalize_response_for_stability(second),
+    }
+
+    # Assert: both collapse to the same canonical JSON.
+    assert normalized == {'{"final":{"reasoning":"kept"}}'}
+
+
+def test_stability_normalization_handles_integers_beyond_64_bits() -> None:
+    """Canonical JSON falls back to the stdlib encoder for huge integers."""
+    # Arrange: equivalent payloads with an integer orjson cannot encode.
+    first = '{"b": 1, "a": 1180591620717411303424}'
+    second = '{"a": 1180591620717411303424, "b": 1}'
+
+    # Act: normalize both responses.
+    normalized = {
+        mpp_adapter._normalize_response_for_stability(first),
+        mpp_adapter._normalize_response_for_stability(second),
+    }
+
+    # Assert: both collapse to the same canonical JSON.
+    assert normalized == {'{"a":1180591620717411303424,"b":1}'}
+
+
+def test_qa_passed_accepts_only_pass_verdicts() -> None:
+    """The exact verdict short-circuits; variants are still normalized."""
+    # Arrange: verdicts as QA predictors commonly return them.
+    verdicts = ["pass", " PASS\n", "Pass", "fail", "passed", "ok", None, 1]
+
+    # Act: gate each verdict.
+    passed = [mpp_adapter._qa_passed({"verdict": v}) for v in verdicts]
+
+    # Assert: only case and whitespace variants of "pass" are accepted.
+    assert passed == [True, True, True, False, False, False, False, False]
+
+
+def test_get_fields_reads_mappings_and_attributes_alike() -> None:
+    """Field extraction checks the prediction shape once for all fields."""
+    # Arrange: the same fields as a mapping and as attributes.
+    mapping = {"verdict": "pass", "issues": []}
+    prediction = type("Prediction", (), mapping)()
+
+    # Act: extract both fields from each shape.
+    from_mapping = mpp_adapter._get_fields(mapping, ("verdict", "issues"))
+    from_attributes = mpp_adapter._get_fields(prediction, ("verdict", "issues"))
+
+    # Assert: both agree, and missing fields keep their error types.
+    assert from_mapping == from_attributes == mapping
+    with pytest.raises(KeyError, match="missing field: repair_examples"):
+        mpp_adapter._get_fields(mapping, ("verdict", "repair_examples"))
+    with pytest.raises(AttributeError, match="missing attribute: repair_examples"):
+        mpp_adapter._get_fields(prediction, ("repair_examples",))
+
+
+def test_stability_normalization_collapses_whitespace_in_plain_text() -> None:
+    """Non-JSON responses compare equal when only their whitespace differs."""
+    # Arrange: the same prose with different spacing and line breaks.
+    first = "```\nThe answer\tis  42.\n```"
+    second = "The answer\nis 42.   "
+
+    # Act: normalize both responses.
+    normalized = {
+        mpp_adapter._normalize_response_for_stability(first),
+        mpp_adapter._normalize_response_for_stability(second),
+    }
+
+    # Assert: both collapse to single-spaced text.
+    assert normalized == {"The answer is 42."}
+
+
+def test_collect_steps_false_skips_step_telemetry(mpp_bundle_minimal) -> None:
+    """Callers that ignore telemetry can skip recording per-iteration steps."""
+    # Arrange: a pipeline that converges after two iterations per loop.
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": "done"},
+    )
+
+    # Act: run both loops without collecting steps.
+    bundle_result = pipeline.build_bundle("goal", collect_steps=False)
+    execution_result = pipeline.execute(bundle_result.bundle, collect_steps=False)
+
+    # Assert: results are unchanged apart from the missing telemetry.
+    assert bundle_result.stable is True
+    assert bundle_result.iterations == 2
+    assert bundle_result.steps is None
+    assert execution_result.stable is True
+    assert execution_result.steps is None
+
+
+def test_refined_goal_keeps_non_ascii_bundle_text() -> None:
+    """Previous bundles reach the architect as UTF-8 text, not escapes."""
+    # Arrange: a bundle with non-ASCII content.
+    bundle = {"derivative_protocol_payload": {"greeting": "olá, 世界"}}
+
+    # Act: build the refinement prompt.
+    prompt = mpp_adapter._refined_goal("Say hi.", bundle)
+
+    # Assert: the text is embedded verbatim.
+    assert '{"derivative_protocol_payload":{"greeting":"olá, 世界"}}' in prompt
+    assert "\\u" not in prompt
+
+
+def test_results_expose_refinement_counts(mpp_bundle_minimal) -> None:
+    """Refinements count every iteration after the first one."""
+    # Arrange: a pipeline that converges on its second iteration.
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": "done"},
+    )
+
+    # Act: run both loops, plus a zero-iteration execution.
+    bundle_result = pipeline.build_bundle("goal")
+    execution_result = pipeline.execute(bundle_result.bundle)
+    idle_result = pipeline.execute(bundle_result.bundle, max_iters=0)
+
+    # Assert: converged loops refined once; an idle loop never goes negative.
+    assert bundle_result.refinements == 1
+    assert execution_result.refinements == 1
+    assert idle_result.refinements == 0
+
+
+def test_results_keep_the_pydantic_model_api(mpp_bundle_minimal) -> None:
+    """Loop results still dump, copy, and validate as pydantic models."""
+    # Arrange: a refiner whose loops converge immediately.
+    refiner = MPPVerticalRefiner(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: {"decoded_bundle": "done"},
+    )
+
+    # Act: run both loops and round-trip the result.
+    result = refiner.run("goal", open_world=False)
+    dumped = result.model_dump()
+    restored = type(result).model_validate(dumped)
+    copied = result.execution_result.model_copy(update={"stable": False})
+
+    # Assert: the public model API behaves as before.
+    assert dumped["execution_result"]["decoded_bundle"] == "done"
+    assert dumped["bundle_result"]["steps"][0]["iteration"] == 1
+    assert restored == result
+    assert copied.stable is False and result.execution_result.stable is True
+
+
+def test_execute_reads_optional_reasoning_from_the_final_prediction(
+    mpp_bundle_minimal,
+) -> None:
+    """Without CoT, reasoning is probed once and taken from the last response."""
+    # Arrange: an executor whose reasoning changes on every call.
+    probes = []
+
+    class Prediction:
+        def __init__(self, index: int) -> None:
+            self.decoded_bundle = "done"
+            self._reasoning = f"step {index}"
+
+        @property
+        def reasoning(self) -> str:
+            probes.append(self._reasoning)
+            return self._reasoning
+
+    calls = iter(range(1, 10))
+    pipeline = MPPAdapterPipeline(
+        architect=lambda **_kwargs: mpp_bundle_minimal,
+        executor=lambda **_kwargs: Prediction(next(calls)),
+    )
+
+    # Act: run a closed-world execution that converges on iteration two.
+    result = pipeline.execute(mpp_bundle_minimal)
+
+    # Assert: only the final prediction was probed for reasoning.
+    assert result.iterations == 2
+    assert result.reasoning == "step 2"
+    assert probes == ["step 2"]
@@ -0,0 +1,644 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from mpp_dspy.benchmarks import runner as runner_module
+from mpp_dspy.benchmarks.runner import (
+    BenchmarkCase,
+    ModelGroup,
+    _apply_methods_config,
+    _apply_no_cache_config,
+    _assistant_text,
+    _blocks_prefix,
+    _build_case,
+    _build_cot_prompt,
+    _build_few_shot_prompt,
+    _build_prompt,
+    _few_shot_prefix,
+    _load_langdock_settings,
+    _ModelRunner,
+    _MPPRunner,
+    _read_blocks,
+    _read_records,
+    _run_method,
+    _run_prompt_method,
+    _run_self_consistency,
+    _write_report,
+)
+
+
+def _group() -> ModelGroup:
+    return ModelGroup(
+        name="default",
+        baseline_model="m",
+        architect_model="m",
+        executor_model="m",
+        qa_model="m",
+    )
+
+
+def test_model_runner_reuses_deterministic_responses(monkeypatch) -> None:
+    """Identical deterministic prompts hit the in-memory response cache."""
+    calls: list[dict] = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": f"answer {len(calls)}"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion", fake_completion)
+    runner = _ModelRunner(
+        _group(), {"default": 0, "self_consistency": 0.7}, {"use_cache": False}
+    )
+
+    first = runner.generate("Compute 2 + 2.", "raw")
+    second = runner.generate("Compute 2 + 2.", "raw")
+    sampled = [runner.generate("Compute 2 + 2.", "self_consistency") for _ in "ab"]
+
+    assert first == second == "answer 1"
+    assert sampled == ["answer 2", "answer 3"]
+    assert calls[0]["use_cache"] is False
+
+
+def test_model_runner_resamples_provider_default_temperature(monkeypatch) -> None:
+    """Without an explicit temperature 0, repeated prompts are sent again."""
+    calls: list[dict] = []
+
+    def fake_completion(messages, **kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": f"answer {len(calls)}"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion", fake_completion)
+    runner = _ModelRunner(_group(), {}, {})
+
+    answers = [runner.generate("Compute 2 + 2.", "raw") for _ in "ab"]
+
+    assert answers == ["answer 1", "answer 2"]
+    assert [call["use_cache"] for call in calls] == [False, False]
+
+
+def test_prompt_builders_share_a_stable_prefix() -> None:
+    """Only the question tail differs between prompts for the same dataset."""
+    first = BenchmarkCase("1", "gsm8k", "What is 1 + 1?", "#### 2", {})
+    second = BenchmarkCase("2", "gsm8k", "What is 2 + 2?", "#### 4", {})
+
+    zero_shot = functools.partial(_build_prompt, include_instruction=True)
+
+    for build in (zero_shot, _build_few_shot_prompt, _build_cot_prompt):
+        prefix = build(first).split(first.question)[0]
+
+        assert "Return the final numeric answer" in prefix
+        assert build(second).startswith(prefix)
+
+
+def test_blocks_prefix_canonicalizes_whitespace() -> None:
+    """Trailing whitespace in blocks does not change the prompt prefix bytes."""
+    clean = {"entry_prompt": "Be exact.\nStay brief.", "strategy_payload": "Plan."}
+    noisy = {
+        "entry_prompt": " Be exact.  \r\nStay brief.\n",
+        "strategy_payload": "Plan.\t",
+    }
+
+    assert _blocks_prefix(clean) == _blocks_prefix(noisy)
+    assert _blocks_prefix(clean) == (
+        "Be exact.\nStay brief.\n\nStrategy guidance:\nPlan.\n\n"
+    )
+
+
+@pytest.mark.parametrize("score_processes", [0, 2])
+def test_run_method_fans_out_and_keeps_case_order(
+    monkeypatch, score_processes: int
+) -> None:
+    """Concurrent predictions are scored, inline or in processes, in case order."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_completion(messages, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        answer = messages[0]["content"].split("+")[0].split()[-1]
+        return {"choices": [{"message": {"content": f"#### {int(answer) * 2}"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    cases = [
+        BenchmarkCase(str(n), "gsm8k", f"What is {n} + {n}?", f"#### {n * 2}", {})
+        for n in range(1, 6)
+    ]
+    runner = _ModelRunner(_group(), {"default": 0.5}, {"use_cache": False})
+
+    result = _run_method(
+        "raw",
+        cases,
+        runner,
+        None,
+        1,
+        True,
+        concurrency=3,
+        score_processes=score_processes,
+        dataset_name="gsm8k",
+        group_name="default",
+        log_every=None,
+        logger=None,
+        continue_on_error=False,
+        max_errors=None,
+        optimized_blocks=None,
+    )
+
+    assert result["correct"] == result["total"] == 5
+    assert [sample["case_id"] for sample in result["samples"]] == list("12345")
+    assert 1 < peak <= 3
+
+
+@pytest.mark.parametrize(
+    ("continue_on_error", "max_errors", "concurrency", "max_calls"),
+    [(False, None, 1, 1), (True, 2, 1, 2), (False, None, 4, 4)],
+)
+def test_run_method_stops_requesting_after_errors(
+    monkeypatch, continue_on_error, max_errors, concurrency, max_calls
+) -> None:
+    """Fail-fast and max_errors cancel pending cases instead of running them all."""
+    calls = 0
+
+    async def failing_completion(messages, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(
+        runner_module, "create_chat_completion_async", failing_completion
+    )
+    cases = [
+        BenchmarkCase(str(n), "gsm8k", f"What is {n} + {n}?", f"#### {n * 2}")
+        for n in range(20)
+    ]
+    runner = _ModelRunner(_group(), {"default": 0.5}, {"use_cache": False})
+
+    def run() -> dict:
+        return _run_method(
+            "raw",
+            cases,
+            runner,
+            None,
+            1,
+            True,
+            concurrency=concurrency,
+            dataset_name="gsm8k",
+            group_name="default",
+            log_every=None,
+            logger=None,
+            continue_on_error=continue_on_error,
+            max_errors=max_errors,
+            optimized_blocks=None,
+        )
+
+    if continue_on_error:
+        result = run()
+        assert result["aborted"] is True
+        assert result["error_count"] == result["total"] == max_errors
+    else:
+        with pytest.raises(RuntimeError, match="upstream down"):
+            run()
+    assert calls == max_calls
+
+
+def test_run_method_logs_progress_as_cases_complete(monkeypatch) -> None:
+    """Progress is reported while later cases are still waiting on the LM."""
+    progress: list[str] = []
+    release = asyncio.Event()
+
+    class RecordingLogger:
+        def isEnabledFor(self, level) -> bool:
+            return True
+
+        def info(self, message, *args) -> None:
+            progress.append(message % args)
+            release.set()
+
+        def error(self, message, *args) -> None:
+            pass
+
+    async def fake_completion(messages, **kwargs):
+        if "What is 2" in messages[0]["content"]:
+            await asyncio.wait_for(release.wait(), timeout=5)
+            assert len(progress) == 1
+        return {"choices": [{"message": {"content": "#### 2"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    cases = [
+        BenchmarkCase(str(n), "gsm8k", f"What is {n} + {n}?", f"#### {n * 2}")
+        for n in (1, 2)
+    ]
+    runner = _ModelRunner(_group(), {"default": 0.5}, {"use_cache": False})
+
+    result = _run_method(
+        "raw",
+        cases,
+        runner,
+        None,
+        1,
+        True,
+        concurrency=2,
+        dataset_name="gsm8k",
+        group_name="default",
+        log_every=1,
+        logger=RecordingLogger(),
+        continue_on_error=False,
+        max_errors=None,
+        optimized_blocks=None,
+    )
+
+    assert result["total"] == 2
+    assert progress[0].endswith("1/2 (50.0%)")
+    assert progress[1].endswith("2/2 (100.0%)")
+    assert [sample["case_id"] for sample in result["samples"]] == ["1", "2"]
+
+
+def test_run_method_works_inside_a_running_event_loop(monkeypatch) -> None:
+    """Async callers (notebooks, services) can still run a benchmark method."""
+
+    async def fake_completion(messages, **kwargs):
+        return {"choices": [{"message": {"content": "#### 2"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    cases = [BenchmarkCase("1", "gsm8k", "What is 1 + 1?", "#### 2")]
+    runner = _ModelRunner(_group(), {"default": 0.5}, {"use_cache": False})
+
+    async def caller() -> dict:
+        return _run_method(
+            "raw",
+            cases,
+            runner,
+            None,
+            1,
+            False,
+            dataset_name="gsm8k",
+            group_name="default",
+            log_every=None,
+            logger=None,
+            continue_on_error=False,
+            max_errors=None,
+            optimized_blocks=None,
+        )
+
+    result = asyncio.run(caller())
+
+    assert result["correct"] == result["total"] == 1
+
+
+def test_mpp_runner_builds_one_adapter_across_threads(monkeypatch) -> None:
+    """Worker threads racing on new blocks share a single adapter."""
+    built: list[dict] = []
+    barrier = threading.Barrier(4)
+
+    class FakeAdapter:
+        def __init__(self, **kwargs) -> None:
+            time.sleep(0.01)
+            built.append(kwargs)
+
+    monkeypatch.setattr(runner_module, "MPPAutoAdapter", FakeAdapter)
+    monkeypatch.setattr(runner_module, "LangdockLM", lambda **kwargs: kwargs)
+    mpp_runner = _MPPRunner(_group(), None, None, {}, None)
+
+    def adapter_for(_index: int) -> FakeAdapter:
+        barrier.wait()
+        return mpp_runner._adapter_for({"qa_primer": "Check."})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        adapters = list(pool.map(adapter_for, range(4)))
+
+    assert len(built) == 1
+    assert all(adapter is adapters[0] for adapter in adapters)
+
+
+def test_mpp_runner_reuses_adapter_per_blocks(monkeypatch) -> None:
+    """One adapter is built per distinct set of prompt blocks."""
+    built: list[dict] = []
+
+    class FakeAdapter:
+        def __init__(self, **kwargs) -> None:
+            built.append(kwargs)
+
+        def __call__(self, *, user_goal, open_world):
+            return type("Result", (), {"decoded_bundle": {"goal": user_goal}})()
+
+    monkeypatch.setattr(runner_module, "MPPAutoAdapter", FakeAdapter)
+    monkeypatch.setattr(runner_module, "LangdockLM", lambda **kwargs: kwargs)
+    mpp_runner = _MPPRunner(
+        _group(), {"qa_primer": "Check."}, {"qa_primer": "Verify."}, {}, None
+    )
+    case = BenchmarkCase("1", "gsm8k", "What is 1 + 1?", "#### 2")
+
+    for _ in range(3):
+        mpp_runner.run(case, optimized=False)
+    mpp_runner.run(case, optimized=True)
+    mpp_runner.run(case, optimized=False, blocks_override={"qa_primer": "Check."})
+
+    assert [kwargs["qa_role_instructions"] for kwargs in built] == [
+        "Check.",
+        "Verify.",
+    ]
+
+
+def test_mpp_runner_lms_bypass_the_result_cache(monkeypatch) -> None:
+    """MPP stability loops resample, so their LMs never read the disk cache."""
+    monkeypatch.setattr(runner_module, "LangdockLM", lambda **kwargs: kwargs)
+
+    mpp_runner = _MPPRunner(_group(), None, None, {"use_cache": True}, None)
+
+    lms = (mpp_runner.architect_lm, mpp_runner.executor_lm, mpp_runner.qa_lm)
+    assert [lm["use_cache"] for lm in lms] == [False, False, False]
+
+
+def test_mpp_runner_serializes_bundles_as_utf8_json(monkeypatch) -> None:
+    """Structured bundles become compact JSON without escaping non-ASCII text."""
+    bundles = iter([{"answer": "π ≈ 3.14"}, "```\nplain\n```"])
+
+    class FakeAdapter:
+        def __init__(self, **kwargs) -> None:
+            pass
+
+        def __call__(self, *, user_goal, open_world):
+            return type("Result", (), {"decoded_bundle": next(bundles)})()
+
+    monkeypatch.setattr(runner_module, "MPPAutoAdapter", FakeAdapter)
+    monkeypatch.setattr(runner_module, "LangdockLM", lambda **kwargs: kwargs)
+    mpp_runner = _MPPRunner(_group(), None, None, {}, None)
+    case = BenchmarkCase("1", "math", "Approximate pi.", "3.14")
+
+    assert mpp_runner.run(case, optimized=False) == '{"answer":"π ≈ 3.14"}'
+    assert mpp_runner.run(case, optimized=False) == "plain"
+
+
+def test_run_method_streams_samples_to_sink(monkeypatch, tmp_path) -> None:
+    """Samples are written as JSON lines to the sink instead of kept in memory."""
+
+    async def fake_completion(messages, **kwargs):
+        return {"choices": [{"message": {"content": "#### 4"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    cases = [
+        BenchmarkCase(str(n), "gsm8k", f"What is {n} + {n}?", f"#### {n * 2}")
+        for n in range(1, 4)
+    ]
+    runner = _ModelRunner(_group(), {"default": 0.5}, {"use_cache": False})
+    sink_path = tmp_path / "samples.jsonl"
+
+    with sink_path.open("wb") as sink:
+        result = _run_method(
+            "raw",
+            cases,
+            runner,
+            None,
+            1,
+            True,
+            concurrency=2,
+            dataset_name="gsm8k",
+            group_name="default",
+            log_every=None,
+            logger=None,
+            continue_on_error=False,
+            max_errors=None,
+            optimized_blocks=None,
+            samples_sink=sink,
+        )
+
+    lines = sink_path.read_text(encoding="utf-8").splitlines()
+    assert "samples" not in result
+    assert [json.loads(line)["case_id"] for line in lines] == ["1", "2", "3"]
+    assert [json.loads(line)["correct"] for line in lines] == [False, True, False]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"choices": [{"message": {"content": "hello"}}]},
+        {"choices": [{"text": "hello"}]},
+        {"result": {"message": {"content": "hello"}}},
+        [{"content": "hello"}],
+        "hello",
+    ],
+)
+def test_assistant_text_handles_response_shapes(response) -> None:
+    """The fast path and the fallback walker extract the same assistant text."""
+    assert _assistant_text(response) == "hello"
+
+
+def test_records_and_report_round_trip(tmp_path) -> None:
+    """JSONL records load line by line and reports are written as indented JSON."""
+    records_path = tmp_path / "cases.jsonl"
+    records_path.write_text(
+        '{"question": "Q1", "answer": "#### 1"}\n\n{"question": "Q2", "answer": "2"}\n',
+        encoding="utf-8",
+    )
+    report_path = tmp_path / "out" / "report.json"
+
+    records = _read_records(records_path)
+    _write_report({"results": records, "note": "café"}, report_path)
+
+    assert [record["question"] for record in records] == ["Q1", "Q2"]
+    assert json.loads(report_path.read_text(encoding="utf-8"))["note"] == "café"
+    assert report_path.read_text(encoding="utf-8").startswith('{\n  "results"')
+
+
+def test_few_shot_prompt_reuses_rendered_prefix() -> None:
+    """The few-shot examples are rendered once per dataset and reused per case."""
+    _few_shot_prefix.cache_clear()
+    cases = [BenchmarkCase(str(n), "math", f"Compute {n}.", "", {}) for n in range(3)]
+
+    prompts = [_build_few_shot_prompt(case) for case in cases]
+
+    assert _few_shot_prefix.cache_info().misses == 1
+    assert prompts[0] == (
+        "Q: Compute 2 + 5.\n\nA: Solution: 2 + 5 = 7. Final: \\boxed{7}.\n\n"
+        "Q: Compute 10 - 3.\n\nA: Solution: 10 - 3 = 7. Final: \\boxed{7}.\n\n"
+        "Return the final answer in \\boxed{...}.\n\n"
+        "Q: Compute 0.\n\nA:"
+    )
+
+
+def test_self_consistency_returns_first_output_of_majority_answer() -> None:
+    """The majority answer wins and its first sampled output is returned."""
+    outputs = iter(["x #### 3", "y #### 4", "z #### 4", "w #### 3", "v #### 4"])
+
+    class _Runner:
+        def is_deterministic(self, method: str) -> bool:
+            return False
+
+        async def agenerate(self, prompt: str, method: str) -> str:
+            return next(outputs)
+
+    case = BenchmarkCase("1", "gsm8k", "What is 2 + 2?", "#### 4", {})
+
+    result = asyncio.run(_run_self_consistency(case, _Runner(), 5))
+
+    assert result == "y #### 4"
+
+
+def test_self_consistency_stops_once_the_majority_is_decided() -> None:
+    """Samples are drawn in waves and stop when the leader cannot be overtaken."""
+    calls: list[str] = []
+
+    class _Runner:
+        def is_deterministic(self, method: str) -> bool:
+            return False
+
+        async def agenerate(self, prompt: str, method: str) -> str:
+            calls.append(prompt)
+            return "#### 4"
+
+    case = BenchmarkCase("1", "gsm8k", "What is 2 + 2?", "#### 4")
+
+    result = asyncio.run(_run_self_consistency(case, _Runner(), 5))
+
+    assert result == "#### 4"
+    assert len(calls) == 3
+
+
+def test_self_consistency_concurrency_caps_in_flight_samples() -> None:
+    """A concurrency limit bounds how many samples are requested at once."""
+    outputs = iter(["#### 3", "#### 4", "#### 5", "#### 4", "#### 4"])
+    in_flight = 0
+    peak = 0
+
+    class _Runner:
+        def is_deterministic(self, method: str) -> bool:
+            return False
+
+        async def agenerate(self, prompt: str, method: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return next(outputs)
+
+    case = BenchmarkCase("1", "gsm8k", "What is 2 + 2?", "#### 4")
+
+    result = asyncio.run(_run_self_consistency(case, _Runner(), 5, concurrency=2))
+
+    assert result == "#### 4"
+    assert peak == 2
+
+
+def test_template_cache_reuses_predictions_for_repeated_questions(
+    monkeypatch,
+) -> None:
+    """Questions differing only in case and spacing share one sampled call."""
+    calls: list[dict] = []
+
+    async def fake_completion(messages, **kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": f"#### {len(calls)}"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    runner = _ModelRunner(
+        _group(), {"default": 0.7}, {"use_cache": False}, template_cache=True
+    )
+    first = BenchmarkCase("1", "gsm8k", "What is 2 + 2?", "#### 4")
+    second = BenchmarkCase("2", "gsm8k", "  what is 2 +  2?\n", "#### 4")
+
+    predictions = [
+        asyncio.run(_run_prompt_method("cot", case, runner, sc_samples=1))
+        for case in (first, second)
+    ]
+    other_method = asyncio.run(_run_prompt_method("raw", first, runner, sc_samples=1))
+
+    assert predictions == ["#### 1", "#### 1"]
+    assert other_method == "#### 2"
+    assert len(calls) == 2
+
+
+def test_self_consistency_at_zero_temperature_makes_one_call(monkeypatch) -> None:
+    """Deterministic self-consistency collapses to a single completion."""
+    calls: list[dict] = []
+
+    async def fake_completion(messages, **kwargs):
+        calls.append(kwargs)
+        return {"choices": [{"message": {"content": "#### 4"}}]}
+
+    monkeypatch.setattr(runner_module, "create_chat_completion_async", fake_completion)
+    runner = _ModelRunner(_group(), {"self_consistency": 0}, {"use_cache": False})
+    case = BenchmarkCase("1", "gsm8k", "What is 2 + 2?", "#### 4")
+
+    first = asyncio.run(_run_self_consistency(case, runner, 5))
+    second = asyncio.run(_run_self_consistency(case, runner, 5))
+
+    assert first == second == "#### 4"
+    assert len(calls) == 1
+
+
+def test_benchmark_case_is_slotted_with_optional_meta() -> None:
+    """Cases carry no per-instance dict and only game24 cases populate meta."""
+    case = _build_case("gsm8k", {"question": "Q", "answer": "#### 1"}, 0)
+    game = _build_case("game24", {"numbers": [4, 6, 1, 3]}, 1)
+
+    assert not hasattr(case, "__dict__")
+    assert case.meta is None
+    assert game.meta == {"numbers": [4, 6, 1, 3], "target": 24}
+
+
+def test_methods_override_skips_config_validation() -> None:
+    """An explicit methods override replaces, rather than re-validates, the config."""
+    config = {"methods": ["not-a-method"]}
+
+    updated = _apply_methods_config(
+        config, methods_override="raw,cot,mpp", skip_methods=["cot"]
+    )
+
+    assert updated["methods"] == ["raw", "mpp"]
+
+
+def test_read_records_stops_parsing_at_limit(tmp_path) -> None:
+    """Records past the limit are never parsed, so trailing junk is ignored."""
+    records_path = tmp_path / "cases.jsonl"
+    records_path.write_text(
+        '{"question": "Q1"}\n{"question": "Q2"}\nnot json\n', encoding="utf-8"
+    )
+
+    records = _read_records(records_path, limit=2)
+
+    assert [record["question"] for record in records] == ["Q1", "Q2"]
+
+
+def test_read_blocks_caches_until_file_changes(tmp_path) -> None:
+    """Blocks files are parsed once per modification and returned as fresh dicts."""
+    path = tmp_path / "blocks.json"
+    path.write_text('{"qa_primer": "Check."}', encoding="utf-8")
+
+    first = _read_blocks(path)
+    first["qa_primer"] = "mutated"
+    second = _read_blocks(path)
+    path.write_text('{"qa_primer": "Verify."}', encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    third = _read_blocks(path)
+
+    assert second == {"qa_primer": "Check."}
+    assert third == {"qa_primer": "Verify."}
+
+
+def test_no_cache_config_disables_persistent_cache() -> None:
+    """--no-cache overrides use_cache both at top level and in langdock settings."""
+    config = {"langdock": {"timeout": 5, "use_cache": True}}
+
+    settings = _load_langdock_settings(_apply_no_cache_config(config))
+
+    assert settings["use_cache"] is False
+    assert settings["timeout"] == 5.0
+    assert config["langdock"]["use_cache"] is True
+
+
+def test_langdock_settings_leave_the_persistent_cache_off_by_default() -> None:
+    """The cache is opt-in, matching LangdockLM(use_cache=False)."""
+    assert _load_langdock_settings({})["use_cache"] is False
+    assert _load_langdock_settings({"use_cache": True})["use_cache"] is True
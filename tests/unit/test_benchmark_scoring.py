@@ -3,9 +3,16 @@ from __future__ import annotations
 from mpp_dspy.benchmarks.runner import (
     BenchmarkCase,
     _extract_gsm8k_answer,
+    _extract_json_value,
     _extract_math_answer,
+    _gold_answer,
+    _normalize_math,
+    _normalize_text,
+    _parse_numbers,
+    _safe_eval,
     _score_case,
     _valid_game24,
+    _valid_game24_cached,
 )
 
 
@@ -33,3 +40,60 @@ def test_score_case_math() -> None:
         meta={},
     )
     assert _score_case(case, "Answer: \\\\boxed{42}")
+
+
+def test_parse_numbers_from_game24_question() -> None:
+    assert _parse_numbers("Numbers: 4, -7, 8, 8. Target: 24.") == [4, -7, 8, 8, 24]
+
+
+def test_normalize_math_ignores_whitespace_and_dollars() -> None:
+    assert _normalize_math("$\\frac{1}{ 2}$\n") == _normalize_math("\\frac{1}{2}")
+
+
+def test_safe_eval_is_exact_and_rejects_invalid_expressions() -> None:
+    assert _safe_eval("8/(3-8/3)") == 24
+    assert _safe_eval("-(2+3)*4") == -20
+    assert _safe_eval("4/(2-2)") is None
+    assert _safe_eval("(1+2") is None
+    assert _safe_eval("2**3") is None
+
+
+def test_extract_json_value_only_parses_objects() -> None:
+    assert _extract_json_value('  {"answer": 42}') == "42"
+    assert _extract_json_value("[42]") is None
+    assert _extract_json_value("{not json") is None
+    assert _extract_json_value('{"final": null, "answer": 7}') == "7"
+
+
+def test_game24_validation_is_memoized_across_number_orderings() -> None:
+    _valid_game24_cached.cache_clear()
+
+    first = _valid_game24("6 / (1 - 3/4)", [6, 4, 3, 1], 24)
+    second = _valid_game24("6/(1-3/4)", [1, 3, 4, 6], 24)
+
+    assert first and second
+    assert _valid_game24_cached.cache_info().hits == 1
+
+
+def test_normalize_text_strips_code_fences() -> None:
+    assert _normalize_text('```json\n{"a": 1}\n```\n') == '{"a": 1}'
+    assert _normalize_text("```\nline 1\nline 2\n```") == "line 1\nline 2"
+    assert _normalize_text("```\n```") == ""
+    assert _normalize_text("```inline```") == ""
+    assert _normalize_text("  plain  ") == "plain"
+
+
+def test_gold_answers_are_parsed_once_per_case() -> None:
+    _gold_answer.cache_clear()
+    case = BenchmarkCase("1", "gsm8k", "Add.", "Steps... #### 1,024")
+
+    results = [_score_case(case, f"#### {guess}") for guess in ("1024", "1,024", "7")]
+
+    assert results == [True, True, False]
+    assert _gold_answer.cache_info().misses == 1
+
+
+def test_game24_validation_requires_the_exact_number_multiset() -> None:
+    assert _valid_game24("8/(3-8/3)", [3, 3, 8, 8], 24)
+    assert not _valid_game24("8/(3-8/3)", [3, 3, 3, 8], 24)
+    assert not _valid_game24("8*3", [3, 3, 8, 8], 24)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+
+from mpp_dspy import mpp_optimizer
+from mpp_dspy.mpp_optimizer import MPPBundleOptimizer
+
+
+def test_bundle_refine_serializes_an_unchanged_bundle_once(
+    monkeypatch, mpp_bundle_minimal
+) -> None:
+    """Retries after architect errors reuse the previous bundle's JSON text."""
+    serialized = []
+    prompts = []
+    original = mpp_optimizer._bundle_text
+
+    def counting_bundle_text(bundle):
+        serialized.append(bundle)
+        return original(bundle)
+
+    def architect(*, user_goal: str):
+        prompts.append(user_goal)
+        if len(prompts) == 1:
+            raise RuntimeError("transient")
+        return mpp_bundle_minimal
+
+    monkeypatch.setattr(mpp_optimizer, "_bundle_text", counting_bundle_text)
+
+    result = MPPBundleOptimizer(max_iters=3).refine(
+        architect, "Run a small test.", previous_bundle=mpp_bundle_minimal
+    )
+
+    assert result.stable is True
+    assert len(serialized) == 1
+    bundle_text = original(mpp_bundle_minimal)
+    assert all(bundle_text in prompt for prompt in prompts)
+
+
+def test_bundle_text_is_compact_and_key_order_insensitive() -> None:
+    """Previous bundles are fed back compactly, without escaping non-ASCII."""
+    reordered = {"b": [1, 2], "a": {"y": "\u00e9", "x": None}}
+
+    assert mpp_optimizer._bundle_text(reordered) == (
+        '{"a":{"x":null,"y":"\u00e9"},"b":[1,2]}'
+    )
+
+
+def test_refine_many_refines_independent_goals_concurrently(
+    mpp_bundle_minimal,
+) -> None:
+    """Each goal's refinement chain runs on its own worker, in input order."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def architect(*, user_goal: str):
+        barrier.wait()
+        version = "alpha" if "alpha" in user_goal else "beta"
+        return {**mpp_bundle_minimal, "meta_protocol_version": version}
+
+    optimizer = MPPBundleOptimizer(max_iters=3, validate_bundle=lambda _b: None)
+
+    results = optimizer.refine_many(architect, ["goal alpha", "goal beta"])
+
+    assert [r.bundle["meta_protocol_version"] for r in results] == ["alpha", "beta"]
+    assert all(r.stable and r.iterations == 2 for r in results)
@@ -1,16 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 from typing import Any
 
 import pytest
 
 
-def test_closed_world_qa_failure_triggers_retry(mpp_bundle_minimal) -> None:
+def test_closed_world_qa_failure_triggers_retry(
+    mpp_bundle_minimal, monkeypatch
+) -> None:
     """Closed-world QA failure should trigger another outer cycle."""
 
     dspy = pytest.importorskip("dspy")
+    from mpp_dspy import mpp_auto_adapter
     from mpp_dspy.mpp_auto_adapter import MPPAutoAdapter
 
+    executor_adapters = []
+
+    class CountingExecutorAdapter(mpp_auto_adapter.MPPExecutorAdapter):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            executor_adapters.append(self)
+
+    monkeypatch.setattr(mpp_auto_adapter, "MPPExecutorAdapter", CountingExecutorAdapter)
+
+    qa_adapters = []
+
+    class CountingQAAdapter(mpp_auto_adapter.MPPQAAdapter):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            qa_adapters.append(self)
+
+    monkeypatch.setattr(mpp_auto_adapter, "MPPQAAdapter", CountingQAAdapter)
+
     class DummyArchitect(dspy.Module):
         def forward(self, *, user_goal: str):  # noqa: ARG002
             return mpp_bundle_minimal
@@ -54,3 +77,199 @@ def test_closed_world_qa_failure_triggers_retry(mpp_bundle_minimal) -> None:
     result = program(user_goal="x", open_world=False)
     assert result.qa_passed is True
     assert qa_calls["count"] == 2
+    # Adapters are built once per forward; QA follows the current bundle.
+    assert len(executor_adapters) == 1
+    assert len(qa_adapters) == 1
+    assert qa_adapters[0].bundle == mpp_bundle_minimal
+
+
+def test_async_forward_overlaps_independent_goals(mpp_bundle_minimal) -> None:
+    """acall runs the blocking pipeline off the event loop, so goals overlap."""
+
+    dspy = pytest.importorskip("dspy")
+    from mpp_dspy.mpp_auto_adapter import MPPAutoAdapter
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class DummyArchitect(dspy.Module):
+        def forward(self, *, user_goal: str):  # noqa: ARG002
+            barrier.wait()
+            return mpp_bundle_minimal
+
+    class DummyExecutor(dspy.Module):
+        def forward(self, *, bundle_text: str):  # noqa: ARG002
+            return {"decoded_bundle": "ok"}
+
+    class DummyQA(dspy.Module):
+        def forward(self, **_kwargs: Any):
+            return {"verdict": "pass", "issues": [], "repair_examples": []}
+
+    program = MPPAutoAdapter(
+        architect=DummyArchitect(),
+        executor=DummyExecutor(),
+        qa=DummyQA(),
+        max_iters=2,
+    )
+
+    async def run_both():
+        return await asyncio.gather(
+            program.acall(user_goal="a", open_world=False),
+            program.acall(user_goal="b", open_world=False),
+        )
+
+    results = asyncio.run(run_both())
+    assert [result.qa_passed for result in results] == [True, True]
+
+
+def test_response_cache_replays_identical_calls(mpp_bundle_minimal) -> None:
+    """Opt-in caching reuses predictor results for byte-identical requests."""
+
+    dspy = pytest.importorskip("dspy")
+    from mpp_dspy import mpp_auto_adapter
+    from mpp_dspy.mpp_auto_adapter import MPPAutoAdapter
+
+    calls = {"architect": 0, "executor": 0, "qa": 0}
+
+    class DummyArchitect(dspy.Module):
+        def forward(self, *, user_goal: str):  # noqa: ARG002
+            calls["architect"] += 1
+            return mpp_bundle_minimal
+
+    class DummyExecutor(dspy.Module):
+        def forward(self, *, bundle_text: str):  # noqa: ARG002
+            calls["executor"] += 1
+            return {"decoded_bundle": "ok"}
+
+    class DummyQA(dspy.Module):
+        def forward(self, **_kwargs: Any):
+            calls["qa"] += 1
+            return {"verdict": "pass", "issues": [], "repair_examples": []}
+
+    mpp_auto_adapter._RESPONSE_CACHE.clear()
+    program = MPPAutoAdapter(
+        architect=DummyArchitect(),
+        executor=DummyExecutor(),
+        qa=DummyQA(),
+        max_iters=2,
+        enable_response_cache=True,
+    )
+
+    first = program(user_goal="cache me", open_world=False)
+    after_first = dict(calls)
+    second = program(user_goal="cache me", open_world=False)
+
+    assert first.qa_passed is second.qa_passed is True
+    assert calls == after_first == {"architect": 2, "executor": 1, "qa": 1}
+    mpp_auto_adapter._RESPONSE_CACHE.clear()
+
+
+def test_response_cache_returns_independent_copies() -> None:
+    """Mutating a replayed prediction does not corrupt the cached entry."""
+
+    dspy = pytest.importorskip("dspy")
+    from mpp_dspy import mpp_auto_adapter
+    from mpp_dspy.dspy_adapters import MPPQAAdapter
+
+    calls = []
+
+    def predictor(**kwargs: Any):
+        calls.append(kwargs)
+        return dspy.Prediction(verdict="pass", issues=[])
+
+    mpp_auto_adapter._RESPONSE_CACHE.clear()
+    call = mpp_auto_adapter._wrap_with_adapter(
+        predictor, MPPQAAdapter(spec_text="spec"), cache=True
+    )
+
+    first = call(bundle_text="b")
+    first.issues.append("mutated")
+    second = call(bundle_text="b")
+    second.verdict = "fail"
+    third = call(bundle_text="b")
+
+    assert len(calls) == 1
+    assert second.issues == []
+    assert third.verdict == "pass"
+    assert third.issues == []
+    mpp_auto_adapter._RESPONSE_CACHE.clear()
+
+
+def test_feedback_reasoning_strip_is_memoized() -> None:
+    """Identical failing responses are only parsed once for feedback."""
+
+    pytest.importorskip("dspy")
+    from mpp_dspy.mpp_auto_adapter import _strip_reasoning_for_feedback
+
+    _strip_reasoning_for_feedback.cache_clear()
+    response = '```json\n{"reasoning": "r", "final": {"value": 1}}\n```'
+
+    first = _strip_reasoning_for_feedback(response)
+    second = _strip_reasoning_for_feedback(response)
+
+    assert first == second == '{\n  "final": {\n    "value": 1\n  }\n}'
+    assert _strip_reasoning_for_feedback.cache_info().hits == 1
+    assert _strip_reasoning_for_feedback("not json ") == "not json "
+
+
+def test_feedback_reasoning_strip_keeps_ascii_indented_json() -> None:
+    """Fast and fallback encoders agree on the indented, ASCII-only output."""
+
+    pytest.importorskip("dspy")
+    from mpp_dspy.mpp_auto_adapter import _strip_reasoning_for_feedback
+
+    _strip_reasoning_for_feedback.cache_clear()
+    response = '{"rationale": "r", "final": {"text": "olá", "big": 2e400, "n": []}}'
+    loose = '{"final": NaN, "reasoning": "r"}'
+
+    assert _strip_reasoning_for_feedback(response) == (
+        '{\n  "final": {\n    "text": "ol\\u00e1",\n'
+        '    "big": Infinity,\n    "n": []\n  }\n}'
+    )
+    assert _strip_reasoning_for_feedback(loose) == '{\n  "final": NaN\n}'
+
+
+def test_first_cycle_success_skips_further_architect_cycles(
+    mpp_bundle_minimal, monkeypatch
+) -> None:
+    """A passing first cycle returns without re-wiring QA or re-running it."""
+
+    dspy = pytest.importorskip("dspy")
+    from mpp_dspy import mpp_auto_adapter
+    from mpp_dspy.mpp_auto_adapter import MPPAutoAdapter
+
+    qa_adapters = []
+
+    class CountingQAAdapter(mpp_auto_adapter.MPPQAAdapter):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            qa_adapters.append(self)
+
+    monkeypatch.setattr(mpp_auto_adapter, "MPPQAAdapter", CountingQAAdapter)
+
+    class DummyArchitect(dspy.Module):
+        def forward(self, *, user_goal: str):  # noqa: ARG002
+            return mpp_bundle_minimal
+
+    class DummyExecutor(dspy.Module):
+        def forward(self, *, bundle_text: str):  # noqa: ARG002
+            return {"decoded_bundle": "ok"}
+
+    qa_calls = {"count": 0}
+
+    class DummyQA(dspy.Module):
+        def forward(self, **_kwargs: Any):
+            qa_calls["count"] += 1
+            return {"verdict": "pass", "issues": [], "repair_examples": []}
+
+    program = MPPAutoAdapter(
+        architect=DummyArchitect(),
+        executor=DummyExecutor(),
+        qa=DummyQA(),
+        max_iters=5,
+    )
+
+    result = program(user_goal="x", open_world=False)
+
+    assert result.architect_cycles == 1
+    assert qa_calls["count"] == 1
+    assert len(qa_adapters) == 1
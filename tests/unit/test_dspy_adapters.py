@@ -0,0 +1,69 @@
+import os
+
+import dspy
+
+from mpp_dspy.dspy_adapters import (
+    MPPExecutorAdapter,
+    MPPQAAdapter,
+    _read_spec_file,
+    _read_spec_file_cached,
+)
+
+
+class _Echo(dspy.Signature):
+    """Echo the request."""
+
+    request: str = dspy.InputField()
+    response: str = dspy.OutputField()
+
+
+def test_adapters_share_one_spec_read_and_a_static_task_description(
+    tmp_path,
+) -> None:
+    spec_path = tmp_path / "spec.md"
+    spec_path.write_text("Spec v1\n", encoding="utf-8")
+    _read_spec_file_cached.cache_clear()
+
+    first = MPPExecutorAdapter(spec_path=spec_path)
+    second = MPPQAAdapter(spec_path=spec_path, bundle={"goal": "per-case"})
+
+    assert first.spec_text == second.spec_text == "Spec v1"
+    assert _read_spec_file_cached.cache_info().misses == 1
+    description = second.format_task_description(_Echo)
+    assert description.startswith("MPP specification:\nSpec v1")
+    assert "per-case" not in description
+
+
+def test_spec_file_edits_are_reloaded(tmp_path) -> None:
+    spec_path = tmp_path / "spec.md"
+    spec_path.write_text("Spec v1\n", encoding="utf-8")
+    _read_spec_file_cached.cache_clear()
+
+    first = MPPExecutorAdapter(spec_path=spec_path)
+    spec_path.write_text("Spec v2\n", encoding="utf-8")
+    mtime_ns = spec_path.stat().st_mtime_ns + 1_000_000
+    os.utime(spec_path, ns=(mtime_ns, mtime_ns))
+    second = MPPExecutorAdapter(spec_path=spec_path)
+
+    assert first.spec_text == "Spec v1"
+    assert second.spec_text == "Spec v2"
+
+
+def test_missing_spec_file_is_not_cached(tmp_path) -> None:
+    spec_path = tmp_path / "spec.md"
+
+    assert _read_spec_file(spec_path) == ""
+    spec_path.write_text("Spec\n", encoding="utf-8")
+    assert _read_spec_file(spec_path) == "Spec"
+
+
+def test_task_description_is_cached_until_instructions_change() -> None:
+    adapter = MPPExecutorAdapter(spec_text="Spec", role_instructions="Be terse.")
+
+    first = adapter.format_task_description(_Echo)
+    second = adapter.format_task_description(_Echo)
+    adapter.role_instructions = "Be thorough."
+    third = adapter.format_task_description(_Echo)
+
+    assert first is second
+    assert third.endswith("Be thorough.\n\nEcho the request.")
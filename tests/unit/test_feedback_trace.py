@@ -21,3 +21,59 @@ def test_feedback_trace_serializes_stably() -> None:
     assert text.startswith('{"events":[{"executor_iterations":2,')
     assert '"kind":"qa_failed"' in text
     assert text.endswith('}],"version":"1"}')
+
+
+def test_feedback_trace_appended_render_matches_fresh_render() -> None:
+    events = [
+        FeedbackEvent(kind="qa_failed", summary="Missing ünits.", qa_issues=["a"]),
+        FeedbackEvent(kind="executor_nonconvergent", summary="Drifted."),
+        FeedbackEvent(kind="bundle_invalid", summary='Bad "version" key.'),
+    ]
+    trace = FeedbackTrace()
+    trace.to_prompt_text()
+    for event in events:
+        trace = trace.append(event)
+        trace.to_prompt_text()
+
+    assert trace.to_prompt_text() == FeedbackTrace(events=events).to_prompt_text()
+    assert "\\u00fc" in trace.to_prompt_text()
+
+
+def test_feedback_trace_render_tracks_event_changes() -> None:
+    first = FeedbackEvent(kind="qa_failed", summary="First.")
+    second = FeedbackEvent(kind="qa_failed", summary="Second.")
+    trace = FeedbackTrace(events=[first])
+    before = trace.to_prompt_text()
+
+    trace.events.append(second)
+    after = trace.to_prompt_text()
+
+    assert before != after
+    assert after == FeedbackTrace(events=[first, second]).to_prompt_text()
+    assert trace.to_prompt_text() is after
+
+
+def test_feedback_event_from_execution_result_matches_validated_event() -> None:
+    class _ExecResult:
+        qa_result = {"verdict": "fail", "issues": ["bad"], "repair_examples": [1]}
+        iterations = 3
+        stable = False
+        decoded_bundle = "out"
+
+    event = FeedbackEvent.from_execution_result(_ExecResult())
+
+    assert event == FeedbackEvent.model_validate(event.model_dump())
+    assert event.qa_repair_examples == ["1"]
+    assert event.executor_refinements == 2
+
+
+def test_feedback_trace_append_shares_events_and_keeps_parent_intact() -> None:
+    first = FeedbackEvent(kind="qa_failed", summary="First.")
+    second = FeedbackEvent(kind="qa_failed", summary="Second.")
+    parent = FeedbackTrace().append(first)
+
+    child = parent.append(second)
+
+    assert parent.events == [first]
+    assert child.events[0] is first
+    assert child.events[1] is second
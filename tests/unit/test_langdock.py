@@ -0,0 +1,569 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+import weakref
+from email.message import Message
+
+import httpx
+import pytest
+
+from mpp_dspy.benchmarks import langdock
+
+
+async def _skip_async_prewarm() -> None:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def langdock_api_key(monkeypatch, tmp_path):
+    """Provide a test API key, an isolated cache, no prewarming and fresh headers."""
+    monkeypatch.setenv("LANGDOCK_API_KEY", "test-key")
+    monkeypatch.setenv("LANGDOCK_CACHE_DIR", str(tmp_path / "langdock-cache"))
+    monkeypatch.setattr(langdock, "_CACHE", None)
+    monkeypatch.setattr(langdock, "_WARMED", True)
+    monkeypatch.setattr(langdock, "_ASYNC_CLIENTS", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(langdock, "_aprewarm_client", _skip_async_prewarm)
+    langdock._langdock_api_key.cache_clear()
+    langdock._request_headers.cache_clear()
+    langdock._make_poster.cache_clear()
+    yield
+    if langdock._CACHE is not None:
+        langdock._CACHE.close()
+    langdock._langdock_api_key.cache_clear()
+    langdock._request_headers.cache_clear()
+    langdock._make_poster.cache_clear()
+
+
+@pytest.fixture()
+def langdock_transport(monkeypatch):
+    """Route the pooled Langdock client through a recording mock transport."""
+    requests: list[httpx.Request] = []
+    responses: list[httpx.Response] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses.pop(0)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_CLIENT", client)
+    monkeypatch.setattr(langdock.time, "sleep", lambda _delay: None)
+    yield requests, responses
+    client.close()
+
+
+def _completion(content: str) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"choices": [{"message": {"content": content}}], "model": "m"},
+    )
+
+
+def test_post_reuses_pooled_client(langdock_transport) -> None:
+    """Sequential calls go through the same pooled client with auth headers."""
+    requests, responses = langdock_transport
+    responses.extend([_completion("a"), _completion("b")])
+
+    first = langdock._post("/chat/completions", {"messages": []})
+    second = langdock._post("/chat/completions", {"messages": []})
+
+    assert first["choices"][0]["message"]["content"] == "a"
+    assert second["choices"][0]["message"]["content"] == "b"
+    assert len(requests) == 2
+    assert requests[0].headers["Authorization"] == "Bearer test-key"
+    assert str(requests[0].url).endswith("/chat/completions")
+
+
+def test_pooled_client_is_created_once_across_threads(monkeypatch) -> None:
+    """Threads racing on first use share a single pooled client."""
+    created: list[httpx.Client] = []
+    barrier = threading.Barrier(4)
+
+    def new_client() -> httpx.Client:
+        client = httpx.Client()
+        created.append(client)
+        return client
+
+    def first_use(_index: int) -> httpx.Client:
+        barrier.wait()
+        return langdock._client()
+
+    monkeypatch.setattr(langdock, "_CLIENT", None)
+    monkeypatch.setattr(langdock, "_new_client", new_client)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        clients = list(pool.map(first_use, range(4)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+    created[0].close()
+
+
+def test_post_retries_retryable_status(langdock_transport) -> None:
+    """Retryable HTTP statuses are retried before returning the response."""
+    requests, responses = langdock_transport
+    responses.extend([httpx.Response(429, text="slow down"), _completion("ok")])
+
+    result = langdock._post("/chat/completions", {"messages": []}, retries=1)
+
+    assert result["choices"][0]["message"]["content"] == "ok"
+    assert len(requests) == 2
+
+
+def test_post_raises_when_no_attempts_are_made(langdock_transport) -> None:
+    """A negative retry budget raises instead of silently returning None."""
+    requests, _responses = langdock_transport
+
+    async def apost() -> dict:
+        try:
+            return await langdock._apost("/chat/completions", {}, retries=-1)
+        finally:
+            await langdock.aclose_async_client()
+
+    with pytest.raises(langdock.LangdockAPIError, match="retries=-1"):
+        langdock._post("/chat/completions", {"messages": []}, retries=-1)
+    with pytest.raises(langdock.LangdockAPIError, match="retries=-1"):
+        asyncio.run(apost())
+    assert requests == []
+
+
+def test_create_chat_completion_falls_back_on_forbidden(langdock_transport) -> None:
+    """A 403 on the primary model moves on to the next fallback model."""
+    requests, responses = langdock_transport
+    responses.extend([httpx.Response(403, text="denied"), _completion("ok")])
+
+    result = langdock.create_chat_completion(
+        [{"role": "user", "content": "hi"}],
+        model="primary",
+        assistant_name="test",
+        assistant_instructions="",
+        fallback_models=["backup"],
+    )
+
+    assert result["choices"][0]["message"]["content"] == "ok"
+    assert json.loads(requests[1].content)["assistant"]["model"] == "backup"
+
+
+def test_langdock_lm_refreshes_model_candidates(langdock_transport) -> None:
+    """Model candidates are precomputed and refreshed when the model changes."""
+    requests, responses = langdock_transport
+    responses.append(_completion("ok"))
+    lm = langdock.LangdockLM(model="primary", fallback_models=["backup", "primary"])
+
+    before = list(lm._model_candidates)
+    lm.forward(prompt="hi")
+
+    assert before == ["primary", "backup"]
+    assert json.loads(requests[0].content)["assistant"]["model"] == "primary"
+    assert lm.model == "m"
+    assert lm._model_candidates == ["m", "backup", "primary"]
+
+
+def test_async_langdock_lm_aforward(monkeypatch) -> None:
+    """AsyncLangdockLM.aforward retries and returns text via the async client."""
+    responses = [httpx.Response(429, text="slow down"), _completion("async-ok")]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_new_async_client", lambda: client)
+    lm = langdock.AsyncLangdockLM(model="m", max_concurrency=2)
+
+    async def run() -> langdock._LangdockResponse:
+        try:
+            return await lm.aforward(prompt="hi", base_delay=0.0)
+        finally:
+            await langdock.aclose_async_client()
+
+    response = asyncio.run(run())
+
+    assert response.choices[0].message.content == "async-ok"
+    assert not langdock._ASYNC_CLIENTS
+
+
+def test_async_langdock_lm_is_reusable_across_event_loops(monkeypatch) -> None:
+    """Each event loop gets its own pooled client and concurrency limit."""
+    clients: list[httpx.AsyncClient] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return _completion("ok")
+
+    def new_async_client() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(langdock, "_new_async_client", new_async_client)
+    lm = langdock.AsyncLangdockLM(model="m", max_concurrency=1)
+
+    async def run() -> list[str]:
+        responses = await asyncio.gather(
+            lm.aforward(prompt="a"), lm.aforward(prompt="b")
+        )
+        return [response.choices[0].message.content for response in responses]
+
+    first = asyncio.run(run())
+    second = asyncio.run(run())
+
+    assert first == second == ["ok", "ok"]
+    assert len(clients) == 2 and clients[0] is not clients[1]
+
+
+@pytest.mark.parametrize("attempt", [0, 3])
+def test_backoff_delay_is_jittered(attempt: int) -> None:
+    """Backoff delays are spread over [0, base_delay * 2**attempt]."""
+    delays = [langdock._backoff_delay(attempt, 1.0, 30.0) for _ in range(50)]
+
+    assert all(0.0 <= delay <= 2**attempt for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_delay_is_capped() -> None:
+    """Backoff delays never exceed max_delay."""
+    delays = [langdock._backoff_delay(10, 1.0, 5.0) for _ in range(50)]
+
+    assert max(delays) <= 5.0
+
+
+def test_load_dotenv_respects_existing_environment(tmp_path, monkeypatch) -> None:
+    """.env values fill missing variables, strip quotes and skip comments."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment=ignored\n"
+        "MPP_TEST_QUOTED = 'quoted value'\n"
+        "MPP_TEST_PRESET=from-file\n"
+        "MPP_TEST_PLAIN=plain\r\n"
+        "MPP_TEST_PLAIN=duplicate\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setenv("MPP_TEST_PRESET", "from-env")
+    for key in ("MPP_TEST_QUOTED", "MPP_TEST_PLAIN", "comment"):
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+
+    langdock._load_dotenv(env_file)
+
+    assert langdock.os.environ["MPP_TEST_QUOTED"] == "quoted value"
+    assert langdock.os.environ["MPP_TEST_PRESET"] == "from-env"
+    assert langdock.os.environ["MPP_TEST_PLAIN"] == "plain"
+    assert "comment" not in langdock.os.environ
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"choices": [{"message": {"content": "hello"}}]},
+        {"choices": [{"text": "hello"}]},
+        {"data": {"choices": [{"message": {"content": "hello"}}]}},
+        [{"message": {"content": "hello"}}],
+    ],
+)
+def test_assistant_text_handles_response_shapes(response) -> None:
+    """The fast path and the fallback walker extract the same assistant text."""
+    text = langdock._assistant_text(response)
+
+    assert text == "hello"
+
+
+def test_message_content_stringifies_non_text_parts() -> None:
+    """Text parts are joined and non-text parts are stringified without JSON."""
+    image = {"type": "image", "alt": "café"}
+    content = [{"type": "text", "text": "caption"}, image]
+
+    text = langdock._message_content_to_text(content)
+    single = langdock._message_content_to_text([{"type": "text", "text": "solo"}])
+
+    assert text == f"caption\n{image}"
+    assert single == "solo"
+
+
+def test_normalize_messages_fills_instruction_budget_with_system_text() -> None:
+    """Oversized system context keeps the instructions and spills into user content."""
+    head = "a" * (langdock.MAX_ASSISTANT_INSTRUCTIONS - len("Be brief.\n\n"))
+    system_text = f"{head}tail"
+    messages = [
+        {"role": "system", "content": system_text},
+        {"role": "user", "content": "hi"},
+    ]
+
+    normalized, instructions = langdock._normalize_messages(messages, "Be brief.")
+
+    assert instructions == f"Be brief.\n\n{head}"
+    assert len(instructions) == langdock.MAX_ASSISTANT_INSTRUCTIONS
+    assert normalized[0] == {"role": "user", "content": "System context:\ntail"}
+    assert normalized[1] == {"role": "user", "content": "hi"}
+
+
+def test_normalize_messages_truncates_oversized_instructions() -> None:
+    """Instructions that fill the budget on their own move system text to users."""
+    oversized = "i" * (langdock.MAX_ASSISTANT_INSTRUCTIONS + 1)
+    messages = [
+        {"role": "system", "content": "Use JSON."},
+        {"role": "user", "content": "hi"},
+    ]
+
+    normalized, instructions = langdock._normalize_messages(messages, oversized)
+
+    assert instructions == oversized[: langdock.MAX_ASSISTANT_INSTRUCTIONS]
+    assert normalized[0] == {"role": "user", "content": "System context:\nUse JSON."}
+
+
+def test_normalize_messages_merges_system_text_into_instructions() -> None:
+    """Short system messages are appended to the assistant instructions."""
+    messages = [
+        {"role": "system", "content": "Use JSON."},
+        {"role": "developer", "content": ""},
+        {"role": "user", "content": "hi"},
+    ]
+
+    normalized, instructions = langdock._normalize_messages(messages, "Be brief.")
+
+    assert instructions == "Be brief.\n\nUse JSON."
+    assert normalized == [{"role": "user", "content": "hi"}]
+
+
+def test_post_falls_back_to_urllib_opener(monkeypatch) -> None:
+    """Without httpx, requests go through the shared urllib opener with retries."""
+    calls: list[urllib.request.Request] = []
+    outcomes = [
+        urllib.error.HTTPError(
+            "https://example.test", 503, "busy", Message(), io.BytesIO(b"busy")
+        ),
+        io.BytesIO(b'{"choices": [{"message": {"content": "ok"}}]}'),
+    ]
+
+    class _Opener:
+        def open(self, request, timeout=None):
+            calls.append(request)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+    monkeypatch.setattr(langdock, "httpx", None)
+    monkeypatch.setattr(langdock, "_OPENER", _Opener())
+    monkeypatch.setattr(langdock.time, "sleep", lambda _delay: None)
+
+    result = langdock._post("/chat/completions", {"messages": []}, retries=1)
+
+    assert result["choices"][0]["message"]["content"] == "ok"
+    assert len(calls) == 2
+    assert calls[0].get_header("Authorization") == "Bearer test-key"
+
+
+def test_create_chat_completion_caches_deterministic_results(
+    langdock_transport,
+) -> None:
+    """Deterministic completions are served from the on-disk cache on repeat."""
+    requests, responses = langdock_transport
+    responses.extend([_completion("first"), _completion("second")])
+    kwargs = {
+        "model": "m",
+        "assistant_name": "test",
+        "assistant_instructions": "",
+        "use_cache": True,
+    }
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = langdock.create_chat_completion(messages, temperature=0, **kwargs)
+    cached = langdock.create_chat_completion(messages, temperature=0, **kwargs)
+    sampled = langdock.create_chat_completion(messages, temperature=0.7, **kwargs)
+
+    assert first == cached
+    assert cached["choices"][0]["message"]["content"] == "first"
+    assert sampled["choices"][0]["message"]["content"] == "second"
+    assert len(requests) == 2
+
+
+def test_default_temperature_completions_are_not_cached(langdock_transport) -> None:
+    """Provider-default sampling is not treated as deterministic by the cache."""
+    requests, responses = langdock_transport
+    responses.extend([_completion("first"), _completion("second")])
+    lm = langdock.LangdockLM(model="m", use_cache=True)
+
+    first = lm.forward(prompt="hi")
+    second = lm.forward(prompt="hi")
+
+    assert len(requests) == 2
+    assert first.choices[0].message.content == "first"
+    assert second.choices[0].message.content == "second"
+
+
+def test_executor_stability_loop_resamples_langdock_lm(
+    langdock_transport, mpp_bundle_minimal
+) -> None:
+    """Each executor iteration on an unchanged bundle issues a fresh request."""
+    dspy = pytest.importorskip("dspy")
+    from mpp_dspy.mpp_auto_adapter import MPPAutoAdapter
+
+    requests, responses = langdock_transport
+    responses.extend(
+        _completion(json.dumps({"decoded_bundle": {"final": value}}))
+        for value in (1, 2, 2)
+    )
+
+    class DummyArchitect(dspy.Module):
+        def forward(self, *, user_goal: str):  # noqa: ARG002
+            return mpp_bundle_minimal
+
+    class DummyQA(dspy.Module):
+        def forward(self, **_kwargs):
+            return {"verdict": "pass", "issues": [], "repair_examples": []}
+
+    program = MPPAutoAdapter(
+        architect=DummyArchitect(),
+        qa=DummyQA(),
+        executor_lm=langdock.LangdockLM(model="m"),
+        max_iters=1,
+        executor_max_iters=5,
+    )
+
+    result = program(user_goal="x", open_world=False)
+
+    assert len(requests) == 3
+    assert result.executor_stable is True
+    assert result.executor_refinements_total == 2
+
+
+def test_create_chat_completion_races_fallbacks(monkeypatch) -> None:
+    """Racing fallbacks skips forbidden models and returns the first success."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["assistant"]["model"]
+        if model == "primary":
+            return httpx.Response(403, text="denied")
+        return _completion(model)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_CLIENT", client)
+
+    result = langdock.create_chat_completion(
+        [{"role": "user", "content": "hi"}],
+        model="primary",
+        assistant_name="test",
+        assistant_instructions="",
+        fallback_models=["backup"],
+        race_fallbacks=True,
+    )
+
+    assert result["choices"][0]["message"]["content"] == "backup"
+    client.close()
+
+
+def test_create_chat_completion_async_races_fallbacks(monkeypatch) -> None:
+    """The async race raises the forbidden error only when every model is denied."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, text="denied")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_new_async_client", lambda: client)
+
+    async def run() -> dict:
+        try:
+            return await langdock.create_chat_completion_async(
+                [{"role": "user", "content": "hi"}],
+                model="primary",
+                assistant_name="test",
+                assistant_instructions="",
+                fallback_models=["backup"],
+                race_fallbacks=True,
+            )
+        finally:
+            await langdock.aclose_async_client()
+
+    with pytest.raises(langdock.LangdockForbiddenError):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    ("messages", "expected"),
+    [
+        ([{"role": "user", "content": "hi"}], False),
+        ([{"role": "system", "content": "rules"}], True),
+        ([{"role": "user", "content": [{"type": "text", "text": "hi"}]}], True),
+        ([{"role": "user", "content": "hi", "name": "x"}], True),
+    ],
+)
+def test_needs_normalization(messages, expected) -> None:
+    """Only already-clean user/assistant string messages skip normalization."""
+    assert langdock._needs_normalization(messages) is expected
+
+
+def test_langdock_lm_prewarms_only_on_opt_in_first_forward(monkeypatch) -> None:
+    """Construction never touches the network; opted-in LMs warm once on use."""
+    heads: list[httpx.Request] = []
+    done = langdock.threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            heads.append(request)
+            done.set()
+            return httpx.Response(200)
+        return _completion("ok")
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_CLIENT", client)
+    monkeypatch.setattr(langdock, "_WARMED", False)
+
+    langdock.LangdockLM(model="m")
+    lm = langdock.LangdockLM(model="m", prewarm=True)
+    assert not langdock._WARMED
+
+    lm.forward(prompt="hi")
+    lm.forward(prompt="hi")
+    done.wait(timeout=2.0)
+
+    assert len(heads) == 1
+    client.close()
+
+
+def test_rate_limiter_queues_requests_beyond_budget() -> None:
+    """Requests within the per-period budget pass; later ones wait for a token."""
+    limiter = langdock._RateLimiter(2, time_period=60.0)
+
+    delays = [limiter._reserve() for _ in range(3)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert 29.0 < delays[2] <= 30.0
+
+
+def test_sync_and_async_posts_share_the_rate_limit(
+    monkeypatch, langdock_transport
+) -> None:
+    """Both request paths draw from the same requests-per-minute bucket."""
+    requests, responses = langdock_transport
+    responses.append(_completion("sync"))
+    limiter = langdock._RateLimiter(1, time_period=60.0)
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return _completion("async")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(langdock, "_RATE_LIMITER", limiter)
+    monkeypatch.setattr(langdock, "_new_async_client", lambda: client)
+    monkeypatch.setattr(langdock.asyncio, "sleep", fake_sleep)
+
+    langdock._post("/chat/completions", {"messages": []})
+
+    async def run() -> dict:
+        try:
+            return await langdock._apost("/chat/completions", {"messages": []})
+        finally:
+            await langdock.aclose_async_client()
+
+    result = asyncio.run(run())
+
+    assert len(requests) == 1
+    assert result["choices"][0]["message"]["content"] == "async"
+    assert len(sleeps) == 1 and 59.0 < sleeps[0] <= 60.0
@@ -1,3 +1,9 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from mpp_dspy.mpp_auto_adapter import MPPAutoAdapterOptimizer
 from mpp_dspy.mpp_optimizer import (
     LongitudinalScore,
     LongitudinalTrace,
@@ -5,6 +11,19 @@ from mpp_dspy.mpp_optimizer import (
 )
 
 
+def _passing_prediction() -> SimpleNamespace:
+    return SimpleNamespace(
+        bundle_refinements_total=0,
+        executor_refinements_total=0,
+        bundle_steps=None,
+        executor_steps=None,
+        bundle_stable=True,
+        qa_passed=True,
+        qa_result=None,
+        executor_stable=True,
+    )
+
+
 def test_longitudinal_refiner_selects_best_template() -> None:
     template = "Start {{MPP_MUTABLE:block}}bad{{/MPP_MUTABLE}} end."
     dataset = ["example"]
@@ -49,3 +68,193 @@ def test_longitudinal_refiner_passes_traces_to_mutate_function() -> None:
     refiner.refine(template, dataset)
     assert seen["traces"]
     assert isinstance(seen["traces"][0], LongitudinalTrace)
+
+
+def test_adapter_optimizer_builds_only_the_program_variants_it_scores(
+    monkeypatch,
+) -> None:
+    built = []
+
+    def fake_build_program(self, blocks, *, use_cot, adapter_kwargs):
+        built.append(use_cot)
+        return lambda **kwargs: _passing_prediction()
+
+    monkeypatch.setattr(MPPAutoAdapterOptimizer, "_build_program", fake_build_program)
+    optimizer = MPPAutoAdapterOptimizer(
+        template="Start {{MPP_MUTABLE:block}}text{{/MPP_MUTABLE}} end.",
+        mutate_function=lambda blocks, _dataset: dict(blocks),
+        longitudinal_iters=2,
+    )
+
+    optimizer._optimize_template(
+        {"user_goal": "Add numbers.", "use_cot": False},
+        adapter_kwargs={},
+        architect_max_iters=None,
+        executor_max_iters=None,
+    )
+
+    assert built
+    assert not any(built)
+
+
+def test_adapter_optimizer_reuses_programs_when_primers_are_unchanged(
+    monkeypatch,
+) -> None:
+    built = []
+
+    def fake_build_program(self, blocks, *, use_cot, adapter_kwargs):
+        built.append(blocks.get("executor_primer"))
+        return lambda **kwargs: _passing_prediction()
+
+    def mutate(blocks, _dataset):
+        mutated = dict(blocks)
+        mutated["strategy_payload"] += "!"
+        return mutated
+
+    monkeypatch.setattr(MPPAutoAdapterOptimizer, "_build_program", fake_build_program)
+    optimizer = MPPAutoAdapterOptimizer(
+        template=(
+            "{{MPP_MUTABLE:strategy_payload}}Plan.{{/MPP_MUTABLE}} "
+            "{{MPP_MUTABLE:executor_primer}}Be exact.{{/MPP_MUTABLE}}"
+        ),
+        mutate_function=mutate,
+        longitudinal_iters=3,
+    )
+
+    optimizer._optimize_template(
+        {"user_goal": "Add numbers."},
+        adapter_kwargs={},
+        architect_max_iters=None,
+        executor_max_iters=None,
+    )
+
+    assert built == ["Be exact."]
+
+
+def test_adapter_optimizer_scores_cases_concurrently_in_order(monkeypatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    scored = []
+
+    def program(*, user_goal, **_kwargs):
+        barrier.wait()
+        if "boom" in user_goal:
+            raise RuntimeError("boom")
+        return _passing_prediction()
+
+    class RecordingMetric:
+        def score(self, traces):
+            scored.append(traces)
+            return 0.0
+
+    monkeypatch.setattr(
+        MPPAutoAdapterOptimizer,
+        "_build_program",
+        lambda self, blocks, *, use_cot, adapter_kwargs: program,
+    )
+    optimizer = MPPAutoAdapterOptimizer(
+        template="{{MPP_MUTABLE:block}}text{{/MPP_MUTABLE}}",
+        mutate_function=lambda blocks, _dataset: dict(blocks),
+        longitudinal_iters=1,
+        metric=RecordingMetric(),
+        max_workers=2,
+    )
+
+    optimizer._optimize_template(
+        [{"user_goal": "boom"}, {"user_goal": "fine"}],
+        adapter_kwargs={},
+        architect_max_iters=None,
+        executor_max_iters=None,
+    )
+
+    traces = scored[0]
+    assert [trace.case["user_goal"] for trace in traces] == ["boom", "fine"]
+    assert traces[0].errors == ["RuntimeError: boom"]
+    assert traces[1].qa_passed is True and not traces[1].errors
+
+
+def test_adapter_optimizer_rejects_malformed_cases_before_calling_programs(
+    monkeypatch,
+) -> None:
+    calls = []
+
+    def program(**kwargs):
+        calls.append(kwargs)
+        return _passing_prediction()
+
+    monkeypatch.setattr(
+        MPPAutoAdapterOptimizer,
+        "_build_program",
+        lambda self, blocks, *, use_cot, adapter_kwargs: program,
+    )
+    optimizer = MPPAutoAdapterOptimizer(
+        template="{{MPP_MUTABLE:block}}text{{/MPP_MUTABLE}}",
+        mutate_function=lambda blocks, _dataset: dict(blocks),
+        longitudinal_iters=1,
+    )
+
+    with pytest.raises(ValueError, match="user_goal"):
+        optimizer._optimize_template(
+            [{"user_goal": "fine"}, {"user_goal": None}],
+            adapter_kwargs={},
+            architect_max_iters=None,
+            executor_max_iters=None,
+        )
+
+    assert calls == []
+
+
+def test_goal_prefix_matches_applied_blocks() -> None:
+    blocks = {"entry_prompt": " Be exact. ", "strategy_payload": "Plan first."}
+
+    prefix = MPPAutoAdapterOptimizer._goal_prefix(blocks)
+
+    assert prefix == "Be exact.\n\nStrategy guidance:\nPlan first.\n\nUser goal:\n"
+    assert MPPAutoAdapterOptimizer._apply_blocks(blocks, "Add.") == prefix + "Add."
+    assert MPPAutoAdapterOptimizer._apply_blocks({}, "Add.") == "User goal:\nAdd."
+
+
+def test_goal_prefix_omits_headers_for_blank_blocks() -> None:
+    blocks = {"entry_prompt": "  ", "strategy_payload": "\n\t"}
+
+    assert MPPAutoAdapterOptimizer._goal_prefix(blocks) == "User goal:\n"
+    assert MPPAutoAdapterOptimizer._goal_prefix({"strategy_payload": " Plan. "}) == (
+        "Strategy guidance:\nPlan.\n\nUser goal:\n"
+    )
+
+
+def test_adapter_optimizer_traces_use_cumulative_refinements(monkeypatch) -> None:
+    scored = []
+    prediction = _passing_prediction()
+    prediction.bundle_refinements_total = 3
+    prediction.executor_refinements_total = 2
+    prediction.qa_passed = False
+    prediction.qa_result = {"issues": ["missing final"]}
+
+    class RecordingMetric:
+        def score(self, traces):
+            scored.append(traces)
+            return 0.0
+
+    monkeypatch.setattr(
+        MPPAutoAdapterOptimizer,
+        "_build_program",
+        lambda self, blocks, *, use_cot, adapter_kwargs: lambda **_: prediction,
+    )
+    optimizer = MPPAutoAdapterOptimizer(
+        template="{{MPP_MUTABLE:block}}text{{/MPP_MUTABLE}}",
+        mutate_function=lambda blocks, _dataset: dict(blocks),
+        longitudinal_iters=1,
+        metric=RecordingMetric(),
+    )
+
+    optimizer._optimize_template(
+        {"user_goal": "Add numbers."},
+        adapter_kwargs={},
+        architect_max_iters=None,
+        executor_max_iters=None,
+    )
+
+    (trace,) = scored[0]
+    assert (trace.bundle_refinements, trace.executor_refinements) == (3, 2)
+    assert trace.bundle_stable is True
+    assert trace.errors == ["missing final"]
@@ -48,3 +48,24 @@ def test_trace_cost_metric_weights_refinements() -> None:
         + (metric.executor_weight * 2)
     )
     assert metric.score([trace]) == pytest.approx(expected)
+
+
+def test_trace_cost_metric_averages_failed_cases_as_zero() -> None:
+    metric = TraceCostMetric(final_weight=4.0)
+    passed = LongitudinalTrace(
+        case="a",
+        bundle_stable=True,
+        executor_stable=True,
+        qa_passed=True,
+        bundle_refinements=2,
+    )
+    unstable = LongitudinalTrace(
+        case="b",
+        bundle_stable=True,
+        executor_stable=False,
+        qa_passed=True,
+    )
+    failed = LongitudinalTrace(case="c", qa_passed=None)
+    expected = (4.0 / (4.0 + metric.architect_weight * 2)) / 3
+    assert metric.score([passed, unstable, failed]) == pytest.approx(expected)
+    assert metric.score([]) == 0.0
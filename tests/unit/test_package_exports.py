@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import mpp_dspy
+
+
+def test_core_modules_import_without_loading_dspy() -> None:
+    code = (
+        "import sys, mpp_dspy.mpp_adapter, mpp_dspy.validations; "
+        "print('dspy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[2],
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_every_public_name_resolves_lazily() -> None:
+    for name in mpp_dspy.__all__:
+        assert getattr(mpp_dspy, name).__name__ == name
+    assert set(mpp_dspy.__all__) <= set(dir(mpp_dspy))